@@ -0,0 +1,153 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+    name: api_profile
+    author:
+      - GCore (@GCore)
+    type: aggregate
+    short_description: Summarize the GCore API cost of a play.
+    requirements:
+        - python >= 3.10
+        - enable in configuration
+    description:
+        - Aggregates the I(api_stats) returned by the GCore Cloud modules run with I(api_profile).
+        - At the end of the playbook, prints the tasks that spent the most time in the API, the hosts that
+          spent the most time polling and the endpoints with the most requests.
+        - Optionally writes the whole aggregate as a JSON report, to compare runs between releases.
+        - Once enabled, it sets C(CLOUD_API_PROFILE) in the environment of the controller, so that modules
+          run locally return I(api_stats). For other connections set I(api_profile) on the modules,
+          for example with C(module_defaults).
+    options:
+        top:
+            description: Number of tasks, hosts and endpoints listed in each ranking.
+            type: int
+            default: 10
+            env:
+                - name: GCORE_API_PROFILE_TOP
+            ini:
+                - section: gcore_api_profile
+                  key: top
+        report_path:
+            description: Path of the JSON report. No report is written if unset.
+            type: path
+            env:
+                - name: GCORE_API_PROFILE_REPORT
+            ini:
+                - section: gcore_api_profile
+                  key: report_path
+"""
+
+EXAMPLES = r"""
+# ansible.cfg
+# [defaults]
+# callbacks_enabled = gcore.cloud.api_profile
+#
+# [gcore_api_profile]
+# report_path = ./gcore_api_profile.json
+"""
+
+
+import json
+import os
+
+from ansible.plugins.callback import CallbackBase
+
+
+def merge_stats(total: dict, stats: dict) -> None:
+    for key in ("requests", "request_time", "bytes_sent", "bytes_received", "poll_time"):
+        total[key] = total.get(key, 0) + stats.get(key, 0)
+
+
+def rank(entries: dict, key: str, top: int) -> list:
+    ranked = sorted(entries.items(), key=lambda item: item[1].get(key, 0), reverse=True)
+    return [dict(stats, name=name) for name, stats in ranked[:top] if stats.get(key)]
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "gcore.cloud.api_profile"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tasks = {}
+        self.hosts = {}
+        self.endpoints = {}
+        self.totals = {}
+        os.environ.setdefault("CLOUD_API_PROFILE", "true")
+
+    def _record(self, result) -> None:
+        results = [result._result] + list(result._result.get("results") or [])
+        task_path = result._task.get_path()
+        task_name = f"{result._task.get_name()} ({task_path})" if task_path else result._task.get_name()
+        host_name = result._host.get_name()
+        for item in results:
+            stats = item.get("api_stats") if isinstance(item, dict) else None
+            if not stats:
+                continue
+            merge_stats(self.tasks.setdefault(task_name, {}), stats)
+            merge_stats(self.hosts.setdefault(host_name, {}), stats)
+            merge_stats(self.totals, stats)
+            for endpoint, endpoint_stats in (stats.get("endpoints") or {}).items():
+                merge_stats(self.endpoints.setdefault(endpoint, {}), endpoint_stats)
+
+    def v2_runner_on_ok(self, result):
+        self._record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result)
+
+    def get_report(self) -> dict:
+        top = self.get_option("top")
+        for stats in (self.totals, *self.tasks.values(), *self.hosts.values(), *self.endpoints.values()):
+            for key in ("request_time", "poll_time"):
+                if key in stats:
+                    stats[key] = round(stats[key], 3)
+        return {
+            "totals": self.totals,
+            "slowest_tasks": rank(
+                {
+                    name: dict(stats, api_time=stats["request_time"] + stats["poll_time"])
+                    for name, stats in self.tasks.items()
+                },
+                "api_time",
+                top,
+            ),
+            "polling_hosts": rank(self.hosts, "poll_time", top),
+            "busiest_endpoints": rank(self.endpoints, "requests", top),
+            "tasks": self.tasks,
+            "hosts": self.hosts,
+            "endpoints": self.endpoints,
+        }
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.totals:
+            return
+        report = self.get_report()
+        totals = report["totals"]
+        self._display.banner("GCORE API PROFILE")
+        self._display.display(
+            f"{totals['requests']} requests, {totals['request_time']:.2f}s in requests, "
+            f"{totals['poll_time']:.2f}s polling, {totals['bytes_sent']} bytes sent, "
+            f"{totals['bytes_received']} bytes received"
+        )
+        self._display.display("\nSlowest tasks (requests + polling):")
+        for task in report["slowest_tasks"]:
+            self._display.display(f"  {task['api_time']:9.2f}s  {task['requests']:6d} requests  {task['name']}")
+        self._display.display("\nHosts polling the longest:")
+        for host in report["polling_hosts"]:
+            self._display.display(f"  {host['poll_time']:9.2f}s  {host['name']}")
+        self._display.display("\nEndpoints with the most requests:")
+        for endpoint in report["busiest_endpoints"]:
+            self._display.display(
+                f"  {endpoint['requests']:6d} requests  {endpoint['request_time']:9.2f}s  "
+                f"{endpoint['bytes_received']:10d} bytes  {endpoint['name']}"
+            )
+
+        report_path = self.get_option("report_path")
+        if report_path:
+            with open(report_path, "w") as report_file:
+                json.dump(report, report_file, indent=2, sort_keys=True)
+            self._display.display(f"\nReport written to {report_path}")
@@ -41,8 +41,72 @@ options:
             - Required if I(region_id) is not passed
             - Can be passed as I(CLOUD_REGION_NAME) environment variable.
         type: str
+    api_profile:
+        description:
+            - Return I(api_stats), the number, duration and size of the API requests made by the module,
+              grouped by endpoint, and the time spent waiting between polls.
+            - The C(gcore.cloud.api_profile) callback aggregates them over a play.
+            - Can be passed as I(CLOUD_API_PROFILE) environment variable.
+        type: bool
+        default: false
 seealso:
 - name: Documentation for GCore Cloud API
   description: Complete public API documentation.
   link: https://api.gcore.com/docs/cloud
 """
+
+    BULK = r"""
+options:
+    items:
+        description:
+            - List of operations to run in a single module invocation.
+            - Each item is a dict of this module's options for one operation, except the API ones. Options
+              passed at module level are used as defaults for every item.
+            - Items are validated like the module options, with the same types and choices. Unknown options
+              are rejected and secrets, such as I(password), are masked in the output.
+            - An item may set its own I(command) (or I(state), where the module supports it).
+            - Items run concurrently through one API client, so their task waits overlap.
+            - Per-item results and errors are returned in I(results), in the order of I(items).
+        type: list
+        elements: dict
+    max_concurrency:
+        description:
+            - Maximum number of I(items) processed at the same time.
+        type: int
+        default: 10
+"""
+
+    WAIT = r"""
+options:
+    wait:
+        description:
+            - Wait for the cloud task started by the operation to finish.
+            - If C(false), the module returns right after the request is accepted and
+              I(data.tasks) holds the IDs of the started tasks. Use M(gcore.cloud.task_wait)
+              to wait for them later.
+            - Only affects operations that run as cloud tasks.
+        type: bool
+        default: true
+    resolve_resources:
+        description:
+            - Fetch the resource once its task has finished and return it in I(data).
+            - If C(false), I(data) only holds the resource ID, which saves a request per operation.
+            - With I(items), the resources of all items are fetched together through one list request.
+        type: bool
+        default: true
+    wait_for_status:
+        description:
+            - After the operation, wait until the resource reaches one of these statuses.
+            - For example C([ACTIVE]) after starting an instance, C([SHUTOFF]) after stopping it,
+              or C([ACTIVE]) for a loadbalancer to leave C(PENDING_UPDATE).
+            - Loadbalancers, listeners and pools are checked on their I(provisioning_status),
+              other resources on I(status).
+            - Polling is done by the module with a growing interval, without re-running the task.
+        type: list
+        elements: str
+    wait_timeout:
+        description:
+            - Maximum time in seconds to wait for I(wait_for_status).
+        type: int
+        default: 600
+"""
@@ -11,6 +11,10 @@ DOCUMENTATION = r"""
     description:
         - Reads inventories from the GCore public API.
         - Uses a YAML configuration file that ends with gcore.(yml|yaml).
+        - The instance fields listed in I(instance_fields) are available to the I(compose), I(groups) and
+          I(keyed_groups) expressions next to the host variables.
+        - Expressions that are a plain variable lookup, such as C(status) or C(metadata.os_type), are resolved
+          without templating.
     extends_documentation_fragment:
         - constructed
         - inventory_cache
@@ -71,6 +75,80 @@ DOCUMENTATION = r"""
                 - name
                 - uuid
             default: "uuid"
+        page_size:
+            description:
+                - Number of instances requested per page.
+                - Without caching, instances are turned into hosts page by page, so memory is bounded by the page
+                  size. With I(cache), every filtered instance is held in memory at once to be stored.
+            type: int
+            default: 1000
+        enrich:
+            description:
+                - Extra host variables to add, each one computed only when listed.
+                - C(volumes) sets C(gcore_volumes), the volumes attached to the instance.
+                - C(security_groups) sets C(gcore_security_groups), the securitygroups of the instance.
+                - C(lb_pools) sets C(gcore_lb_pools), the loadbalancer pools the instance is a member of.
+                  Members are matched on their I(instance_id), or on their address within their subnet.
+                - C(flavor) sets C(gcore_flavor), the details of the instance flavor.
+                - Every enrichment costs one bulk list request, joined to hosts in memory,
+                  whatever the number of hosts.
+            type: list
+            elements: str
+            choices: [volumes, security_groups, lb_pools, flavor]
+            default: []
+        prefetch:
+            description:
+                - Fetch the next page of instances in a background thread while the current one is being
+                  turned into hosts.
+            type: bool
+            default: false
+        instance_fields:
+            description:
+                - Instance fields kept for each host while the inventory is built, the rest of the instance is
+                  dropped as soon as its page is decoded.
+                - The fields the plugin needs itself, such as C(addresses) or the ones used by I(enrich),
+                  are always kept.
+                - An empty list keeps every field.
+            type: list
+            elements: str
+            default: [instance_id, instance_name, status, metadata, flavor]
+        address_preference:
+            description:
+                - Kinds of addresses tried in order to set C(ansible_host).
+                - C(floating) is a floating IP, C(public) a fixed IP on an external network and C(private)
+                  a fixed IP on any other network.
+                - The external networks are fetched with one bulk list request.
+                - Hosts without an address of a listed kind get no C(ansible_host).
+                - An empty list uses the first address of the instance.
+            type: list
+            elements: str
+            choices: [floating, public, private]
+            default: []
+        address_networks:
+            description:
+                - Names of the networks whose addresses are preferred, in order, among addresses of the same kind.
+            type: list
+            elements: str
+            default: []
+        address_ip_version:
+            description:
+                - IP version preferred among addresses of the same kind and network.
+                - Addresses of the other version are used only when there is no other choice.
+            type: int
+            choices: [4, 6]
+        cache_refresh_after:
+            description:
+                - Age in seconds after which a cached inventory is stale.
+                - A stale inventory is still served right away, while a detached process refreshes the cache
+                  for the next run. Only one process refreshes a given cache at a time.
+                - Like any cached run, the refresh holds every filtered instance in memory at once, see I(page_size).
+                - A failed refresh is recorded in C(~/.ansible/tmp/gcore_cloud) and reported as a warning by the
+                  following runs, until a refresh succeeds.
+                - The cache expires for good after I(cache_timeout), which should be larger.
+                - Needs a persistent I(cache_plugin), such as C(ansible.builtin.jsonfile).
+                - C(0) disables the background refresh.
+            type: int
+            default: 0
 """
 
 EXAMPLES = """
@@ -96,27 +174,89 @@ api_key: "{{ api_key }}"
 project_name: "{{ project_name }}"
 region_name: "{{ region_name }}"
 os_type: windows
+
+# Add volumes and loadbalancer pools to host variables, and group hosts by pool
+plugin: gcore.cloud.cloud
+api_key: "{{ api_key }}"
+project_name: "{{ project_name }}"
+region_name: "{{ region_name }}"
+enrich:
+    - volumes
+    - lb_pools
+groups:
+    backends: gcore_lb_pools | length > 0
 """
 
 
 import json
 import os
-
-from ansible.errors import AnsibleError, AnsibleParserError
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from urllib.parse import urlencode
+
+from ansible.errors import AnsibleError, AnsibleParserError, AnsibleUndefinedVariable
 from ansible.inventory.manager import InventoryData
+from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.urls import Request, open_url
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+    try_file_lock,
+    write_state,
+)
+
 inventory_hostname_map = {
     "uuid": "instance_id",
     "name": "instance_name",
 }
 
+LOOKUP_EXPRESSION = re.compile(r"\s*([A-Za-z_]\w*)((?:\.[A-Za-z_]\w*|\['[^']*'\]|\[\"[^\"]*\"\])*)\s*")
+LOOKUP_STEP = re.compile(r"\.([A-Za-z_]\w*)|\['([^']*)'\]|\[\"([^\"]*)\"\]")
+# Names Jinja resolves to something else than a variable or a dict key
+NOT_LOOKUP_NAMES = {"true", "false", "none", "True", "False", "None"}
+MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def compile_lookup(expression: str):
+    """Return the key path of an expression that is a plain variable lookup, or None if it needs templating"""
+    if not isinstance(expression, str):
+        return None
+    match = LOOKUP_EXPRESSION.fullmatch(expression)
+    if not match or match.group(1) in NOT_LOOKUP_NAMES:
+        return None
+    path = [match.group(1)]
+    for attribute, single_quoted, double_quoted in LOOKUP_STEP.findall(match.group(2)):
+        # Jinja gives precedence to the dict methods over the keys for attribute access
+        if attribute and hasattr(dict, attribute):
+            return None
+        path.append(attribute or single_quoted or double_quoted)
+    return tuple(path)
+
+
+def lookup(path: tuple, variables: dict):
+    """Resolve a key path, returning MISSING when it crosses a value that is not a dict"""
+    value = variables
+    for index, key in enumerate(path):
+        if not isinstance(value, dict):
+            return MISSING
+        if key not in value:
+            name = ".".join(path[: index + 1])
+            raise AnsibleUndefinedVariable(f"'{name}' is undefined")
+        value = value[key]
+    return value
+
 
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     NAME = "gcore.cloud.gcore"
 
     inventory: InventoryData
+    _scope = None
+    _use_extra_vars = False
 
     def verify_file(self, path):
         return super().verify_file(path) and path.endswith(("gcore.yaml", "gcore.yml"))
@@ -171,34 +311,350 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 return region["id"]
         raise AnsibleError(f"Cannot find region with name: {region_name}")
 
-    def _request(self, path: str):
-        project_id = self.project_id
-        region_id = self.region_id
+    def _get_scope(self) -> tuple:
+        # Project and region names are resolved once per parse, not once per request
+        if self._scope is None:
+            self._scope = (self.project_id, self.region_id)
+        return self._scope
+
+    def _request(self, path: str, query_params: dict = None) -> tuple:
+        """Return the results of a list request with the total C(count) the API reports, if any"""
+        project_id, region_id = self._get_scope()
         url = f"{self.api_host}/{path}/{project_id}/{region_id}"
+        if query_params:
+            url = f"{url}?{urlencode(query_params)}"
         try:
             self.display.vvv(f"Sending request to {url}")
             request = Request(headers=self.headers)
-            return json.load(request.get(url))["results"]
+            response = json.load(request.get(url))
         except ValueError as exc:
             raise AnsibleParserError("Cannot parse the JSON from response.") from exc
+        return response["results"], response.get("count")
+
+    def _request_pages(self, path: str, query_params: dict = None, record=None):
+        """Yield the pages of a list endpoint, fetching the next page ahead if I(prefetch) is enabled
+
+        Paging stops once the offset reaches the C(count) of the API or, without one, at an empty
+        page; a short page does not end the list, as the API may cap the page size below I(page_size).
+        If I(record) is passed, every item is replaced by C(record(item)) as soon as its page is decoded.
+        """
+        query_params = dict(query_params or {}, limit=self.get_option("page_size"))
+
+        def fetch(offset: int) -> tuple:
+            page, count = self._request(path, dict(query_params, offset=offset))
+            next_offset = offset + len(page)
+            done = not page or (count is not None and next_offset >= count)
+            return [record(item) for item in page] if record else page, next_offset, done
+
+        if not self.get_option("prefetch"):
+            offset, done = 0, False
+            while not done:
+                page, offset, done = fetch(offset)
+                if page:
+                    yield page
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, 0)
+            while future:
+                page, offset, done = future.result()
+                future = None if done else executor.submit(fetch, offset)
+                if page:
+                    yield page
+
+    def _list_all(self, path: str, query_params: dict = None) -> list:
+        return [item for page in self._request_pages(path, query_params) for item in page]
+
+    def _index_volumes(self) -> dict:
+        index = {}
+        for volume in self._list_all("v1/volumes"):
+            for attachment in volume.get("attachments") or []:
+                index.setdefault(attachment.get("server_id"), []).append(
+                    {
+                        "id": volume["id"],
+                        "name": volume.get("name"),
+                        "size": volume.get("size"),
+                        "volume_type": volume.get("volume_type"),
+                        "bootable": volume.get("bootable"),
+                        "device": attachment.get("device"),
+                    }
+                )
+        return index
+
+    def _index_security_groups(self) -> dict:
+        # Instances only reference their securitygroups by name
+        return {
+            group.get("name"): {"id": group["id"], "name": group.get("name"), "description": group.get("description")}
+            for group in self._list_all("v1/securitygroups")
+        }
+
+    def _index_lb_pools(self) -> dict:
+        index = {}
+        for pool in self._list_all("v1/lbpools", {"details": "true"}):
+            for member in pool.get("members") or []:
+                record = {
+                    "id": pool["id"],
+                    "name": pool.get("name"),
+                    "loadbalancers": [loadbalancer["id"] for loadbalancer in pool.get("loadbalancers") or []],
+                    "address": member.get("address"),
+                    "protocol_port": member.get("protocol_port"),
+                    "weight": member.get("weight"),
+                }
+                # The same private address can exist in several subnets, so it is only joined within its subnet
+                keys = [member.get("instance_id")]
+                if member.get("subnet_id") and member.get("address"):
+                    keys.append(f"{member['subnet_id']}/{member['address']}")
+                for key in keys:
+                    if key:
+                        index.setdefault(key, []).append(record)
+        return index
+
+    def _index_flavors(self) -> dict:
+        return {flavor["flavor_id"]: flavor for flavor in self._list_all("v1/flavors")}
+
+    def _index_networks(self) -> dict:
+        # Instance addresses are grouped by network name
+        return {network.get("name"): network.get("external", False) for network in self._list_all("v1/networks")}
+
+    def _get_enrichments(self) -> dict:
+        """Build the indexes of the enabled enrichments, fetching their lists in parallel"""
+        builders = {
+            "volumes": self._index_volumes,
+            "security_groups": self._index_security_groups,
+            "lb_pools": self._index_lb_pools,
+            "flavor": self._index_flavors,
+            "networks": self._index_networks,
+        }
+        enabled = list(dict.fromkeys(self.get_option("enrich") or []))
+        if {"public", "private"} & set(self.get_option("address_preference") or []):
+            enabled.append("networks")
+        if not enabled:
+            return {}
+        self._get_scope()
+        with ThreadPoolExecutor(max_workers=len(enabled)) as executor:
+            futures = {name: executor.submit(builders[name]) for name in enabled}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _get_enrichment_vars(self, server: dict, enrichments: dict) -> dict:
+        variables = {}
+        if "volumes" in enrichments:
+            variables["gcore_volumes"] = enrichments["volumes"].get(server["instance_id"], [])
+        if "security_groups" in enrichments:
+            index = enrichments["security_groups"]
+            variables["gcore_security_groups"] = [
+                index.get(group.get("name"), group) for group in server.get("security_groups") or []
+            ]
+        if "lb_pools" in enrichments:
+            index = enrichments["lb_pools"]
+            pools = {}
+            keys = [server["instance_id"]] + [
+                f"{address['subnet_id']}/{address['addr']}"
+                for addresses in (server.get("addresses") or {}).values()
+                for address in addresses
+                if address.get("subnet_id")
+            ]
+            for key in keys:
+                for pool in index.get(key, []):
+                    pools.setdefault((pool["id"], pool["protocol_port"]), pool)
+            variables["gcore_lb_pools"] = list(pools.values())
+        if "flavor" in enrichments:
+            flavor = server.get("flavor") or {}
+            variables["gcore_flavor"] = enrichments["flavor"].get(flavor.get("flavor_id"), flavor)
+        return variables
+
+    def _get_address_selector(self, external_networks: dict):
+        """Return a function giving the address to use as C(ansible_host) for an instance"""
+        preference = self.get_option("address_preference") or []
+        if not preference:
+            return lambda server: next(
+                (address["addr"] for addresses in server["addresses"].values() for address in addresses), None
+            )
+        kind_ranks = {kind: rank for rank, kind in enumerate(preference)}
+        network_ranks = {name: rank for rank, name in enumerate(self.get_option("address_networks") or [])}
+        ip_version = self.get_option("address_ip_version")
+
+        def select(server: dict):
+            best = None
+            for network, addresses in server["addresses"].items():
+                network_rank = network_ranks.get(network, len(network_ranks))
+                for address in addresses:
+                    if address.get("type") == "floating":
+                        kind = "floating"
+                    else:
+                        kind = "public" if external_networks.get(network) else "private"
+                    if kind not in kind_ranks:
+                        continue
+                    version = 6 if ":" in address["addr"] else 4
+                    rank = (kind_ranks[kind], network_rank, ip_version is not None and version != ip_version)
+                    if best is None or rank < best[0]:
+                        best = (rank, address["addr"])
+            return best and best[1]
+
+        return select
 
     def _filter_servers(self, servers):
         status = self.get_option("status")
-        if status:
-            servers = [server for server in servers if server["status"] in status]
-
         os_type = self.get_option("os_type")
-        if os_type:
-            servers = [server for server in servers if server["metadata"]["os_type"] == os_type]
-        return servers
+        for server in servers:
+            if status and server["status"] not in status:
+                continue
+            if os_type and server["metadata"]["os_type"] != os_type:
+                continue
+            yield server
+
+    def _get_instance_fields(self):
+        """Return the instance fields to keep for each host, or None to keep them all"""
+        fields = self.get_option("instance_fields")
+        if not fields:
+            return None
+        fields = set(fields) | {"instance_id", "instance_name", "status", "addresses"}
+        if self.get_option("os_type"):
+            fields.add("metadata")
+        enrich = self.get_option("enrich") or []
+        if "security_groups" in enrich:
+            fields.add("security_groups")
+        if "flavor" in enrich:
+            fields.add("flavor")
+        return fields
 
     def _get_servers_list(self):
-        return self._request("v1/instances")
+        fields = self._get_instance_fields()
+        record = None
+        if fields is not None:
+
+            def record(server: dict) -> dict:
+                return {field: server[field] for field in fields if field in server}
+
+        for page in self._request_pages("v1/instances", record=record):
+            yield from page
+
+    def _compose(self, template, variables, disable_lookups=...):
+        path = None if self._use_extra_vars else compile_lookup(template)
+        if path is not None:
+            value = lookup(path, variables)
+            if value is not MISSING:
+                return value
+        return super()._compose(template, variables)
+
+    def _add_host_to_composed_groups(self, groups, variables, host, strict=False, fetch_hostvars=True):
+        if fetch_hostvars:
+            variables = dict(variables, **self.inventory.get_host(host).get_vars())
+        templated = {}
+        for group_name, conditional in (groups or {}).items():
+            path = None if self._use_extra_vars else compile_lookup(conditional)
+            try:
+                result = MISSING if path is None else lookup(path, variables)
+            except AnsibleUndefinedVariable as exc:
+                if strict:
+                    raise AnsibleParserError(f"Could not add host {host} to group {group_name}: {exc}") from exc
+                continue
+            # Anything but a boolean goes through the templar, which decides how to treat it
+            if not isinstance(result, bool):
+                templated[group_name] = conditional
+            elif result:
+                self.inventory.add_child(self.inventory.add_group(self._sanitize_group_name(group_name)), host)
+        if templated:
+            super()._add_host_to_composed_groups(templated, variables, host, strict, fetch_hostvars=False)
+
+    def _fetch_snapshot(self) -> dict:
+        return {
+            "timestamp": time.time(),
+            "servers": list(self._filter_servers(self._get_servers_list())),
+            "enrichments": self._get_enrichments(),
+        }
+
+    def _get_snapshot(self, cache_key: str, read_cache: bool) -> dict:
+        """Return the cached snapshot if there is one, starting a background refresh once it is stale"""
+        if read_cache:
+            try:
+                snapshot = self._cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                refresh_after = self.get_option("cache_refresh_after")
+                if refresh_after:
+                    self._warn_refresh_error(cache_key)
+                    if time.time() - snapshot["timestamp"] > refresh_after:
+                        self._refresh_in_background(cache_key)
+                return snapshot
+        snapshot = self._fetch_snapshot()
+        self._cache[cache_key] = snapshot
+        return snapshot
+
+    def _refresh_in_background(self, cache_key: str) -> None:
+        """Refresh the cached snapshot in a detached process, unless another one is already refreshing it"""
+        pid = os.fork()
+        if pid:
+            os.waitpid(pid, 0)
+            return
+        try:
+            # Double fork, so the refresher is neither a child nor in the session of the inventory run
+            os.setsid()
+            if os.fork() == 0:
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+                with try_file_lock(get_state_path(f"inventory_{cache_key}")) as locked:
+                    if locked:
+                        self._refresh(cache_key)
+        finally:
+            os._exit(0)
+
+    def _refresh(self, cache_key: str) -> None:
+        # The refresher has no output, so a failure is recorded for the next runs to report
+        error_path = get_state_path(f"inventory_{cache_key}_refresh_error")
+        try:
+            self._cache[cache_key] = self._fetch_snapshot()
+            self.set_cache_plugin()
+        except Exception as exc:
+            write_state(error_path, {"timestamp": time.time(), "error": to_native(exc)})
+        else:
+            with suppress(FileNotFoundError):
+                os.remove(error_path)
+
+    def _warn_refresh_error(self, cache_key: str) -> None:
+        try:
+            with open(get_state_path(f"inventory_{cache_key}_refresh_error")) as error_file:
+                failure = json.load(error_file)
+        except (OSError, ValueError):
+            return
+        failed_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(failure["timestamp"]))
+        self.display.warning(f"The background refresh of the inventory cache failed at {failed_at}: {failure['error']}")
+
+    def _populate(self, servers, enrichments: dict):
+        inventory_key = inventory_hostname_map[self.get_option("inventory_hostname")]
+        group = self.get_option("group")
+        strict = self.get_option("strict")
+        compose = self.get_option("compose")
+        groups = self.get_option("groups")
+        keyed_groups = self.get_option("keyed_groups")
+        select_address = self._get_address_selector(enrichments.get("networks", {}))
+
+        self.inventory.add_group(group=group)
+        for server in servers:
+            host_name = server[inventory_key]
+            self.inventory.add_host(host_name, group=group)
+
+            address = select_address(server)
+            if address is not None:
+                self.inventory.set_variable(host_name, "ansible_host", address)
+            for name, value in self._get_enrichment_vars(server, enrichments).items():
+                self.inventory.set_variable(host_name, name, value)
+
+            # One flat dict per host, kept up to date instead of merging the host vars for every expression
+            variables = dict(server, **self.inventory.get_host(host_name).get_vars())
+            self._set_composite_vars(compose, variables, host_name, strict)
+            if compose:
+                variables.update(self.inventory.get_host(host_name).vars)
+            self._add_host_to_composed_groups(groups, variables, host_name, strict, fetch_hostvars=False)
+            self._add_host_to_keyed_groups(keyed_groups, variables, host_name, strict, fetch_hostvars=False)
 
     def parse(self, inventory, loader, path, cache=True):
         super().parse(inventory, loader, path)
 
         self._read_config_data(path)
+        self._scope = None
+        self._use_extra_vars = self.get_option("use_extra_vars")
 
         inventory_hostname = self.get_option("inventory_hostname")
         if inventory_hostname not in (
@@ -207,36 +663,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         ):
             raise AnsibleError(f"Invalid value for option inventory_hostname: {inventory_hostname}")
 
-        servers = self._get_servers_list()
-        filtered_servers = self._filter_servers(servers)
-        self.inventory.add_group(group=self.get_option("group"))
-        strict = self.get_option("strict")
-        inventory_key = inventory_hostname_map[inventory_hostname]
-
-        for server in filtered_servers:
-            host_name = server[inventory_key]
-            self.inventory.add_host(host_name, group=self.get_option("group"))
-
-            addresses = [addr["addr"] for addresses in server["addresses"].values() for addr in addresses]
-
-            variables = self.inventory.get_host(host_name).get_vars()
-
-            if len(addresses) > 0:
-                self.inventory.set_variable(
-                    host_name,
-                    "ansible_host",
-                    addresses[0],
-                )
-
-            self._set_composite_vars(
-                self.get_option("compose"),
-                variables,
-                host_name,
-                strict,
-            )
-            self._add_host_to_composed_groups(
-                self.get_option("groups"),
-                variables,
-                host_name,
-                strict,
-            )
+        if not self.get_option("cache"):
+            self._populate(self._filter_servers(self._get_servers_list()), self._get_enrichments())
+            return
+        snapshot = self._get_snapshot(self.get_cache_key(path), cache)
+        self._populate(snapshot["servers"], snapshot["enrichments"])
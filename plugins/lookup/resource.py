@@ -0,0 +1,283 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+    name: resource
+    author:
+      - GCore (@GCore)
+    short_description: Resolve GCore Cloud resource names to IDs or objects.
+    requirements:
+        - python >= 3.10
+    description:
+        - Returns the ID, or the whole object, of the resources of one type with the given names.
+        - Each type of resource is listed once, page by page, and indexed by name. The index is kept for the
+          rest of the process, so every later lookup of the same type is answered from memory.
+        - Lookups run in the forks of the play, so enable I(cache) to share one list request
+          between all hosts.
+    options:
+        _terms:
+            description: Names of the resources.
+            required: true
+            type: list
+            elements: str
+        resource:
+            description: Type of the resources.
+            required: true
+            type: str
+            choices: [network, subnet, image, flavor, keypair, securitygroup, volume, instance, router,
+                      servergroup, loadbalancer, secret]
+        details:
+            description: Return the whole resource objects instead of their IDs.
+            type: bool
+            default: false
+        errors:
+            description:
+                - What to do when no resource, or more than one, has a given name.
+                - With C(warn) or C(ignore), C(None) is returned for that name.
+            type: str
+            choices: [strict, warn, ignore]
+            default: strict
+        cache:
+            description:
+                - Also keep the indexes in a file on the controller, shared by all forks and runs.
+                - The first fork to need an index lists the resources while the others wait for it.
+                - The files are kept in C(~/.ansible/tmp/gcore_cloud), only readable by their owner, per API key,
+                  API host, project and region. They hold only the IDs and names of the resources, unless
+                  I(details) is set.
+            type: bool
+            default: false
+        cache_timeout:
+            description: Seconds after which a cached index is listed again.
+            type: int
+            default: 300
+        api_host:
+            description: GCore API base host
+            type: str
+            default: https://api.gcore.com/cloud
+            env:
+                - name: CLOUD_API_HOST
+        api_key:
+            description: GCore API auth key
+            type: str
+            env:
+                - name: CLOUD_API_KEY
+        api_timeout:
+            description: Timeout in seconds of the GCore API requests
+            type: int
+            default: 30
+            env:
+                - name: API_TIMEOUT
+        project_id:
+            description:
+                - GCore API project ID
+                - Required if I(project_name) is not passed
+            type: int
+            env:
+                - name: CLOUD_PROJECT_ID
+        project_name:
+            description:
+                - GCore API project name
+                - Required if I(project_id) is not passed
+            type: str
+            env:
+                - name: CLOUD_PROJECT_NAME
+        region_id:
+            description:
+                - GCore API region ID
+                - Required if I(region_name) is not passed
+            type: int
+            env:
+                - name: CLOUD_REGION_ID
+        region_name:
+            description:
+                - GCore API region name
+                - Required if I(region_id) is not passed
+            type: str
+            env:
+                - name: CLOUD_REGION_NAME
+"""
+
+EXAMPLES = r"""
+- name: Create instance from image and network names
+  gcore.cloud.instance:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    names: [Test]
+    flavor: g1-standard-1-2
+    volumes: [{
+        'source': 'image',
+        'image_id': "{{ lookup('gcore.cloud.resource', 'ubuntu-22.04', resource='image') }}",
+        'size': 20,
+        'boot_index': 0,
+    }]
+    interfaces: [{
+        'type': 'subnet',
+        'network_id': "{{ lookup('gcore.cloud.resource', 'prod-net', resource='network') }}",
+        'subnet_id': "{{ lookup('gcore.cloud.resource', 'prod-subnet', resource='subnet') }}",
+    }]
+
+- name: Share one list request of images between all hosts
+  ansible.builtin.debug:
+    msg: "{{ lookup('gcore.cloud.resource', 'ubuntu-22.04', resource='image', details=true, cache=true) }}"
+
+- name: Resolve several names at once
+  ansible.builtin.debug:
+    msg: "{{ query('gcore.cloud.resource', 'default', 'web', resource='securitygroup') }}"
+"""
+
+RETURN = r"""
+    _raw:
+        description: IDs, or objects if I(details) is set, of the resources in the order of the names.
+        type: list
+        elements: raw
+"""
+
+
+import hashlib
+import json
+import time
+from urllib.parse import urlencode, urljoin
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.urls import open_url
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+
+from ansible_collections.gcore.cloud.plugins.module_utils.api import (
+    LIST_PAGE_SIZE,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+    locked_state,
+)
+
+display = Display()
+
+# List endpoint, ID field and name field of every resource type
+RESOURCES = {
+    "network": ("v1/networks", "id", "name"),
+    "subnet": ("v1/subnets", "id", "name"),
+    "image": ("v1/images", "id", "name"),
+    "flavor": ("v1/flavors", "flavor_id", "flavor_name"),
+    "keypair": ("v1/keypairs", "sshkey_id", "sshkey_name"),
+    "securitygroup": ("v1/securitygroups", "id", "name"),
+    "volume": ("v1/volumes", "id", "name"),
+    "instance": ("v1/instances", "instance_id", "instance_name"),
+    "router": ("v1/routers", "id", "name"),
+    "servergroup": ("v1/servergroups", "servergroup_id", "name"),
+    "loadbalancer": ("v1/loadbalancers", "id", "name"),
+    "secret": ("v1/secrets", "id", "name"),
+}
+
+# Indexes built by this process, by (api_host, api key digest, project_id, region_id, resource, details)
+_INDEXES = {}
+# Project and region IDs resolved by this process, by (api_host, api_key_digest, kind, name)
+_SCOPES = {}
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        if not self.get_option("api_key"):
+            raise AnsibleLookupError("Please specify an api key, via the option api_key or CLOUD_API_KEY.")
+        index = self._get_index(self.get_option("resource"))
+        return [self._resolve(index, name) for name in terms]
+
+    def _resolve(self, index: dict, name: str):
+        matches = index.get(name, [])
+        if len(matches) == 1:
+            return matches[0] if self.get_option("details") else matches[0]["id"]
+        reason = "not found" if not matches else f"is ambiguous, {len(matches)} resources have this name"
+        msg = f"{self.get_option('resource').capitalize()} '{name}' {reason}"
+        errors = self.get_option("errors")
+        if errors == "strict":
+            raise AnsibleLookupError(msg)
+        if errors == "warn":
+            display.warning(msg)
+        return None
+
+    def _get_index(self, resource: str) -> dict:
+        project_id = self._get_scope_id("project", "name")
+        region_id = self._get_scope_id("region", "display_name")
+        key = (self._api_host, self._api_key_digest, project_id, region_id, resource, self.get_option("details"))
+        if key not in _INDEXES:
+            if self.get_option("cache"):
+                _INDEXES[key] = self._get_cached_index(key)
+            else:
+                _INDEXES[key] = self._build_index(key)
+        return _INDEXES[key]
+
+    def _get_cached_index(self, key: tuple) -> dict:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()[:16]
+        # The lock is held while listing, so the other forks wait and then read the result
+        with locked_state(get_state_path(f"resource_lookup_{digest}")) as state:
+            if time.time() - state.get("timestamp", 0) > self.get_option("cache_timeout"):
+                state["index"] = self._build_index(key)
+                state["timestamp"] = time.time()
+            return state["index"]
+
+    def _build_index(self, key: tuple) -> dict:
+        api_host, api_key_digest, project_id, region_id, resource, details = key
+        path, id_field, name_field = RESOURCES[resource]
+        index = {}
+        for item in self._list(f"{path}/{project_id}/{region_id}"):
+            entry = dict(item) if details else {name_field: item.get(name_field)}
+            index.setdefault(item.get(name_field), []).append(dict(entry, id=item.get(id_field)))
+        return index
+
+    def _get_scope_id(self, kind: str, name_field: str) -> int:
+        scope_id = self.get_option(f"{kind}_id")
+        if scope_id:
+            return scope_id
+        name = self.get_option(f"{kind}_name")
+        if not name:
+            raise AnsibleLookupError(f"Please specify a {kind}_id or {kind}_name.")
+        key = (self._api_host, self._api_key_digest, kind, name)
+        if key not in _SCOPES:
+            entity = next((item for item in self._list(f"v1/{kind}s") if item[name_field] == name), None)
+            if entity is None:
+                raise AnsibleLookupError(f"Cannot find {kind} with name: {name}")
+            _SCOPES[key] = entity["id"]
+        return _SCOPES[key]
+
+    @property
+    def _api_key_digest(self) -> str:
+        # What one API key can see must not be served to another one
+        return hashlib.sha256(self.get_option("api_key").encode()).hexdigest()
+
+    @property
+    def _api_host(self) -> str:
+        api_host = self.get_option("api_host")
+        return api_host if api_host.endswith("/") else api_host + "/"
+
+    def _list(self, path: str) -> list:
+        """Return every item of a list endpoint, paging until the offset reaches the count of the API.
+
+        Without a count, a short page is taken as the last one.
+        """
+        items = []
+        while True:
+            response = self._request(path, {"limit": LIST_PAGE_SIZE, "offset": len(items)})
+            page = response.get("results") or []
+            items.extend(page)
+            count = response.get("count")
+            if count is None:
+                done = len(page) < LIST_PAGE_SIZE
+            else:
+                done = not page or len(items) >= count
+            if done:
+                return items
+
+    def _request(self, path: str, query_params: dict) -> dict:
+        url = f"{urljoin(self._api_host, path)}?{urlencode(query_params)}"
+        display.vvv(f"Sending request to {url}")
+        headers = {"Content-Type": "application/json", "Authorization": f"APIKey {self.get_option('api_key')}"}
+        try:
+            response = open_url(url, headers=headers, timeout=self.get_option("api_timeout"))
+            return json.load(response)
+        except ValueError as exc:
+            raise AnsibleLookupError(f"Cannot parse the JSON from {url}") from exc
+        except Exception as exc:
+            raise AnsibleLookupError(f"Request to {url} failed: {exc}") from exc
@@ -1,10 +1,22 @@
 from http import HTTPStatus
-from typing import Any, Optional
+from time import monotonic
+from typing import Iterator, Optional, Tuple
 from urllib.parse import urlencode, urljoin
 
 from ansible.module_utils.basic import AnsibleModule, json
 from ansible.module_utils.urls import fetch_url, to_text
 
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.profiling import (
+    ApiStats,
+    get_endpoint,
+)
+
+# Items requested per page by get_pages
+LIST_PAGE_SIZE = 1000
+
 
 class CloudAPIClient:
     def __init__(self, module: AnsibleModule) -> None:
@@ -12,6 +24,9 @@ class CloudAPIClient:
         self.api_key = module.params["api_key"]
         self.api_timeout = module.params["api_timeout"]
         self.api_host = self._set_api_host()
+        self.stats = None
+        if module.params.get("api_profile"):
+            self._set_stats()
         self._set_project_and_region()
 
     def get(
@@ -24,6 +39,43 @@ class CloudAPIClient:
         kwargs.pop("data", None)
         return self._request(url=url, path_params=path_params, query_params=query_params, data=None, **kwargs)
 
+    def get_pages(
+        self,
+        url: str,
+        query_params: Optional[dict] = None,
+        page_size: int = LIST_PAGE_SIZE,
+        **kwargs,
+    ) -> Iterator[Tuple[list, Optional[int]]]:
+        """Yield the pages of a list endpoint with the total number of items, if the endpoint returns it.
+
+        Paging stops once the offset reaches that count, whatever the size of the pages the
+        API returned. Without a count, it stops at the first empty or repeated page.
+        """
+        offset = 0
+        previous = None
+        while True:
+            response = self.get(
+                url,
+                query_params={**(query_params or {}), "limit": page_size, "offset": offset},
+                envelope=True,
+                **kwargs,
+            )
+            if not isinstance(response, dict):
+                response = {"results": response or []}
+            items = response.get("results") or []
+            count = response.get("count")
+            if count is None and (not items or items == previous):
+                return
+            yield items, count
+            offset += len(items)
+            if not items or (count is not None and offset >= count):
+                return
+            previous = items
+
+    def get_all(self, url: str, query_params: Optional[dict] = None, **kwargs) -> list:
+        """Fetch every item of a list endpoint, page by page"""
+        return [item for items, _ in self.get_pages(url, query_params=query_params, **kwargs) for item in items]
+
     def post(self, url: str, **kwargs) -> Optional[str]:
         return self._request(method="POST", url=url, **kwargs)
 
@@ -46,13 +98,21 @@ class CloudAPIClient:
         data: Optional[dict] = None,
         **kwargs,
     ):
+        endpoint = get_endpoint(method, url, path_params)
         url = self._construct_url(
             url,
             path_params,
             query_params,
             include_project_region=kwargs.get("include_project_region", True),
         )
-        data = self._prepare_data(data)
+        response, info = self._send(endpoint, url, method, self._prepare_data(data))
+        if kwargs.get("allow_not_found") and info["status"] == HTTPStatus.NOT_FOUND:
+            return None
+        return self._parse_response(response, info, envelope=kwargs.get("envelope", False))
+
+    def _send(self, endpoint: str, url: str, method: str = "GET", data: Optional[str] = None) -> tuple:
+        """Send a request and read its body, counting both in the stats if they are enabled"""
+        started = monotonic()
         response, info = fetch_url(
             module=self.module,
             url=url,
@@ -61,7 +121,34 @@ class CloudAPIClient:
             headers=self._get_headers(),
             timeout=self.api_timeout,
         )
-        return self._parse_response(response, info)
+        body = response.read() if response else None
+        if self.stats is not None:
+            received = body if response else info.get("body")
+            self.stats.record_request(endpoint, monotonic() - started, len(data or ""), len(received or ""))
+        return body, info
+
+    def record_poll(self, seconds: float) -> None:
+        """Count time spent sleeping between two polls of a task or resource"""
+        if self.stats is not None:
+            self.stats.record_poll(seconds)
+
+    def _set_stats(self) -> None:
+        """Share one ApiStats between all the clients of the module, adding it to the result only once"""
+        stats = getattr(self.module, "_api_stats", None)
+        if isinstance(stats, ApiStats):
+            self.stats = stats
+            return
+        self.stats = self.module._api_stats = ApiStats()
+        self._return_stats()
+
+    def _return_stats(self) -> None:
+        """Add I(api_stats) to the result of the module, whether it exits or fails"""
+        for name in ("exit_json", "fail_json"):
+
+            def with_stats(*args, _method=getattr(self.module, name), **kwargs):
+                return _method(*args, api_stats=self.stats.to_dict(), **kwargs)
+
+            setattr(self.module, name, with_stats)
 
     def _construct_url(
         self,
@@ -94,9 +181,13 @@ class CloudAPIClient:
             setattr(self, entity_id, self.module.params[entity_id])
         else:
             name = self.module.params.get(f"{entity_type}_name")
-            url = f"{self.api_host}v1/{entity_type}s"
-            response, info = fetch_url(self.module, url=url, method="GET", headers=self._get_headers())
-            entity = next((item for item in self._parse_response(response, info) if item[name_key] == name), None)
+            path = f"v1/{entity_type}s"
+            try:
+                response, info = self._send(get_endpoint("GET", path), f"{self.api_host}{path}")
+                entities = self._parse_response(response, info)
+            except CloudAPIError as exc:
+                self.module.fail_json(msg=exc.message, **exc.details)
+            entity = next((item for item in entities if item[name_key] == name), None)
             if entity:
                 setattr(self, entity_id, entity["id"])
             else:
@@ -114,30 +205,34 @@ class CloudAPIClient:
             "Authorization": f"APIKey {self.api_key}",
         }
 
-    def _parse_response(self, response: Any, info: dict) -> Optional[str]:
-        """Parse the API response based on the HTTP status code"""
+    def _parse_response(self, response: Optional[bytes], info: dict, envelope: bool = False) -> Optional[str]:
+        """Parse the body of an API response based on the HTTP status code"""
         status_code = info["status"]
         if status_code == HTTPStatus.OK:
-            response = self._parse_successful_response(response)
+            response = self._parse_successful_response(response, envelope)
         elif status_code == HTTPStatus.NO_CONTENT:
             return None
         else:
             self._handle_failed_response(info)
         return self.module.from_json(to_text(response, errors="surrogate_or_strict"))
 
-    def _parse_successful_response(self, response: Any) -> Optional[str]:
-        response_text = response.read()
+    def _parse_successful_response(self, response_text: Optional[bytes], envelope: bool = False) -> Optional[str]:
         if response_text:
-            return json.dumps(self._get_response_json(response_text), ensure_ascii=False)
+            return json.dumps(self._get_response_json(response_text, envelope), ensure_ascii=False)
         return None
 
-    def _get_response_json(self, response_text: str) -> dict:
+    def _get_response_json(self, response_text: str, envelope: bool = False) -> dict:
         response = json.loads(to_text(response_text))
-        return response.get("results", response)
+        return response if envelope else response.get("results", response)
 
     def _handle_failed_response(self, info: dict) -> None:
-        """Handle a failed API request by reporting an error"""
+        """Handle a failed API request by raising an error"""
         url = info.get("url")
         body = json.loads(info.get("body", "{}"))
         message_error = body.get("message", "")
-        self.module.fail_json(msg="Failed to perfom operation", url=url, message_error=message_error)
+        raise CloudAPIError(
+            "Failed to perfom operation",
+            status=info["status"],
+            url=url,
+            message_error=message_error,
+        )
@@ -0,0 +1,194 @@
+import re
+from threading import Lock
+from typing import Any, Optional
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    DEFAULT_TASK_TIMEOUT,
+    get_error_result,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    DependencyFailed,
+    get_graph_order,
+    run_graph,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+
+# Resource clients of AnsibleCloudClient that operations can run on
+BATCH_RESOURCES = (
+    "networks",
+    "subnets",
+    "routers",
+    "reserved_fips",
+    "securitygroups",
+    "securitygroup_rules",
+    "keypairs",
+    "servergroups",
+    "images",
+    "volumes",
+    "snapshots",
+    "lifecycle_policy",
+    "instances",
+    "loadbalancers",
+    "loadbalancer_listeners",
+    "loadbalancer_pools",
+    "loadbalancer_members",
+    "secrets",
+)
+
+# Module options that operations cannot set: the command and state are set per operation, the
+# others coordinate concurrent module runs through local state files and are left to the modules
+UNSUPPORTED_PARAMS = ("command", "state", "cidr_allocate", "quota_admission")
+
+# A reference to the resource of another operation, e.g. "{{ ops.net1.id }}" or "{{ ops.lb.vip_port_id }}"
+REFERENCE = re.compile(r"\{\{\s*ops\.([A-Za-z_][\w-]*)((?:\.[\w-]+|\[\d+\])*)\s*\}\}")
+REFERENCE_STEP = re.compile(r"\.([\w-]+)|\[(\d+)\]")
+
+
+def find_references(value: Any) -> set:
+    """Names of the operations referenced anywhere in a value"""
+    if isinstance(value, str):
+        return {match.group(1) for match in REFERENCE.finditer(value)}
+    if isinstance(value, dict):
+        return set().union(*(find_references(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(find_references(item) for item in value))
+    return set()
+
+
+def resolve_reference(resources: dict, name: str, path: str) -> Any:
+    value = resources.get(name)
+    for key, index in REFERENCE_STEP.findall(path):
+        if index and isinstance(value, list) and int(index) < len(value):
+            value = value[int(index)]
+        elif key and isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            raise ValidationError(f"Cannot resolve ops.{name}{path}, the operation returned {value!r}")
+    return value
+
+
+def resolve_references(value: Any, resources: dict) -> Any:
+    """Replace references by the resources of the operations, keeping the type of whole-string references"""
+    if isinstance(value, str):
+        match = REFERENCE.fullmatch(value.strip())
+        if match:
+            return resolve_reference(resources, match.group(1), match.group(2))
+        return REFERENCE.sub(lambda match: str(resolve_reference(resources, match.group(1), match.group(2))), value)
+    if isinstance(value, dict):
+        return {key: resolve_references(item, resources) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, resources) for item in value]
+    return value
+
+
+def get_dependencies(operations: list) -> dict:
+    """Map every operation name to the names it depends on, explicitly or through references"""
+    dependencies = {}
+    for operation in operations:
+        name = operation["name"]
+        if name in dependencies:
+            raise ValidationError(f"Operation name {name} is used more than once")
+        if bool(operation.get("command")) == bool(operation.get("state")):
+            raise ValidationError(f"Operation {name} needs either a command or a state")
+        dependencies[name] = set(operation.get("depends_on") or []) | find_references(operation.get("params"))
+    try:
+        get_graph_order(dependencies)
+    except ValueError as exc:
+        raise ValidationError(str(exc)) from exc
+    return dependencies
+
+
+def get_graph_response(outcomes: dict) -> dict:
+    """Turn the (result, error) pairs of run_graph into a module response"""
+    results = {}
+    for name, (result, error) in outcomes.items():
+        if isinstance(error, DependencyFailed):
+            result = {"changed": False, "skipped": True, "msg": str(error)}
+        elif error:
+            result = get_error_result(error)
+        results[name] = result
+
+    response = {"changed": any(result["changed"] for result in results.values()), "results": results}
+    failed = [name for name, result in results.items() if result.get("failed")]
+    if failed:
+        response.update(failed=True, msg=f"{len(failed)} of {len(results)} operations failed: {', '.join(failed)}")
+    return response
+
+
+class BatchRunner:
+    """Run operations on the resource clients of one AnsibleCloudClient as a dependency graph.
+
+    Every operation is a dict with a unique I(name), the I(resource) client, a I(command) or
+    I(state), and the I(params) the matching module would take. An operation starts once
+    the operations it depends on succeeded; the others run concurrently, sharing the API
+    transport. Writes to the same loadbalancer, its listeners, pools and members are
+    serialized and wait for it to be ACTIVE, as it rejects changes while updating.
+    """
+
+    def __init__(self, api: AnsibleCloudClient, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self.resources = {}
+        self._locks = {}
+        self._locks_lock = Lock()
+
+    def run(self, operations: list) -> dict:
+        dependencies = get_dependencies(operations)
+        nodes = {
+            operation["name"]: (dependencies[operation["name"]], self._make_node(operation)) for operation in operations
+        }
+        outcomes = run_graph(nodes, self.max_concurrency)
+
+        return get_graph_response({operation["name"]: outcomes[operation["name"]] for operation in operations})
+
+    def _make_node(self, operation: dict):
+        def run() -> dict:
+            params = self.validate_params(
+                operation["resource"], resolve_references(operation.get("params") or {}, self.resources)
+            )
+            result = self.run_operation(operation["resource"], operation.get("state"), operation.get("command"), params)
+            self.resources[operation["name"]] = result.get("data")
+            return result
+
+        return run
+
+    def validate_params(self, resource: str, params: dict) -> dict:
+        """Check the params of an operation against the options of the module of its resource.
+
+        Params are coerced to the option types and checked against their choices like the
+        items of that module, unknown ones are rejected, and the values of I(no_log) options
+        are masked in the module output.
+        """
+        client = getattr(self.api, resource)
+        spec = dict(client.get_module_spec(), **self.api.get_wait_spec())
+        for name in UNSUPPORTED_PARAMS:
+            spec.pop(name, None)
+        result = ArgumentSpecValidator(self.api.get_item_spec(spec)).validate(params)
+        self.api.module.no_log_values.update(result._no_log_values)
+        if result.error_messages:
+            raise ValidationError(f"Invalid params for {resource}: {'; '.join(result.error_messages)}")
+        return {name: value for name, value in result.validated_parameters.items() if value is not None}
+
+    def run_operation(self, resource: str, state: Optional[str], command: Optional[str], params: dict) -> dict:
+        client = getattr(self.api, resource)
+        operation = (state, command, params)
+        get_loadbalancer_id = getattr(client, "_get_loadbalancer_id", None)
+        loadbalancer_id = get_loadbalancer_id(params) if get_loadbalancer_id else None
+        if not loadbalancer_id:
+            return client._run_operation(operation)
+        with self._get_lock(loadbalancer_id):
+            timeout = params.get("wait_timeout") or DEFAULT_TASK_TIMEOUT
+            self.api.loadbalancers._wait_for([loadbalancer_id], ["ACTIVE"], timeout=timeout)
+            return client._run_operation(operation)
+
+    def _get_lock(self, key: str) -> Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, Lock())
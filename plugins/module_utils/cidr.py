@@ -0,0 +1,50 @@
+from bisect import bisect_right, insort
+from ipaddress import ip_network
+from typing import Iterable, List
+
+
+class CidrIndex:
+    """Sorted index of the address ranges in use inside a supernet.
+
+    Ranges are merged into disjoint ``(first, last)`` integer intervals, so the interval
+    that may overlap a candidate block is found with one bisection.
+    """
+
+    def __init__(self, supernet: str, cidrs: Iterable[str] = ()) -> None:
+        self.supernet = ip_network(supernet, strict=True)
+        self.intervals: List[tuple] = []
+        for cidr in cidrs:
+            self.add(cidr)
+
+    def add(self, cidr: str) -> None:
+        network = ip_network(cidr, strict=False)
+        if network.version != self.supernet.version or not network.overlaps(self.supernet):
+            return
+        first, last = int(network.network_address), int(network.broadcast_address)
+        index = bisect_right(self.intervals, (first, last))
+        # Merge with the neighbours the new range touches
+        while index > 0 and self.intervals[index - 1][1] + 1 >= first:
+            index -= 1
+            first, last = min(first, self.intervals[index][0]), max(last, self.intervals[index][1])
+            del self.intervals[index]
+        while index < len(self.intervals) and self.intervals[index][0] <= last + 1:
+            last = max(last, self.intervals[index][1])
+            del self.intervals[index]
+        insort(self.intervals, (first, last))
+
+    def allocate(self, prefix_length: int) -> str:
+        """Reserve and return the first free block of I(prefix_length) inside the supernet"""
+        if prefix_length < self.supernet.prefixlen or prefix_length > self.supernet.max_prefixlen:
+            raise ValueError(f"Prefix length {prefix_length} does not fit in {self.supernet}")
+        size = 1 << (self.supernet.max_prefixlen - prefix_length)
+        candidate = int(self.supernet.network_address)
+        end = int(self.supernet.broadcast_address)
+        while candidate + size - 1 <= end:
+            index = bisect_right(self.intervals, (candidate + size - 1, end)) - 1
+            if index < 0 or self.intervals[index][1] < candidate:
+                block = ip_network((candidate, prefix_length))
+                self.add(str(block))
+                return str(block)
+            # Skip past the overlapping range, to the next aligned block
+            candidate = (self.intervals[index][1] // size + 1) * size
+        raise ValueError(f"No free /{prefix_length} block left in {self.supernet}")
@@ -1,12 +1,20 @@
 # pylint: disable=inconsistent-return-statements
+from enum import Enum
+from functools import wraps
+from math import ceil
 from string import Formatter
-from time import sleep
+from time import monotonic, sleep
 from typing import Optional
 
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.gcore.cloud.plugins.module_utils.api import CloudAPIClient
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
 from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
     ValidationError,
 )
 
@@ -20,45 +28,332 @@ GLOBAL_PARAMS = [
     "region_name",
 ]
 
+WRITE_METHODS = ("post", "put", "patch", "delete")
+
+# Task-based commands whose result is the resource fetched after the task has finished
+RESOLVED_COMMANDS = ("create", "download", "extend", "revert", "attach", "detach")
+
+DEFAULT_TASK_TIMEOUT = 180
+TASK_POLL_INTERVAL = 2
+
+# Resource state polling starts fast and backs off while resources are still converging
+STATUS_POLL_MIN_INTERVAL = 1
+STATUS_POLL_MAX_INTERVAL = 15
+STATUS_POLL_BACKOFF = 1.5
+# Pseudo-status reached once a resource can no longer be found
+DELETED_STATUS = "DELETED"
+
+
+class ResourceState(str, Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+
+
+def get_error_result(error: Exception) -> dict:
+    """Turn the error of one operation of a bulk run into its result"""
+    if isinstance(error, CloudAPIError):
+        return {"changed": False, "failed": True, "msg": error.message, **error.details}
+    if isinstance(error, ValidationError):
+        return {"changed": False, "failed": True, "msg": error.message}
+    return {"changed": False, "failed": True, "msg": str(error)}
+
+
+def fail_on_error(method):
+    """Report errors raised by a client method through the module, as a single operation should"""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except CloudAPIError as exc:
+            self.module.fail_json(msg=exc.message, **exc.details)
+        except ValidationError as exc:
+            self.module.fail_json(msg=exc.message)
+
+    return wrapper
+
 
 class BaseResourceClient:
     ACTION_CONFIG = {}
+    # Describes how to converge a resource for `reconcile`:
+    #   id_param/id_field     - module param and response field holding the resource ID
+    #   name_param/name_field - module param and response field used to look the resource up by name
+    #   list_filters          - query params of the list endpoint filled from module params
+    #   create/delete         - commands issued when the resource is missing/unwanted
+    #   update                - command -> {module param: response field} compared against the resource
+    STATE_CONFIG = {}
+    STATUS_FIELD = "status"
+    FAILED_STATUSES = ("ERROR",)
     RESOURCE: str
 
-    def __init__(self, module: AnsibleModule, url: str) -> None:
+    def __init__(self, module: AnsibleModule, url: str, api_client: Optional[CloudAPIClient] = None) -> None:
         self.module = module
         self.url = url
-        self.api_client = CloudAPIClient(module)
-        self.response = {"changed": False, "data": None}
+        self.api_client = api_client or CloudAPIClient(module)
 
     def get_by_id(self, resource_id: str, **kwargs):
         return self.api_client.get(self.url, path_params=resource_id, **kwargs)
 
-    def execute_command(self, command: str):
+    @fail_on_error
+    def execute_command(self, command: str, params: Optional[dict] = None):
+        return self._execute_command(command, params)
+
+    @fail_on_error
+    def reconcile(self, state: str, params: Optional[dict] = None) -> dict:
+        """Converge the resource to I(state), issuing only the writes that are needed"""
+        return self._reconcile(state, params)
+
+    @fail_on_error
+    def lookup(self, params: Optional[dict] = None) -> Optional[dict]:
+        """Find the current resource by ID or, failing that, by its unique name"""
+        return self._lookup(params)
+
+    def execute_many(
+        self,
+        items: list,
+        command: Optional[str] = None,
+        state: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict:
+        """Run one operation per item on a bounded thread pool.
+
+        Every item is a dict of module params layered over the module-level ones and may
+        set its own I(command) or I(state). All items share this client's API transport,
+        so their task waits overlap. A failed item is reported in its result and does not
+        stop the others. Resources produced by task-based commands are fetched together
+        once all items are done, instead of one request per item.
+        """
+        operations = []
+        for item in items:
+            params = self._get_item_params(item)
+            operations.append((params.pop("state", None) or state, params.pop("command", None) or command, params))
+
+        deferred = [
+            index
+            for index, (item_state, item_command, params) in enumerate(operations)
+            if not item_state and self._resolves_after_task(item_command, params)
+        ]
+        for index in deferred:
+            operations[index][2]["resolve_resources"] = False
+
+        results = [
+            get_error_result(error) if error else result
+            for result, error in self._run_operations(operations, max_concurrency)
+        ]
+
+        id_key = f"{self.RESOURCE}_id"
+        deferred = [index for index in deferred if (results[index].get("data") or {}).get(id_key)]
+        if deferred:
+            fetched = self._fetch_many([results[index]["data"][id_key] for index in deferred])
+            for index in deferred:
+                resource, error = fetched[results[index]["data"][id_key]]
+                if error:
+                    # The write went through, only fetching its resource failed
+                    results[index] = {**get_error_result(error), "changed": results[index]["changed"]}
+                else:
+                    results[index]["data"] = resource
+
+        response = {"changed": any(result["changed"] for result in results), "results": results}
+        failed = sum(1 for result in results if result.get("failed"))
+        if failed:
+            response.update(failed=True, msg=f"{failed} of {len(results)} items failed")
+        return response
+
+    def _get_item_params(self, item: dict) -> dict:
+        """Layer an item over the module params; options the item leaves unset are None and keep the module value"""
+        return {**self.module.params, **{key: value for key, value in item.items() if value is not None}}
+
+    def _run_operations(self, operations: list, max_concurrency: int) -> list:
+        """Run (state, command, params) operations, returning (result, error) pairs in order"""
+        return run_concurrently(self._run_operation, operations, max_concurrency)
+
+    def _run_operation(self, operation: tuple) -> dict:
+        item_state, item_command, params = operation
+        if item_state:
+            return self._reconcile(item_state, params)
+        if not item_command:
+            raise CloudAPIError("Either command or state is required for every item")
+        return self._execute_command(item_command, params)
+
+    def get_many(self, resource_ids: list) -> dict:
+        """Fetch resources by ID, keyed by ID"""
+        return self._get_many(resource_ids)
+
+    def _get_many(self, resource_ids: list, allow_not_found: bool = False) -> dict:
+        found = {}
+        for resource_id, (resource, error) in self._fetch_many(resource_ids, allow_not_found).items():
+            if error:
+                raise error
+            found[resource_id] = resource
+        return found
+
+    def _fetch_many(self, resource_ids: list, allow_not_found: bool = False) -> dict:
+        """Fetch resources by ID, returning a (resource, error) pair per ID.
+
+        The list endpoints cannot filter by a set of IDs, so the list is paged through and
+        filtered here, but only while that takes fewer requests than fetching the resources
+        still missing one by one; these are then fetched by ID.
+        """
+        wanted = set(resource_ids)
+        fetched = {}
+        if len(wanted) > 1:
+            try:
+                listed = 0
+                for resources, count in self.api_client.get_pages(self.url):
+                    listed += len(resources)
+                    fetched.update(
+                        (resource["id"], (resource, None)) for resource in resources if resource.get("id") in wanted
+                    )
+                    missing = len(wanted) - len(fetched)
+                    if not missing or not resources or count is None:
+                        break
+                    if ceil((count - listed) / len(resources)) >= missing:
+                        break
+            except CloudAPIError:
+                pass
+        missing = [resource_id for resource_id in wanted if resource_id not in fetched]
+
+        def get(resource_id: str):
+            return self.get_by_id(resource_id=resource_id, allow_not_found=allow_not_found)
+
+        fetched.update(zip(missing, run_concurrently(get, missing)))
+        return fetched
+
+    def _resolves_after_task(self, command: Optional[str], params: dict) -> bool:
+        config = self.ACTION_CONFIG.get(command) or {}
+        return bool(
+            config.get("as_task")
+            and command in RESOLVED_COMMANDS
+            and params.get("wait", True)
+            and params.get("resolve_resources", True)
+            and not params.get("wait_for_status")
+        )
+
+    def _execute_command(self, command: str, params: Optional[dict] = None):
         config = self.ACTION_CONFIG[command]
-        kwargs = self._prepare_command_kwargs(config)
+        params = self.module.params if params is None else params
+        kwargs = self._prepare_command_kwargs(config, params)
         http_method = getattr(self.api_client, config["method"])
         kwargs["url"] = self.ACTION_CONFIG[command].get("url") or self.url
+        if "include_project_region" in config:
+            kwargs["include_project_region"] = config["include_project_region"]
 
         response = http_method(**kwargs)
 
         if config.get("as_task"):
-            response = self._parse_response_as_task(response, command)
+            if not params.get("wait", True):
+                return {"changed": True, "data": {"tasks": self._get_task_ids_from_response(response)}}
+            response = self._parse_response_as_task(
+                response,
+                command,
+                timeout=config.get("timeout"),
+                resolve=params.get("resolve_resources", True),
+            )
 
-        if http_method in (
-            "post",
-            "put",
-            "patch",
-            "delete",
-        ):
-            self.response["changed"] = True
+        statuses = params.get("wait_for_status")
+        if statuses and params.get("wait", True) and command != "delete":
+            resource_id = self._get_resource_id(params, response)
+            response = self._wait_for(
+                [resource_id],
+                statuses,
+                timeout=params.get("wait_timeout") or DEFAULT_TASK_TIMEOUT,
+            )[0]
+
+        changed = config.get("changed", config["method"] in WRITE_METHODS)
+        return {"changed": changed, "data": response}
+
+    def _get_resource_id(self, params: dict, response) -> str:
+        if isinstance(response, dict) and response.get("id"):
+            return response["id"]
+        id_param = self.STATE_CONFIG.get("id_param", f"{self.RESOURCE}_id")
+        if not params.get(id_param):
+            raise CloudAPIError(f"Cannot wait for the {self.RESOURCE} status: {id_param} is unknown")
+        return params[id_param]
+
+    def _reconcile(self, state: str, params: Optional[dict] = None) -> dict:
+        params = dict(self.module.params if params is None else params)
+        resource = self._lookup(params)
+        result = {"changed": False, "data": resource}
+        for command, command_params in self._plan_changes(state, params, resource):
+            result = self._apply_change(command, command_params)
+        return result
+
+    def _plan_changes(self, state: str, params: dict, resource: Optional[dict]) -> list:
+        """Return the (command, params) pairs converging I(resource), the current one or None, to I(state)"""
+        config = self.STATE_CONFIG
+        if state == ResourceState.ABSENT:
+            if not resource:
+                return []
+            return [(config["delete"], {**params, config["id_param"]: resource[config.get("id_field", "id")]})]
+
+        if not resource:
+            return [(config["create"], params)]
+
+        params = {**params, config["id_param"]: resource[config.get("id_field", "id")]}
+        return [
+            (command, self._fill_required(command, params, resource))
+            for command, field_map in config.get("update", {}).items()
+            if self._diff_fields(params, resource, field_map)
+        ]
+
+    def _lookup(self, params: Optional[dict] = None) -> Optional[dict]:
+        params = self.module.params if params is None else params
+        config = self.STATE_CONFIG
+        resource_id = params.get(config["id_param"])
+        if resource_id:
+            return self.get_by_id(resource_id=resource_id, allow_not_found=True)
+
+        query_params = {
+            query_param: params[param]
+            for query_param, param in config.get("list_filters", {}).items()
+            if params.get(param) is not None
+        }
+        resources = self.api_client.get_all(self.url, query_params=query_params or None)
+        return self._find_by_name(resources, params)
+
+    def _find_by_name(self, resources: list, params: dict) -> Optional[dict]:
+        """Pick the resource named as in I(params) out of a list, failing if the name is ambiguous"""
+        config = self.STATE_CONFIG
+        name_param = config.get("name_param", "name")
+        name = params.get(name_param)
+        if not name:
+            raise CloudAPIError(f"One of {config['id_param']} or {name_param} is required to find the {self.RESOURCE}")
+        name_field = config.get("name_field", "name")
+        matches = [resource for resource in resources if resource.get(name_field) == name]
+        if len(matches) > 1:
+            raise CloudAPIError(
+                f"Found {len(matches)} {self.RESOURCE}s named '{name}', pass {config['id_param']} instead"
+            )
+        return matches[0] if matches else None
+
+    def _apply_change(self, command: str, params: dict) -> dict:
+        if self.module.check_mode:
+            return {"changed": True, "data": None}
+        return self._execute_command(command=command, params=params)
 
-        self.response["data"] = response
-        return self.response
+    def _diff_fields(self, params: dict, resource: dict, field_map: dict) -> dict:
+        return {
+            param: params[param]
+            for param, field in field_map.items()
+            if params.get(param) is not None and not self._matches(params[param], resource.get(field))
+        }
 
-    def _prepare_command_kwargs(self, config: dict):
+    def _matches(self, desired, actual) -> bool:
+        if isinstance(desired, dict) and isinstance(actual, dict):
+            return all(self._matches(value, actual.get(key)) for key, value in desired.items())
+        return desired == actual
+
+    def _fill_required(self, command: str, params: dict, resource: dict) -> dict:
+        """Take required fields of the update schema that were not passed from the current resource"""
+        schema = self.ACTION_CONFIG[command].get("schemas", {}).get("data")
+        if not schema:
+            return params
+        missing = {name: resource.get(name) for name in schema.get_required() if params.get(name) is None}
+        return {**params, **missing}
+
+    def _prepare_command_kwargs(self, config: dict, params: dict):
         kwargs = {}
-        params = self._clear_params(self.module.params)
+        params = self._clear_params(params)
 
         schemas = config.get("schemas")
         if schemas:
@@ -85,9 +380,15 @@ class BaseResourceClient:
 
         return kwargs
 
-    def _parse_response_as_task(self, response: dict, command: str):
+    def _parse_response_as_task(
+        self,
+        response: dict,
+        command: str,
+        timeout: Optional[int] = None,
+        resolve: bool = True,
+    ):
         tasks_id = self._get_task_id_from_response(response)
-        task_info = self._wait_from_task(tasks_id)
+        task_info = self._wait_from_task(tasks_id, timeout=timeout or DEFAULT_TASK_TIMEOUT)
         resource_id = None
         if command in ("delete",):
             if self.RESOURCE == "instance":
@@ -107,39 +408,133 @@ class BaseResourceClient:
                 resource_id = task_info["data"]["pool_id"]
         elif command in ("extend", "revert", "attach", "detach"):
             resource_id = task_info["data"][f"{self.RESOURCE}_id"]
+        if resource_id and not resolve:
+            return {f"{self.RESOURCE}_id": resource_id}
         if resource_id:
             return self.get_by_id(resource_id=resource_id)
 
     def _init_schema(self, schema, params, allow_none: Optional[list] = None):
-        self._check_requierd_params(required_params=schema.get_required())
-        try:
-            return schema.init_as_dict(**params, allow_none=allow_none)
-        except ValidationError as exc:
-            self.module.fail_json(msg=exc.message)
+        self._check_requierd_params(required_params=schema.get_required(), params=params)
+        return schema.init_as_dict(**params, allow_none=allow_none)
 
-    def _check_requierd_params(self, required_params):
-        missing = [param for param in required_params if self.module.params.get(param) is None]
+    def _check_requierd_params(self, required_params, params: dict):
+        missing = [param for param in required_params if params.get(param) is None]
         if missing:
-            self.module.fail_json(msg=f"missing required arguments: {', '.join(missing)}")
+            raise ValidationError(f"missing required arguments: {', '.join(missing)}")
 
     def _get_task_id_from_response(self, response: dict):
-        tasks = response.get("tasks")
+        return self._get_task_ids_from_response(response)[0]
+
+    def _get_task_ids_from_response(self, response: dict) -> list:
+        tasks = (response or {}).get("tasks")
         if not tasks:
-            self.module.fail_json(msg="Failed to get task from response operation.")
-        return tasks[0]
-
-    def _wait_from_task(self, task_id: str, expected_status: str = "FINISHED", timeout: int = 180):
-        for _ in range(0, timeout, 2):  # pylint: disable=C0104
-            response = self.api_client.get(url=f"v1/tasks/{task_id}", include_project_region=False)
-            if response["state"] in ("NEW", "RUNNING"):
-                sleep(2)
-                continue
-            if response["state"] != expected_status:
-                self.module.fail_json(
-                    msg=f"Task {response['task_type']} in state: {response['state']}. Reason={response['error']}"
+            raise CloudAPIError("Failed to get task from response operation.")
+        return tasks
+
+    def _wait_from_task(self, task_id: str, expected_status: str = "FINISHED", timeout: int = DEFAULT_TASK_TIMEOUT):
+        response = self.wait_for_tasks([task_id], timeout=timeout)[0]
+        if response["state"] != expected_status:
+            raise CloudAPIError(
+                f"Task {response['task_type']} in state: {response['state']}. Reason={response['error']}"
+            )
+        return response
+
+    def wait_for_tasks(
+        self,
+        task_ids: list,
+        timeout: int = DEFAULT_TASK_TIMEOUT,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list:
+        """Wait until every task has left the NEW/RUNNING states.
+
+        All pending tasks are polled in the same round, so waiting on many tasks costs
+        as long as the slowest one. Returns the final task dicts in the order of
+        I(task_ids), whatever state they ended in; only a timeout raises.
+        """
+        pending = list(dict.fromkeys(task_ids))
+        finished = {}
+        deadline = monotonic() + timeout
+        while pending:
+            polled = run_concurrently(self._get_task, pending, max_concurrency)
+            for task_id, (task, error) in zip(pending, polled):
+                if error:
+                    raise error
+                if task["state"] not in ("NEW", "RUNNING"):
+                    finished[task_id] = task
+            pending = [task_id for task_id in pending if task_id not in finished]
+            if not pending:
+                break
+            if monotonic() >= deadline:
+                raise CloudAPIError(
+                    "The operation could not be completed within the allotted time.",
+                    pending_tasks=pending,
                 )
-            return response
-        self.module.fail_json(msg="The operation could not be completed within the allotted time.")
+            self._sleep(TASK_POLL_INTERVAL)
+        return [finished[task_id] for task_id in task_ids]
+
+    @fail_on_error
+    def wait_for(
+        self,
+        resource_ids: list,
+        statuses: list,
+        timeout: int = DEFAULT_TASK_TIMEOUT,
+        failed_statuses: Optional[list] = None,
+        status_field: Optional[str] = None,
+    ) -> list:
+        """Wait until every resource reaches one of I(statuses)"""
+        return self._wait_for(resource_ids, statuses, timeout, failed_statuses, status_field)
+
+    def _wait_for(
+        self,
+        resource_ids: list,
+        statuses: list,
+        timeout: int = DEFAULT_TASK_TIMEOUT,
+        failed_statuses: Optional[list] = None,
+        status_field: Optional[str] = None,
+    ) -> list:
+        # All pending resources are read in one round (a single list request when there
+        # are several), and the poll interval backs off while they are converging.
+        # A resource that disappears reaches the DELETED pseudo-status.
+        status_field = status_field or self.STATUS_FIELD
+        failed_statuses = self.FAILED_STATUSES if failed_statuses is None else failed_statuses
+        # Some resources, such as volumes, report lowercase statuses
+        target_statuses = {str(status).upper() for status in statuses}
+        failed_statuses = {str(status).upper() for status in failed_statuses}
+        pending = list(dict.fromkeys(resource_ids))
+        reached = {}
+        deadline = monotonic() + timeout
+        interval = STATUS_POLL_MIN_INTERVAL
+        while pending:
+            resources = self._get_many(pending, allow_not_found=True)
+            for resource_id in pending:
+                resource = resources.get(resource_id)
+                status = resource.get(status_field) if resource else DELETED_STATUS
+                if str(status).upper() in target_statuses:
+                    reached[resource_id] = resource
+                elif str(status).upper() in failed_statuses or status == DELETED_STATUS:
+                    raise CloudAPIError(
+                        f"{self.RESOURCE.capitalize()} {resource_id} reached {status_field} {status} "
+                        f"while waiting for {', '.join(statuses)}"
+                    )
+            pending = [resource_id for resource_id in pending if resource_id not in reached]
+            if not pending:
+                break
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise CloudAPIError(
+                    "The operation could not be completed within the allotted time.",
+                    pending_resources=pending,
+                )
+            self._sleep(min(interval, remaining))
+            interval = min(interval * STATUS_POLL_BACKOFF, STATUS_POLL_MAX_INTERVAL)
+        return [reached[resource_id] for resource_id in resource_ids]
+
+    def _sleep(self, seconds: float) -> None:
+        sleep(seconds)
+        self.api_client.record_poll(seconds)
+
+    def _get_task(self, task_id: str) -> dict:
+        return self.api_client.get(url=f"v1/tasks/{task_id}", include_project_region=False)
 
     def _prepare_path(self, path: Optional[str] = None, data: Optional[dict] = None) -> str:
         path = path or ""
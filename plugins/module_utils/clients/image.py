@@ -7,7 +7,12 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.image
     CreateImageFromVolume,
     DownloadImage,
     GetImageList,
+    HwMachineType,
+    ImageArchitectureType,
+    ImageHwFirmwareType,
     ImageId,
+    ImageOsType,
+    SshKey,
     UpdateImage,
 )
 
@@ -84,3 +89,24 @@ class CloudImageClient(BaseResourceClient):
             },
         },
     }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the image module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(ImageManageAction), required=False),
+            image_id=dict(type="str", required=False),
+            volume_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            url=dict(type="str", required=False),
+            ssh_key=dict(type="str", choices=list(SshKey), required=False),
+            is_baremetal=dict(type="bool", required=False),
+            os_type=dict(type="str", choices=list(ImageOsType), required=False),
+            hw_firmware_type=dict(type="str", choices=list(ImageHwFirmwareType), required=False),
+            hw_machine_type=dict(type="str", choices=list(HwMachineType), required=False),
+            architecture=dict(type="str", choices=list(ImageArchitectureType), required=False),
+            cow_format=dict(type="bool", required=False),
+            os_distro=dict(type="str", required=False),
+            os_version=dict(type="str", required=False),
+            metadata=dict(type="dict", required=False),
+        )
@@ -1,7 +1,12 @@
+import json
 from enum import Enum
+from time import time
+from uuid import uuid4
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    TASK_POLL_INTERVAL,
     BaseResourceClient,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.instance import (
     AddToServergroup,
@@ -13,6 +18,12 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.instan
     StartInstance,
     UpdateInstance,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    locked_state,
+)
 
 
 class InstanceManageAction(str, Enum):
@@ -56,6 +67,7 @@ class CloudInstanceClient(BaseResourceClient):
             "method": "post",
             "url": "v2/instances/",
             "path": "check_limits",
+            "changed": False,
             "schemas": {
                 "data": GetInstanceQuota,
             },
@@ -146,3 +158,209 @@ class CloudInstanceClient(BaseResourceClient):
             },
         },
     }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the instance module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(InstanceManageAction),
+                required=False,
+            ),
+            flavor=dict(
+                type="str",
+                required=False,
+            ),
+            keypair_name=dict(
+                type="str",
+                required=False,
+            ),
+            user_data=dict(
+                type="str",
+                required=False,
+            ),
+            username=dict(
+                type="str",
+                required=False,
+            ),
+            password=dict(
+                type="str",
+                no_log=True,
+                required=False,
+            ),
+            instance_id=dict(
+                type="str",
+                required=False,
+            ),
+            names=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            name_templates=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            interfaces=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            metadata=dict(
+                type="dict",
+                required=False,
+            ),
+            volumes=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            security_groups=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            configuration=dict(
+                type="dict",
+                required=False,
+            ),
+            allow_app_ports=dict(
+                type="bool",
+                required=False,
+            ),
+            servergroup_id=dict(
+                type="str",
+                required=False,
+            ),
+            floatings=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            reserved_fixed_ips=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            quota_admission=dict(
+                type="bool",
+                default=False,
+                required=False,
+            ),
+            activate_profile=dict(
+                type="bool",
+                required=False,
+            ),
+            name=dict(
+                type="str",
+                required=False,
+            ),
+            volumes_to_delete=dict(
+                type="str",
+                required=False,
+            ),
+        )
+
+    @fail_on_error
+    def create_in_waves(
+        self,
+        items: list,
+        ledger_path: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict:
+        """Create the instances of I(items) that fit the remaining quota.
+
+        Items are grouped by request shape (flavor, volumes, interfaces), since check_limits
+        takes a single shape. The largest prefix of the remaining items that passes
+        check_limits, together with the creates of other forks recorded in the ledger, is
+        started; a whole batch that fits costs a single check. The rest is checked again
+        once that wave is accepted and only goes on if quota was released meanwhile. A
+        shape is admitted only while no creates of another shape are in flight, so that its
+        check covers all of them. Items that never fit are reported as failed without being
+        started.
+        """
+        return self._create_in_waves(items, ledger_path, max_concurrency)
+
+    def _create_in_waves(self, items: list, ledger_path: str, max_concurrency: int) -> dict:
+        results = [None] * len(items)
+        shapes = {}
+        for index, item in enumerate(items):
+            params = self._get_item_params(item)
+            shape = json.dumps([params.get(key) for key in ("flavor", "volumes", "interfaces")], sort_keys=True)
+            shapes.setdefault(shape, []).append(index)
+
+        for shape, indexes in shapes.items():
+            while indexes:
+                wave, entry_id, quota = self._admit(shape, [items[index] for index in indexes], ledger_path)
+                if not wave:
+                    for index in indexes:
+                        results[index] = {"changed": False, "failed": True, "msg": "Quota exceeded", "quota": quota}
+                    break
+                response = self.execute_many(
+                    [items[index] for index in indexes[:wave]],
+                    command=InstanceManageAction.CREATE,
+                    max_concurrency=max_concurrency,
+                )
+                for index, result in zip(indexes, response["results"]):
+                    results[index] = result
+                indexes = indexes[wave:]
+                # Accepted creates are counted by check_limits itself from now on
+                with locked_state(ledger_path) as ledger:
+                    ledger.pop(entry_id, None)
+
+        response = {"changed": any(result["changed"] for result in results), "results": results}
+        failed = sum(1 for result in results if result.get("failed"))
+        if failed:
+            response.update(failed=True, msg=f"{failed} of {len(results)} items failed")
+        return response
+
+    def _admit(self, shape: str, items: list, ledger_path: str) -> tuple:
+        """Record and return the size of the largest prefix of I(items) that fits the quota"""
+        counts = [len(item.get("names") or self.module.params.get("names") or [None]) for item in items]
+        while True:
+            with locked_state(ledger_path) as ledger:
+                now = time()
+                for entry_id in [entry_id for entry_id, entry in ledger.items() if entry["expires"] < now]:
+                    del ledger[entry_id]
+                if all(entry["shape"] == shape for entry in ledger.values()):
+                    return self._admit_locked(ledger, shape, counts)
+            # Creates of another shape cannot be added to this check, wait for them to be accepted
+            self._sleep(TASK_POLL_INTERVAL)
+
+    def _admit_locked(self, ledger: dict, shape: str, counts: list) -> tuple:
+        """Admit the largest prefix of the item I(counts) of a shape, under the ledger lock"""
+        flavor, volumes, interfaces = json.loads(shape)
+        now = time()
+        in_flight = sum(entry["count"] for entry in ledger.values())
+
+        def check(size: int) -> dict:
+            count = in_flight + sum(counts[:size])
+            params = {
+                "flavor": flavor,
+                "volumes": volumes,
+                "interfaces": interfaces,
+                "names": [f"quota-check-{number}" for number in range(count)],
+            }
+            return self._execute_command(InstanceGetAction.GET_QUOTA, params)["data"] or {}
+
+        quota = check(len(counts))
+        low, high = 0, len(counts)
+        if quota:
+            high -= 1
+            # Binary search for the largest prefix that passes check_limits
+            while low < high:
+                middle = (low + high + 1) // 2
+                if check(middle):
+                    high = middle - 1
+                else:
+                    low = middle
+        else:
+            low = len(counts)
+
+        entry_id = str(uuid4())
+        if low:
+            timeout = self.ACTION_CONFIG[InstanceManageAction.CREATE]["timeout"]
+            ledger[entry_id] = {"shape": shape, "count": sum(counts[:low]), "expires": now + timeout}
+        return low, entry_id, quota
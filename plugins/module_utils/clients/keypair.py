@@ -2,6 +2,7 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.keypair import (
     CreateKeypair,
@@ -57,3 +58,27 @@ class CloudKeypairClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "keypair_id",
+        "id_field": "sshkey_id",
+        "name_param": "sshkey_name",
+        "name_field": "sshkey_name",
+        "create": KeypairManageAction.CREATE,
+        "delete": KeypairManageAction.DELETE,
+        "update": {
+            KeypairManageAction.SHARE: {"shared_in_project": "shared_in_project"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the keypair module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(KeypairManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            keypair_id=dict(type="str", required=False),
+            shared_in_project=dict(type="bool", required=False),
+            sshkey_name=dict(type="str", required=False),
+            public_key=dict(type="str", required=False),
+        )
@@ -1,18 +1,33 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.lifecycle_policy import (
     AddSchedules,
     AddVolumes,
     CreateLifecyclePolicy,
     GetLifecyclePolicyList,
+    LifecyclePolicyAction,
     LifecyclePolicyId,
+    LifecyclePolicyStatus,
     RemoveSchedule,
     RemoveVolumes,
     UpdateLifecyclePolicy,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
+    get_volume_filters,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+
+VOLUME_URL = "v1/volumes/"
+# Number of volume IDs sent per add/remove request, to stay well under the API payload limits
+DEFAULT_VOLUMES_CHUNK_SIZE = 100
 
 
 class LifecyclePolicyManageAction(str, Enum):
@@ -102,3 +117,99 @@ class CloudLifecyclePolicyClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "lifecycle_policy_id",
+        "create": LifecyclePolicyManageAction.CREATE,
+        "delete": LifecyclePolicyManageAction.DELETE,
+        "update": {
+            LifecyclePolicyManageAction.UPDATE: {"name": "name", "status": "status"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the lifecycle_policy module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(LifecyclePolicyManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            lifecycle_policy_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            volume_ids=dict(type="list", elements="str", required=False),
+            volume_selector=dict(type="dict", required=False),
+            volumes_chunk_size=dict(type="int", default=100),
+            schedules=dict(type="list", elements="dict", required=False),
+            schedule_ids=dict(type="list", elements="str", required=False),
+            action=dict(type="str", choices=list(LifecyclePolicyAction), required=False),
+            status=dict(type="str", choices=list(LifecyclePolicyStatus), required=False),
+        )
+
+    @fail_on_error
+    def reconcile_volumes(self, state: str, params: Optional[dict] = None) -> dict:
+        """Reconcile the policy, making its volumes exactly I(volume_ids) or the ones I(volume_selector) matches"""
+        return self._reconcile_volumes(state, params)
+
+    def _reconcile_volumes(self, state: str, params: Optional[dict] = None) -> dict:
+        params = dict(self.module.params if params is None else params)
+        volume_selector = params.pop("volume_selector", None)
+        if volume_selector is not None:
+            params["volume_ids"] = self._select_volumes(volume_selector)
+        volume_ids = params.get("volume_ids")
+        if volume_ids is None:
+            return self._reconcile(state, params)
+
+        # A new policy gets the first chunk of volumes, the rest are added in chunks by _sync_volumes
+        chunk_size = params.get("volumes_chunk_size") or DEFAULT_VOLUMES_CHUNK_SIZE
+        result = self._reconcile(state, dict(params, volume_ids=list(dict.fromkeys(volume_ids))[:chunk_size]))
+        if state == ResourceState.PRESENT and result["data"]:
+            synced = self._sync_volumes(result["data"]["id"], volume_ids, chunk_size)
+            result = dict(changed=result["changed"] or synced["changed"], data=synced["data"])
+        return result
+
+    @fail_on_error
+    def select_volumes(self, volume_filters: dict) -> list:
+        """Return the IDs of the volumes matching the volume list filters, paging through the list"""
+        return self._select_volumes(volume_filters)
+
+    def _select_volumes(self, volume_filters: dict) -> list:
+        query_params = get_volume_filters(volume_filters)
+        return [volume["id"] for volume in self.api_client.get_all(VOLUME_URL, query_params=query_params)]
+
+    @fail_on_error
+    def sync_volumes(
+        self,
+        lifecycle_policy_id: str,
+        volume_ids: list,
+        chunk_size: int = DEFAULT_VOLUMES_CHUNK_SIZE,
+    ) -> dict:
+        """Make the volumes of a policy exactly I(volume_ids), sending only the difference"""
+        return self._sync_volumes(lifecycle_policy_id, volume_ids, chunk_size)
+
+    def _sync_volumes(self, lifecycle_policy_id: str, volume_ids: list, chunk_size: int) -> dict:
+        policy = self.api_client.get(self.url, path_params=lifecycle_policy_id, query_params={"need_volumes": True})
+        current = {volume.get("volume_id") or volume.get("id") for volume in policy.get("volumes") or []}
+        wanted = set(volume_ids)
+        changes = {
+            LifecyclePolicyManageAction.ADD_VOLUMES: sorted(wanted - current),
+            LifecyclePolicyManageAction.REMOVE_VOLUMES: sorted(current - wanted),
+        }
+        changed = any(changes.values())
+        if self.module.check_mode or not changed:
+            return {"changed": changed, "data": policy}
+
+        for command, changed_ids in changes.items():
+            for start in range(0, len(changed_ids), chunk_size):
+                params = {
+                    "lifecycle_policy_id": lifecycle_policy_id,
+                    "volume_ids": changed_ids[start : start + chunk_size],
+                }
+                policy = self._execute_command(command, params)["data"]
+        return {"changed": True, "data": policy}
+
+    def _run_operation(self, operation: tuple) -> dict:
+        item_state, _, params = operation
+        if params.get("volume_selector") is not None and item_state != ResourceState.PRESENT:
+            raise ValidationError("volume_selector can only be used with state=present")
+        if item_state:
+            return self._reconcile_volumes(item_state, params)
+        return super()._run_operation(operation)
@@ -1,7 +1,10 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    DEFAULT_TASK_TIMEOUT,
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer import (
     CreateLoadbalancer,
@@ -10,6 +13,13 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadba
     LoadbalancerId,
     UpdateLoadbalancer,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    run_concurrently,
+)
+
+LOADBALANCER_URL = "v1/loadbalancers/"
+# Params the loadbalancer of an operation is resolved from, by the clients of the loadbalancer and its children
+LOADBALANCER_ID_PARAMS = ("loadbalancer_id", "listener_id", "loadbalancer_listener_id", "loadbalancer_pool_id")
 
 
 class LoadbalancerManageAction(str, Enum):
@@ -23,8 +33,57 @@ class LoadbalancerGetAction(str, Enum):
     GET_BY_ID = "get_by_id"
 
 
-class CloudLoadbalancerClient(BaseResourceClient):
+class LoadbalancerQueueMixin:
+    """Serialize bulk writes per loadbalancer and run different loadbalancers in parallel.
+
+    A loadbalancer rejects changes to itself, its listeners, pools and members while it
+    is PENDING_UPDATE. Operations of `execute_many` are therefore grouped by the ID of the
+    loadbalancer they change; the groups run concurrently, and within a group every write
+    waits for the loadbalancer to be ACTIVE before it starts.
+    """
+
+    def _get_loadbalancer_id(self, params: dict) -> Optional[str]:
+        return params.get("loadbalancer_id")
+
+    def _run_operations(self, operations: list, max_concurrency: int) -> list:
+        # Operations on the same listener or pool resolve its loadbalancer once
+        keys = [tuple(operation[2].get(param) for param in LOADBALANCER_ID_PARAMS) for operation in operations]
+        lookups = {}
+        for key, operation in zip(keys, operations):
+            lookups.setdefault(key, operation[2])
+        resolved = {
+            key: loadbalancer_id if error is None else None
+            for key, (loadbalancer_id, error) in zip(
+                lookups, run_concurrently(self._get_loadbalancer_id, list(lookups.values()), max_concurrency)
+            )
+        }
+        loadbalancer_ids = [resolved[key] for key in keys]
+        queues = {}
+        for index, loadbalancer_id in enumerate(loadbalancer_ids):
+            queues.setdefault(loadbalancer_id or index, []).append(index)
+
+        results = [None] * len(operations)
+        loadbalancers = CloudLoadbalancerClient(self.module, LOADBALANCER_URL, self.api_client)
+
+        def run_queue(queue: tuple) -> None:
+            loadbalancer_id, indexes = queue
+            for index in indexes:
+                params = operations[index][2]
+                try:
+                    if isinstance(loadbalancer_id, str):
+                        timeout = params.get("wait_timeout") or DEFAULT_TASK_TIMEOUT
+                        loadbalancers._wait_for([loadbalancer_id], ["ACTIVE"], timeout=timeout)
+                    results[index] = (self._run_operation(operations[index]), None)
+                except Exception as exc:
+                    results[index] = (None, exc)
+
+        run_concurrently(run_queue, list(queues.items()), max_concurrency)
+        return results
+
+
+class CloudLoadbalancerClient(LoadbalancerQueueMixin, BaseResourceClient):
     RESOURCE = "loadbalancer"
+    STATUS_FIELD = "provisioning_status"
 
     ACTION_CONFIG = {
         LoadbalancerGetAction.GET_LIST: {
@@ -67,3 +126,31 @@ class CloudLoadbalancerClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "loadbalancer_id",
+        "create": LoadbalancerManageAction.CREATE,
+        "delete": LoadbalancerManageAction.DELETE,
+        "update": {
+            LoadbalancerManageAction.UPDATE: {"name": "name", "logging": "logging"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the loadbalancer module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(LoadbalancerManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            loadbalancer_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            name_template=dict(type="str", required=False),
+            flavor=dict(type="str", required=False),
+            listeners=dict(type="list", elements="dict", required=False),
+            vip_network_id=dict(type="str", required=False),
+            vip_subnet_id=dict(type="str", required=False),
+            vip_port_id=dict(type="str", required=False),
+            floating_ip=dict(type="dict", required=False),
+            metadata=dict(type="dict", required=False),
+            logging=dict(type="dict", required=False),
+        )
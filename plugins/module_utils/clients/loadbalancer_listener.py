@@ -1,13 +1,19 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer import (
+    LoadbalancerQueueMixin,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer_listener import (
     CreateLbListener,
     GetLbListener,
     GetLbListenerList,
     LbListenerId,
+    LbListenerProtocol,
     UpdateLbListener,
 )
 
@@ -23,8 +29,9 @@ class LbListenerGetAction(str, Enum):
     GET_BY_ID = "get_by_id"
 
 
-class CloudLbListenerClient(BaseResourceClient):
+class CloudLbListenerClient(LoadbalancerQueueMixin, BaseResourceClient):
     RESOURCE = "listener"
+    STATUS_FIELD = "provisioning_status"
 
     ACTION_CONFIG = {
         LbListenerGetAction.GET_LIST: {
@@ -67,3 +74,41 @@ class CloudLbListenerClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "loadbalancer_listener_id",
+        "list_filters": {"loadbalancer_id": "loadbalancer_id"},
+        "create": LbListenerManageAction.CREATE,
+        "delete": LbListenerManageAction.DELETE,
+        "update": {
+            LbListenerManageAction.UPDATE: {
+                "name": "name",
+                "secret_id": "secret_id",
+                "sni_secret_id": "sni_secret_id",
+                "allowed_cidrs": "allowed_cidrs",
+            },
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the loadbalancer_listener module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(LbListenerManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            loadbalancer_listener_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            protocol=dict(type="str", choices=list(LbListenerProtocol), required=False),
+            protocol_port=dict(type="int", required=False),
+            loadbalancer_id=dict(type="str", required=False),
+            insert_x_forwarded=dict(type="bool", required=False),
+            secret_id=dict(type="str", required=False),
+            allowed_cidrs=dict(type="list", elements="str", required=False),
+            sni_secret_id=dict(type="list", elements="str", required=False),
+        )
+
+    def _get_loadbalancer_id(self, params: dict) -> Optional[str]:
+        if params.get("loadbalancer_id") or not params.get("loadbalancer_listener_id"):
+            return params.get("loadbalancer_id")
+        listener = self.get_by_id(resource_id=params["loadbalancer_listener_id"], allow_not_found=True)
+        return (listener or {}).get("loadbalancer_id")
@@ -1,7 +1,19 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    DEFAULT_TASK_TIMEOUT,
     BaseResourceClient,
+    fail_on_error,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer import (
+    LOADBALANCER_URL,
+    CloudLoadbalancerClient,
+    LoadbalancerQueueMixin,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_pool import (
+    CloudLbPoolClient,
+    LbPoolManageAction,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer_member import (
     CreateLbPoolMember,
@@ -9,14 +21,28 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadba
     LbPoolId,
 )
 
+# Member fields sent back to the API when the pool members are replaced
+MEMBER_FIELDS = (
+    "id",
+    "address",
+    "protocol_port",
+    "weight",
+    "subnet_id",
+    "instance_id",
+    "admin_state_up",
+    "monitor_address",
+    "monitor_port",
+)
+
 
 class LbPoolMemeberManageAction(str, Enum):
     CREATE = "create"
     DELETE = "delete"
 
 
-class CloudLbPoolMemberClient(BaseResourceClient):
+class CloudLbPoolMemberClient(LoadbalancerQueueMixin, BaseResourceClient):
     RESOURCE = "member"
+    STATUS_FIELD = "provisioning_status"
 
     ACTION_CONFIG = {
         LbPoolMemeberManageAction.CREATE: {
@@ -39,3 +65,116 @@ class CloudLbPoolMemberClient(BaseResourceClient):
             },
         },
     }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the loadbalancer_member module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(LbPoolMemeberManageAction), required=False),
+            loadbalancer_pool_id=dict(type="str", required=False),
+            loadbalancer_pool_member_id=dict(type="str", required=False),
+            members=dict(type="list", elements="dict", required=False),
+            purge_members=dict(type="bool", default=True),
+            protocol_port=dict(type="int", required=False),
+            address=dict(type="str", required=False),
+            subnet_id=dict(type="str", required=False),
+            instance_id=dict(type="str", required=False),
+            admin_state_up=dict(type="bool", required=False),
+            weight=dict(type="int", required=False),
+            monitor_address=dict(type="str", required=False),
+            monitor_port=dict(type="int", required=False),
+            id=dict(type="str", required=False),
+            operating_status=dict(type="str", required=False),
+        )
+
+    @fail_on_error
+    def sync(self, loadbalancer_pool_id: str, members: list, purge: bool = True) -> dict:
+        """Make the members of a pool match I(members) with a single pool update"""
+        return self._sync(loadbalancer_pool_id, members, purge)
+
+    def _sync(self, loadbalancer_pool_id: str, members: list, purge: bool, params: Optional[dict] = None) -> dict:
+        # Members are matched on address and port. Instead of one task per added or
+        # removed member, the whole member list is replaced by one pool update; members
+        # that are kept carry their ID so the loadbalancer leaves them untouched.
+        pool = self.get_by_id(resource_id=loadbalancer_pool_id)
+        existing = {self.get_member_key(member): member for member in pool.get("members") or []}
+
+        wanted = {}
+        for member in members:
+            wanted.setdefault(self.get_member_key(member), member)
+
+        added, updated, kept = [], [], []
+        for key, member in wanted.items():
+            current = existing.get(key)
+            if current is None:
+                added.append(member)
+            elif self._differs(member, current):
+                updated.append({**current, **member, "id": current["id"]})
+            else:
+                kept.append(current)
+        removed = [member for key, member in existing.items() if key not in wanted]
+        if not purge:
+            kept.extend(removed)
+            removed = []
+
+        result = {
+            "changed": bool(added or updated or removed),
+            "data": {
+                "added": added,
+                "updated": updated,
+                "removed": [member["id"] for member in removed],
+            },
+        }
+        if self.module.check_mode or not result["changed"]:
+            return result
+
+        params = self.module.params if params is None else params
+        update_params = {
+            "loadbalancer_pool_id": loadbalancer_pool_id,
+            "lb_algorithm": pool["lb_algorithm"],
+            "members": [self._get_member_payload(member) for member in kept + updated + added],
+        }
+        pool_client = CloudLbPoolClient(self.module, self.url, self.api_client)
+        response = pool_client._execute_command(LbPoolManageAction.UPDATE, update_params)["data"]
+
+        if params.get("wait", True):
+            timeout = params.get("wait_timeout") or DEFAULT_TASK_TIMEOUT
+            task_ids = (response or {}).get("tasks") if isinstance(response, dict) else None
+            if task_ids:
+                self.wait_for_tasks(task_ids, timeout=timeout)
+            loadbalancer_ids = [loadbalancer["id"] for loadbalancer in pool.get("loadbalancers") or []]
+            if loadbalancer_ids:
+                loadbalancer_client = CloudLoadbalancerClient(self.module, LOADBALANCER_URL, self.api_client)
+                loadbalancer_client._wait_for(loadbalancer_ids, ["ACTIVE"], timeout=timeout)
+        return result
+
+    def _run_operation(self, operation: tuple) -> dict:
+        # Operations carrying I(members) replace the whole member list, as the module does
+        _, _, params = operation
+        if params.get("members") is not None:
+            return self._sync(
+                params["loadbalancer_pool_id"], params["members"], params.get("purge_members", True), params
+            )
+        return super()._run_operation(operation)
+
+    def _get_loadbalancer_id(self, params: dict) -> Optional[str]:
+        if not params.get("loadbalancer_pool_id"):
+            return None
+        pool_client = CloudLbPoolClient(self.module, self.url, self.api_client)
+        return pool_client.get_pool_loadbalancer_id(params["loadbalancer_pool_id"])
+
+    @staticmethod
+    def _differs(member: dict, current: dict) -> bool:
+        # Fields the API does not echo back, such as instance_id, cannot be compared
+        return any(
+            member.get(field) is not None and field in current and current[field] != member[field]
+            for field in MEMBER_FIELDS
+        )
+
+    @staticmethod
+    def get_member_key(member: dict) -> tuple:
+        return member.get("address"), member.get("protocol_port")
+
+    @staticmethod
+    def _get_member_payload(member: dict) -> dict:
+        return {field: member[field] for field in MEMBER_FIELDS if member.get(field) is not None}
@@ -1,15 +1,24 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer import (
+    LoadbalancerQueueMixin,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer_pool import (
     CreateLbPool,
     GetLbPoolList,
+    LbPoolAlgorithm,
     LbPoolId,
+    LbPoolProtocol,
     UpdateLbPool,
 )
 
+LISTENER_URL = "v1/lblisteners/"
+
 
 class LbPoolManageAction(str, Enum):
     CREATE = "create"
@@ -22,8 +31,9 @@ class LbPoolGetAction(str, Enum):
     GET_BY_ID = "get_by_id"
 
 
-class CloudLbPoolClient(BaseResourceClient):
+class CloudLbPoolClient(LoadbalancerQueueMixin, BaseResourceClient):
     RESOURCE = "pool"
+    STATUS_FIELD = "provisioning_status"
 
     ACTION_CONFIG = {
         LbPoolGetAction.GET_LIST: {
@@ -65,3 +75,55 @@ class CloudLbPoolClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "loadbalancer_pool_id",
+        "list_filters": {"loadbalancer_id": "loadbalancer_id", "listener_id": "listener_id"},
+        "create": LbPoolManageAction.CREATE,
+        "delete": LbPoolManageAction.DELETE,
+        "update": {
+            LbPoolManageAction.UPDATE: {
+                "lb_algorithm": "lb_algorithm",
+                "healthmonitor": "healthmonitor",
+                "session_persistence": "session_persistence",
+                "timeout_client_data": "timeout_client_data",
+                "timeout_member_connect": "timeout_member_connect",
+                "timeout_member_data": "timeout_member_data",
+            },
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the loadbalancer_pool module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(LbPoolManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            loadbalancer_pool_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            lb_algorithm=dict(type="str", choices=list(LbPoolAlgorithm), required=False),
+            protocol=dict(type="str", choices=list(LbPoolProtocol), required=False),
+            loadbalancer_id=dict(type="str", required=False),
+            listener_id=dict(type="str", required=False),
+            members=dict(type="list", elements="dict", required=False),
+            healthmonitor=dict(type="dict", required=False),
+            session_persistence=dict(type="dict", required=False),
+            timeout_client_data=dict(type="int", required=False),
+            timeout_member_connect=dict(type="int", required=False),
+            timeout_member_data=dict(type="int", required=False),
+        )
+
+    def _get_loadbalancer_id(self, params: dict) -> Optional[str]:
+        if params.get("loadbalancer_id"):
+            return params["loadbalancer_id"]
+        if params.get("listener_id"):
+            listener = self.api_client.get(LISTENER_URL, path_params=params["listener_id"], allow_not_found=True)
+            return (listener or {}).get("loadbalancer_id")
+        if params.get("loadbalancer_pool_id"):
+            return self.get_pool_loadbalancer_id(params["loadbalancer_pool_id"])
+        return None
+
+    def get_pool_loadbalancer_id(self, loadbalancer_pool_id: str) -> Optional[str]:
+        pool = self.get_by_id(resource_id=loadbalancer_pool_id, allow_not_found=True)
+        loadbalancers = (pool or {}).get("loadbalancers") or []
+        return loadbalancers[0]["id"] if loadbalancers else None
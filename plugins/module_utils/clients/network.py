@@ -2,6 +2,7 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.network import (
     CreateNetwork,
@@ -65,3 +66,25 @@ class CloudNetworkClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "network_id",
+        "create": NetworkManageAction.CREATE,
+        "delete": NetworkManageAction.DELETE,
+        "update": {
+            NetworkManageAction.UPDATE: {"name": "name"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the network module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(NetworkManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            network_id=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            create_router=dict(type="bool", required=False),
+            type=dict(type="str", choices=["vlan", "vxlan"], required=False),
+            metadata=dict(type="dict", required=False),
+        )
@@ -1,7 +1,10 @@
 from enum import Enum
+from time import time
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.reserved_fip import (
     CreateAnySubnetReservedFip,
@@ -10,8 +13,21 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.reserv
     CreateSubnetReservedFip,
     GetReservedFipList,
     ReservedFipId,
+    ReservedFipType,
     UpdateReservedFip,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    run_concurrently,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    locked_state,
+)
+
+# Leased addresses that are still available after this many seconds return to the pool
+DEFAULT_LEASE_TIMEOUT = 900
 
 
 class ReservedFipManageAction(str, Enum):
@@ -73,3 +89,141 @@ class CloudReservedFipClient(BaseResourceClient):
             },
         },
     }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the reserved_fixed_ip module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(ReservedFipManageAction), required=False),
+            port_id=dict(type="str", required=False),
+            type=dict(type="str", choices=list(ReservedFipType), required=False),
+            is_vip=dict(type="bool", required=False),
+            subnet_id=dict(type="str", required=False),
+            network_id=dict(type="str", required=False),
+            ip_address=dict(type="str", required=False),
+        )
+
+    @fail_on_error
+    def lease_from_pool(
+        self,
+        state_path: str,
+        size: int,
+        count: int = 0,
+        network_id: Optional[str] = None,
+        subnet_id: Optional[str] = None,
+        lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    ) -> dict:
+        """Hand out I(count) available reserved IPs and keep I(size) more available"""
+        return self._lease_from_pool(state_path, size, count, network_id, subnet_id, lease_timeout)
+
+    def _lease_from_pool(
+        self,
+        state_path: str,
+        size: int,
+        count: int,
+        network_id: Optional[str],
+        subnet_id: Optional[str],
+        lease_timeout: int,
+    ) -> dict:
+        # The pool is the set of available reserved IPs of the network or subnet. Leases,
+        # pending top-up tasks and the creations of missing leases are recorded in a
+        # controller-local state file, so parallel forks never get the same address and do
+        # not top the pool up twice. The file stays locked only while the pool is read and
+        # requests are sent: missing leases are awaited outside the lock, meanwhile other
+        # forks skip what their tasks create. Top-up creations are not awaited at all; they
+        # become available for later runs.
+        pool_key = f"{self.api_client.project_id}/{self.api_client.region_id}/{subnet_id or network_id}"
+        with locked_state(state_path) as state:
+            pool = state.setdefault(pool_key, {"leases": {}, "pending": {}})
+            pool.setdefault("leasing", {})
+            now = time()
+            self._settle_leasing(pool)
+            available = [
+                fip
+                for fip in self.api_client.get_all(self.url, query_params={"available_only": True})
+                if (fip.get("subnet_id") == subnet_id if subnet_id else fip.get("network_id") == network_id)
+            ]
+            available_ids = {fip["port_id"] for fip in available}
+            pool["leases"] = {
+                port_id: leased_at
+                for port_id, leased_at in pool["leases"].items()
+                if port_id in available_ids and now - leased_at < lease_timeout
+            }
+            pool["pending"] = self._get_pending_tasks(pool["pending"])
+            free = [fip for fip in available if fip["port_id"] not in pool["leases"]]
+
+            create_params = {"type": "any_subnet", "network_id": network_id, "wait": False}
+            if subnet_id:
+                create_params = {"type": "subnet", "subnet_id": subnet_id, "wait": False}
+
+            leased = free[:count]
+            missing = count - len(leased)
+            deficit = size - (len(free) - len(leased)) - len(pool["pending"])
+            lease_tasks = []
+            if not self.module.check_mode:
+                for response in self._create_many(missing, create_params):
+                    lease_tasks.extend(response["tasks"])
+                pool["leasing"].update((task_id, now) for task_id in lease_tasks)
+                topup_tasks = []
+                for response in self._create_many(deficit, create_params):
+                    topup_tasks.extend(response["tasks"])
+                pool["pending"].update((task_id, now) for task_id in topup_tasks)
+                for fip in leased:
+                    pool["leases"][fip["port_id"]] = now
+            pending_tasks = list(pool["pending"])
+
+        if lease_tasks:
+            leased += self._wait_for_leases(state_path, pool_key, lease_tasks)
+        return {
+            "changed": bool(leased) or missing > 0 or deficit > 0,
+            "data": leased,
+            "available": len(free) - len(free[:count]),
+            "pending_tasks": pending_tasks,
+        }
+
+    def _wait_for_leases(self, state_path: str, pool_key: str, task_ids: list) -> list:
+        """Wait for the creations of missing leases, then record the created IPs as leased"""
+        timeout = self.ACTION_CONFIG[ReservedFipManageAction.CREATE]["timeout"]
+        tasks = self.wait_for_tasks(task_ids, timeout=timeout)
+        port_ids = [port_id for task in tasks for port_id in (task.get("created_resources") or {}).get("ports") or []]
+        with locked_state(state_path) as state:
+            pool = state.setdefault(pool_key, {"leases": {}, "pending": {}})
+            leasing = pool.setdefault("leasing", {})
+            for task_id in task_ids:
+                leasing.pop(task_id, None)
+            now = time()
+            pool["leases"].update((port_id, now) for port_id in port_ids)
+        failed = [task for task in tasks if task["state"] != "FINISHED"]
+        if failed:
+            raise CloudAPIError(f"{len(failed)} of {len(tasks)} reserved IP creations failed", port_ids=port_ids)
+        return list(self._get_many(port_ids).values())
+
+    def _settle_leasing(self, pool: dict) -> None:
+        """Lease the IPs created for other runs that are still waiting on their tasks, dropping failed tasks"""
+        task_ids = list(pool["leasing"])
+        for task_id, (task, error) in zip(task_ids, run_concurrently(self._get_task, task_ids)):
+            if error is not None or task["state"] in ("NEW", "RUNNING"):
+                continue
+            leased_at = pool["leasing"].pop(task_id)
+            if task["state"] == "FINISHED":
+                for port_id in (task.get("created_resources") or {}).get("ports") or []:
+                    pool["leases"].setdefault(port_id, leased_at)
+
+    def _create_many(self, count: int, params: dict) -> list:
+        def create(_) -> dict:
+            return self._execute_command(ReservedFipManageAction.CREATE, dict(params))["data"]
+
+        results = []
+        for result, error in run_concurrently(create, range(max(count, 0))):
+            if error is not None:
+                raise error
+            results.append(result)
+        return results
+
+    def _get_pending_tasks(self, pending: dict) -> dict:
+        task_ids = list(pending)
+        return {
+            task_id: pending[task_id]
+            for task_id, (task, error) in zip(task_ids, run_concurrently(self._get_task, task_ids))
+            if error is None and task["state"] in ("NEW", "RUNNING")
+        }
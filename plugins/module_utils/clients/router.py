@@ -2,6 +2,7 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.router import (
     AttachRouter,
@@ -85,3 +86,54 @@ class CloudRouterClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "router_id",
+        "create": RouterManageAction.CREATE,
+        "delete": RouterManageAction.DELETE,
+        "update": {
+            RouterManageAction.UPDATE: {"name": "name", "routes": "routes"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the router module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(RouterManageAction),
+                required=False,
+            ),
+            state=dict(
+                type="str",
+                choices=list(ResourceState),
+                required=False,
+            ),
+            router_id=dict(
+                type="str",
+                required=False,
+            ),
+            name=dict(
+                type="str",
+                required=False,
+            ),
+            external_gateway_info=dict(
+                type="dict",
+                required=False,
+            ),
+            interfaces=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            routes=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            subnet_id=dict(
+                type="str",
+                required=False,
+            ),
+        )
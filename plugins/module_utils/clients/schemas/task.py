@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.base import (
+    BaseSchema,
+)
+
+
+@dataclass
+class TaskId(BaseSchema):
+    task_id: str
@@ -2,6 +2,7 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.secret import (
     CreateSecret,
@@ -52,3 +53,21 @@ class CloudSecretClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "secret_id",
+        "create": SecretManageAction.CREATE,
+        "delete": SecretManageAction.DELETE,
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the secret module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(SecretManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            secret_id=dict(type="str", required=False),
+            expiration=dict(type="str", required=False),
+            name=dict(type="str", required=False),
+            payload=dict(type="dict", required=False, no_log=True),
+        )
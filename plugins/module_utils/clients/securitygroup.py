@@ -2,6 +2,7 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.securitygroup import (
     CopySecurityGroup,
@@ -71,3 +72,25 @@ class CloudSecurityGroupClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "securitygroup_id",
+        "create": SecurityGroupManageAction.CREATE,
+        "delete": SecurityGroupManageAction.DELETE,
+        "update": {
+            SecurityGroupManageAction.UPDATE: {"name": "name"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the securitygroup module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(SecurityGroupManageAction), required=False),
+            state=dict(type="str", choices=list(ResourceState), required=False),
+            securitygroup_id=dict(type="str", required=False),
+            instances=dict(type="list", elements="str", required=False),
+            security_group=dict(type="dict", required=False),
+            name=dict(type="str", required=False),
+            changed_rules=dict(type="list", elements="dict", required=False),
+        )
@@ -1,15 +1,30 @@
 from enum import Enum
+from ipaddress import ip_network
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.securitygroup import (
     SecurityGroupId,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.securitygroup_rule import (
     CreateSecurityGroupRule,
+    DirectionType,
+    Ethertype,
+    SecurityGroupProtocol,
     SecurityGroupRuleId,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+
+# Prefixes that match every address, the API stores them as an empty prefix
+ANY_PREFIXES = ("0.0.0.0/0", "::/0")
 
 
 class SecurityGroupRuleManageAction(str, Enum):
@@ -38,3 +53,120 @@ class CloudSecurityGroupRuleClient(BaseResourceClient):
             },
         },
     }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the securitygroup_rule module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(type="str", choices=list(SecurityGroupRuleManageAction), required=False),
+            securitygroup_id=dict(type="str", required=False),
+            securitygroup_rule_id=dict(type="str", required=False),
+            rules=dict(type="list", elements="dict", required=False),
+            purge_rules=dict(type="bool", default=True, required=False),
+            direction=dict(type="str", choices=list(DirectionType), required=False),
+            ethertype=dict(type="str", choices=list(Ethertype), required=False),
+            description=dict(type="str", required=False),
+            remote_group_id=dict(type="str", required=False),
+            port_range_min=dict(type="int", required=False),
+            port_range_max=dict(type="int", required=False),
+            remote_ip_prefix=dict(type="str", required=False),
+            protocol=dict(type="str", choices=list(SecurityGroupProtocol), required=False),
+            id=dict(type="str", required=False),
+            revision_number=dict(type="int", required=False),
+        )
+
+    @fail_on_error
+    def sync(
+        self,
+        securitygroup_id: str,
+        rules: list,
+        purge: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict:
+        """Make the rules of a security group match I(rules) with the fewest creates and deletes"""
+        return self._sync(securitygroup_id, rules, purge, max_concurrency)
+
+    def _sync(self, securitygroup_id: str, rules: list, purge: bool, max_concurrency: int) -> dict:
+        # The group is read once and its rules indexed by their normalized key, so a
+        # converged group costs one request and only the differing rules are written.
+        group = self.get_by_id(resource_id=securitygroup_id)
+        existing = {}
+        for rule in group.get("security_group_rules") or []:
+            existing.setdefault(self.get_rule_key(rule), []).append(rule)
+
+        wanted = {}
+        for rule in rules:
+            wanted.setdefault(self.get_rule_key(rule), rule)
+
+        to_create = [rule for key, rule in wanted.items() if key not in existing]
+        to_delete = []
+        for key, found in existing.items():
+            # Duplicated rules are collapsed to one, unwanted ones are removed when purging
+            duplicates = found if key not in wanted else found[1:]
+            if purge or key in wanted:
+                to_delete.extend(duplicates)
+
+        result = {
+            "changed": bool(to_create or to_delete),
+            "data": {"created": [], "deleted": [rule["id"] for rule in to_delete]},
+        }
+        if self.module.check_mode or not result["changed"]:
+            result["data"]["created"] = to_create
+            return result
+
+        operations = [
+            (SecurityGroupRuleManageAction.CREATE, {**rule, "securitygroup_id": securitygroup_id}) for rule in to_create
+        ]
+        operations += [
+            (SecurityGroupRuleManageAction.DELETE, {"securitygroup_rule_id": rule["id"]}) for rule in to_delete
+        ]
+
+        def apply(operation):
+            return self._execute_command(*operation)["data"]
+
+        errors = []
+        for (command, params), (response, error) in zip(
+            operations, run_concurrently(apply, operations, max_concurrency)
+        ):
+            if error is not None:
+                errors.append({"command": command.value, "rule": params, "msg": getattr(error, "message", str(error))})
+            elif command == SecurityGroupRuleManageAction.CREATE:
+                result["data"]["created"].append(response)
+        if errors:
+            deleted = {error["rule"].get("securitygroup_rule_id") for error in errors}
+            result["data"]["deleted"] = [rule_id for rule_id in result["data"]["deleted"] if rule_id not in deleted]
+            raise CloudAPIError(f"{len(errors)} of {len(operations)} rule changes failed", errors=errors, **result)
+        return result
+
+    def _run_operation(self, operation: tuple) -> dict:
+        # Operations carrying I(rules) converge the whole group, as the module does
+        _, _, params = operation
+        if params.get("rules") is not None:
+            return self._sync(
+                params["securitygroup_id"], params["rules"], params.get("purge_rules", True), DEFAULT_MAX_CONCURRENCY
+            )
+        return super()._run_operation(operation)
+
+    @staticmethod
+    def get_rule_key(rule: dict) -> tuple:
+        """Normalize a rule to the fields that make it unique within a group"""
+        protocol = rule.get("protocol") or "any"
+        port_range_min = rule.get("port_range_min")
+        port_range_max = rule.get("port_range_max")
+        if port_range_max is None:
+            port_range_max = port_range_min
+        prefix = rule.get("remote_ip_prefix")
+        if prefix:
+            prefix = str(ip_network(prefix, strict=False))
+        if prefix in ANY_PREFIXES:
+            prefix = None
+        ethertype = rule.get("ethertype") or ("IPv6" if prefix and ":" in prefix else "IPv4")
+        return (
+            rule.get("direction"),
+            ethertype,
+            protocol,
+            port_range_min,
+            port_range_max,
+            prefix,
+            rule.get("remote_group_id"),
+        )
@@ -2,10 +2,12 @@ from enum import Enum
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.servergroup import (
     CreateServerGroup,
     ServerGroupId,
+    ServerGroupPolicy,
 )
 
 
@@ -47,3 +49,39 @@ class CloudServerGroupClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "servergroup_id",
+        "id_field": "servergroup_id",
+        "create": ServerGroupManageAction.CREATE,
+        "delete": ServerGroupManageAction.DELETE,
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the servergroup module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(ServerGroupManageAction),
+                required=False,
+            ),
+            state=dict(
+                type="str",
+                choices=list(ResourceState),
+                required=False,
+            ),
+            name=dict(
+                type="str",
+                required=False,
+            ),
+            policy=dict(
+                type="str",
+                choices=list(ServerGroupPolicy),
+                required=False,
+            ),
+            servergroup_id=dict(
+                type="str",
+                required=False,
+            ),
+        )
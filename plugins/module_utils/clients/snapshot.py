@@ -1,13 +1,30 @@
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.snapshot import (
     CreateSnapshot,
     GetSnapshotList,
     SnapshotId,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
+    CloudVolumeClient,
+    get_volume_filters,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+    ValidationError,
+)
+
+VOLUME_URL = "v1/volumes/"
 
 
 class SnapshotManageAction(str, Enum):
@@ -55,3 +72,155 @@ class CloudSnapshotClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "snapshot_id",
+        "list_filters": {"volume_id": "volume_id"},
+        "create": SnapshotManageAction.CREATE,
+        "delete": SnapshotManageAction.DELETE,
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the volume_snapshot module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(SnapshotManageAction),
+                required=False,
+            ),
+            state=dict(
+                type="str",
+                choices=list(ResourceState),
+                required=False,
+            ),
+            snapshot_id=dict(
+                type="str",
+                required=False,
+            ),
+            volume_id=dict(
+                type="str",
+                required=False,
+            ),
+            volume_ids=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            volume_filters=dict(
+                type="dict",
+                required=False,
+            ),
+            name=dict(
+                type="str",
+                required=False,
+            ),
+            description=dict(
+                type="str",
+                required=False,
+            ),
+            metadata=dict(
+                type="dict",
+                required=False,
+            ),
+        )
+
+    @fail_on_error
+    def create_many(
+        self,
+        name: str,
+        volume_ids: Optional[list] = None,
+        volume_filters: Optional[dict] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict:
+        """Snapshot several volumes, picked by ID or by volume list filters, in one go"""
+        return self._create_many(name, volume_ids, volume_filters, max_concurrency)
+
+    def _create_many(
+        self,
+        name: str,
+        volume_ids: Optional[list],
+        volume_filters: Optional[dict],
+        max_concurrency: int,
+        params: Optional[dict] = None,
+    ) -> dict:
+        # Snapshot requests are sent concurrently without waiting, then every task is
+        # polled in the same loop and the snapshots are fetched together.
+        if volume_filters is not None:
+            query_params = get_volume_filters(volume_filters)
+            found = {volume["id"]: volume for volume in self.api_client.get_all(VOLUME_URL, query_params=query_params)}
+            volumes = list(found.values())
+        elif volume_ids is not None:
+            volume_client = CloudVolumeClient(self.module, VOLUME_URL, self.api_client)
+            found = {
+                volume_id: volume
+                for volume_id, volume in volume_client._get_many(volume_ids, allow_not_found=True).items()
+                if volume
+            }
+        else:
+            raise ValidationError("One of volume_ids or volume_filters is required")
+        if volume_ids is not None:
+            missing = [volume_id for volume_id in volume_ids if volume_id not in found]
+            if missing:
+                raise CloudAPIError(f"Volumes not found: {', '.join(missing)}")
+            volumes = [found[volume_id] for volume_id in dict.fromkeys(volume_ids)]
+
+        params = self.module.params if params is None else params
+        result = {"changed": bool(volumes), "data": {volume["id"]: None for volume in volumes}}
+        if self.module.check_mode or not volumes:
+            return result
+
+        def send(volume: dict) -> list:
+            create_params = {
+                "volume_id": volume["id"],
+                "name": f"{name}-{volume['name']}",
+                "description": params.get("description"),
+                "metadata": params.get("metadata"),
+                "wait": False,
+            }
+            return self._execute_command(SnapshotManageAction.CREATE, create_params)["data"]["tasks"]
+
+        errors = {}
+        task_volumes = {}
+        for volume, (task_ids, error) in zip(volumes, run_concurrently(send, volumes, max_concurrency)):
+            if error is not None:
+                errors[volume["id"]] = getattr(error, "message", str(error))
+                continue
+            task_volumes.update((task_id, volume["id"]) for task_id in task_ids)
+
+        if task_volumes and params.get("wait", True):
+            timeout = self.ACTION_CONFIG[SnapshotManageAction.CREATE]["timeout"]
+            snapshot_volumes = {}
+            for task in self.wait_for_tasks(list(task_volumes), timeout=timeout, max_concurrency=max_concurrency):
+                volume_id = task_volumes[task["id"]]
+                if task["state"] != "FINISHED":
+                    errors[volume_id] = f"Task {task['task_type']} in state: {task['state']}"
+                    continue
+                for snapshot_id in (task.get("created_resources") or {}).get("snapshots") or []:
+                    snapshot_volumes[snapshot_id] = volume_id
+            if params.get("resolve_resources", True):
+                snapshots = self._get_many(list(snapshot_volumes))
+            else:
+                snapshots = {snapshot_id: {"id": snapshot_id} for snapshot_id in snapshot_volumes}
+            for snapshot_id, volume_id in snapshot_volumes.items():
+                result["data"][volume_id] = snapshots.get(snapshot_id)
+        else:
+            for task_id, volume_id in task_volumes.items():
+                result["data"][volume_id] = {"tasks": [task_id]}
+
+        if errors:
+            raise CloudAPIError(f"{len(errors)} of {len(volumes)} snapshots failed", errors=errors, **result)
+        return result
+
+    def _run_operation(self, operation: tuple) -> dict:
+        # Operations carrying I(volume_ids) or I(volume_filters) snapshot them all at once, as the module does
+        _, _, params = operation
+        if params.get("volume_ids") is not None or params.get("volume_filters") is not None:
+            return self._create_many(
+                params.get("name"),
+                params.get("volume_ids"),
+                params.get("volume_filters"),
+                DEFAULT_MAX_CONCURRENCY,
+                params,
+            )
+        return super()._run_operation(operation)
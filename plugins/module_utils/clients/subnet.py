@@ -1,7 +1,11 @@
 from enum import Enum
+from typing import Optional
 
+from ansible_collections.gcore.cloud.plugins.module_utils.cidr import CidrIndex
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.subnet import (
     CreateSubnet,
@@ -9,6 +13,9 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.subnet
     SubnetId,
     UpdateSubnet,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
 
 
 class SubnetManageAction(str, Enum):
@@ -67,3 +74,103 @@ class CloudSubnetClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "subnet_id",
+        "list_filters": {"network_id": "network_id"},
+        "create": SubnetManageAction.CREATE,
+        "delete": SubnetManageAction.DELETE,
+        "update": {
+            SubnetManageAction.UPDATE: {
+                "name": "name",
+                "dns_nameservers": "dns_nameservers",
+                "enable_dhcp": "enable_dhcp",
+                "gateway_ip": "gateway_ip",
+                "host_routes": "host_routes",
+            },
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the subnet module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(SubnetManageAction),
+                required=False,
+            ),
+            state=dict(
+                type="str",
+                choices=list(ResourceState),
+                required=False,
+            ),
+            subnet_id=dict(
+                type="str",
+                required=False,
+            ),
+            name=dict(
+                type="str",
+                required=False,
+            ),
+            network_id=dict(
+                type="str",
+                required=False,
+            ),
+            enable_dhcp=dict(
+                type="bool",
+                required=False,
+            ),
+            cidr=dict(
+                type="str",
+                required=False,
+            ),
+            cidr_allocate=dict(
+                type="dict",
+                required=False,
+                options=dict(
+                    supernet=dict(type="str", required=True),
+                    prefix_length=dict(type="int", required=True),
+                    scope=dict(type="str", choices=["network", "project"], default="network"),
+                ),
+            ),
+            connect_to_network_router=dict(
+                type="bool",
+                required=False,
+            ),
+            dns_nameservers=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            gateway_ip=dict(
+                type="str",
+                required=False,
+            ),
+            host_routes=dict(
+                type="list",
+                elements="dict",
+                required=False,
+            ),
+            metadata=dict(
+                type="dict",
+                required=False,
+            ),
+        )
+
+    @fail_on_error
+    def allocate_cidrs(
+        self,
+        supernet: str,
+        prefix_length: int,
+        count: int = 1,
+        network_id: Optional[str] = None,
+    ) -> list:
+        """Pick I(count) free blocks of the supernet, not used by the subnets of the network or project"""
+        query_params = {"network_id": network_id} if network_id else None
+        subnets = self.api_client.get_all(self.url, query_params=query_params)
+        try:
+            index = CidrIndex(supernet, [subnet["cidr"] for subnet in subnets if subnet.get("cidr")])
+            return [index.allocate(prefix_length) for _ in range(count)]
+        except ValueError as exc:
+            raise ValidationError(str(exc))
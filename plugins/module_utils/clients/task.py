@@ -0,0 +1,61 @@
+from enum import Enum
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    BaseResourceClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.task import (
+    TaskId,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
+
+
+class TaskGetAction(str, Enum):
+    GET_BY_ID = "get_by_id"
+
+
+class CloudTaskClient(BaseResourceClient):
+    RESOURCE = "task"
+
+    ACTION_CONFIG = {
+        TaskGetAction.GET_BY_ID: {
+            "method": "get",
+            "include_project_region": False,
+            "path": "{task_id}",
+            "schemas": {
+                "path_params": TaskId,
+            },
+        },
+    }
+
+    def get_by_id(self, resource_id: str, **kwargs):
+        return self.api_client.get(self.url, path_params=resource_id, include_project_region=False, **kwargs)
+
+    def get_many(self, task_ids: list, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list:
+        tasks = []
+        for task, error in run_concurrently(self._get_task, task_ids, max_concurrency):
+            if error:
+                raise error
+            tasks.append(task)
+        return tasks
+
+    @staticmethod
+    def get_failed(tasks: list) -> list:
+        return [task for task in tasks if task["state"] != "FINISHED"]
+
+    @staticmethod
+    def get_deleted_resources(tasks: list) -> dict:
+        """Collect IDs of resources removed by finished delete_* tasks, keyed by resource type"""
+        deleted = {}
+        for task in tasks:
+            task_type = task.get("task_type") or ""
+            if task["state"] != "FINISHED" or not task_type.startswith("delete_"):
+                continue
+            resource = task_type[len("delete_") :]
+            data = task.get("data") or {}
+            resource_id = data.get(f"{resource}_id") or data.get(f"{resource}_uuid") or data.get("resource_id")
+            if resource_id:
+                deleted.setdefault(f"{resource}s", []).append(resource_id)
+        return deleted
@@ -1,7 +1,11 @@
+from dataclasses import fields
 from enum import Enum
+from typing import Optional
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
     BaseResourceClient,
+    ResourceState,
+    fail_on_error,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.volume import (
     CreateVolume,
@@ -10,11 +14,41 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.volume
     DeleteVolume,
     ExtendVolume,
     GetVolumeList,
+    RetypableVolumeType,
     RetypeVolume,
     UpdateVolume,
     VolumeId,
     VolumeInstanceAction,
+    VolumeSource,
+    VolumeType,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+    ValidationError,
+)
+
+# Volume list query params that select volumes, as opposed to the paging ones
+VOLUME_FILTERS = tuple(field.name for field in fields(GetVolumeList) if field.name not in ("limit", "offset"))
+
+
+def get_volume_filters(volume_filters: Optional[dict]) -> dict:
+    """Validate volume list filters and return them as query params.
+
+    Unknown or empty filters are rejected, as they would silently select every volume.
+    """
+    unknown = sorted(set(volume_filters or {}) - set(VOLUME_FILTERS))
+    if unknown:
+        raise ValidationError(
+            f"Unknown volume filters: {', '.join(unknown)}, expected some of {', '.join(VOLUME_FILTERS)}"
+        )
+    query_params = GetVolumeList.init_as_dict(**(volume_filters or {}))
+    if not query_params:
+        raise ValidationError(f"Volume filters need at least one of {', '.join(VOLUME_FILTERS)}")
+    return query_params
 
 
 class VolumeManageAction(str, Enum):
@@ -126,3 +160,183 @@ class CloudVolumeClient(BaseResourceClient):
             },
         },
     }
+
+    STATE_CONFIG = {
+        "id_param": "volume_id",
+        "list_filters": {"name_part": "name"},
+        "create": VolumeManageAction.CREATE,
+        "delete": VolumeManageAction.DELETE,
+        "update": {
+            VolumeManageAction.UPDATE: {"name": "name"},
+            VolumeManageAction.EXTEND: {"size": "size"},
+            VolumeManageAction.RETYPE: {"volume_type": "volume_type"},
+        },
+    }
+
+    @staticmethod
+    def get_module_spec() -> dict:
+        """Options of the volume module, besides the API, bulk and wait ones"""
+        return dict(
+            command=dict(
+                type="str",
+                choices=list(VolumeManageAction),
+                required=False,
+            ),
+            state=dict(
+                type="str",
+                choices=list(ResourceState),
+                required=False,
+            ),
+            volume_id=dict(
+                type="str",
+                required=False,
+            ),
+            volume_ids=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            type_name=dict(
+                type="str",
+                choices=list(VolumeType),
+                required=False,
+            ),
+            volume_type=dict(
+                type="str",
+                choices=list(RetypableVolumeType),
+                required=False,
+            ),
+            name=dict(
+                type="str",
+            ),
+            instance_id_to_attach_to=dict(
+                type="str",
+                required=False,
+            ),
+            attachment_tag=dict(
+                type="str",
+                required=False,
+            ),
+            lifecycle_policy_ids=dict(
+                type="list",
+                elements="int",
+                required=False,
+            ),
+            metadata=dict(
+                type="dict",
+                required=False,
+            ),
+            size=dict(
+                type="int",
+                required=False,
+            ),
+            source=dict(
+                type="str",
+                choices=list(VolumeSource),
+                required=False,
+            ),
+            image_id=dict(
+                type="str",
+                required=False,
+            ),
+            snapshot_id=dict(
+                type="str",
+            ),
+            instance_id=dict(
+                type="str",
+            ),
+            snapshots=dict(
+                type="str",
+            ),
+        )
+
+    @fail_on_error
+    def attach_many(
+        self,
+        command: str,
+        volume_ids: list,
+        instance_id: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict:
+        """Attach or detach several volumes of one instance, waiting for all tasks together"""
+        return self._attach_many(command, volume_ids, instance_id, max_concurrency)
+
+    def _attach_many(
+        self,
+        command: str,
+        volume_ids: list,
+        instance_id: str,
+        max_concurrency: int,
+        params: Optional[dict] = None,
+    ) -> dict:
+        if command not in (VolumeManageAction.ATTACH, VolumeManageAction.DETACH):
+            raise ValidationError(f"volume_ids can only be used with command attach or detach, not {command}")
+        command = VolumeManageAction(command)
+        # The instance volumes are listed once to skip volumes that are already in place,
+        # the remaining requests are sent concurrently and their tasks polled in one loop.
+        volume_ids = list(dict.fromkeys(volume_ids))
+        attached = self._get_attachments([instance_id])
+        if command == VolumeManageAction.ATTACH:
+            pending = [volume_id for volume_id in volume_ids if volume_id not in attached]
+        else:
+            pending = [volume_id for volume_id in volume_ids if volume_id in attached]
+        result = {"changed": bool(pending), "data": {volume_id: attached.get(volume_id) for volume_id in volume_ids}}
+        if self.module.check_mode or not pending:
+            return result
+
+        def send(volume_id: str) -> list:
+            params = {"volume_id": volume_id, "instance_id": instance_id, "wait": False}
+            return self._execute_command(command, params)["data"]["tasks"]
+
+        errors = {}
+        task_volumes = {}
+        for volume_id, (task_ids, error) in zip(pending, run_concurrently(send, pending, max_concurrency)):
+            if error is not None:
+                errors[volume_id] = getattr(error, "message", str(error))
+                continue
+            task_volumes.update((task_id, volume_id) for task_id in task_ids)
+
+        params = self.module.params if params is None else params
+        if task_volumes and params.get("wait", True):
+            timeout = self.ACTION_CONFIG[command]["timeout"]
+            for task in self.wait_for_tasks(list(task_volumes), timeout=timeout, max_concurrency=max_concurrency):
+                if task["state"] != "FINISHED":
+                    errors[task_volumes[task["id"]]] = f"Task {task['task_type']} in state: {task['state']}"
+            attached = self._get_attachments([instance_id])
+            result["data"] = {volume_id: attached.get(volume_id) for volume_id in volume_ids}
+
+        if errors:
+            raise CloudAPIError(
+                f"{len(errors)} of {len(pending)} volumes failed to {command.value}", errors=errors, **result
+            )
+        return result
+
+    def _run_operation(self, operation: tuple) -> dict:
+        # Operations carrying I(volume_ids) attach or detach them all at once, as the module does
+        _, command, params = operation
+        if params.get("volume_ids"):
+            return self._attach_many(
+                command, params["volume_ids"], params.get("instance_id"), DEFAULT_MAX_CONCURRENCY, params
+            )
+        return super()._run_operation(operation)
+
+    @fail_on_error
+    def get_attachments(self, instance_ids: list) -> dict:
+        """Map the ID of every volume attached to one of I(instance_ids) to its attachment"""
+        return self._get_attachments(instance_ids)
+
+    def _get_attachments(self, instance_ids: list) -> dict:
+        instance_ids = list(dict.fromkeys(instance_ids))
+
+        def list_volumes(instance_id: str) -> list:
+            return self.api_client.get(self.url, query_params={"instance_id": instance_id}) or []
+
+        attachments = {}
+        for instance_id, (volumes, error) in zip(instance_ids, run_concurrently(list_volumes, instance_ids)):
+            if error is not None:
+                raise error
+            for volume in volumes:
+                for attachment in volume.get("attachments") or []:
+                    if attachment.get("server_id") == instance_id:
+                        attachments[volume["id"]] = attachment
+        return attachments
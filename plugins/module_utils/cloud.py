@@ -1,3 +1,5 @@
+from typing import Optional
+
 from ansible.module_utils.basic import AnsibleModule, env_fallback
 
 from ansible_collections.gcore.cloud.plugins.module_utils.api import CloudAPIClient
@@ -52,9 +54,33 @@ from ansible_collections.gcore.cloud.plugins.module_utils.clients.snapshot impor
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.subnet import (
     CloudSubnetClient,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.task import (
+    CloudTaskClient,
+)
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
     CloudVolumeClient,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    run_concurrently,
+)
+
+# Keys of a task's created_resources mapped to the client that can fetch them
+TASK_RESOURCE_CLIENTS = {
+    "volumes": "volumes",
+    "images": "images",
+    "instances": "instances",
+    "networks": "networks",
+    "snapshots": "snapshots",
+    "routers": "routers",
+    "subnets": "subnets",
+    "servergroups": "servergroups",
+    "ports": "reserved_fips",
+    "loadbalancers": "loadbalancers",
+    "listeners": "loadbalancer_listeners",
+    "pools": "loadbalancer_pools",
+    "secrets": "secrets",
+}
 
 
 class AnsibleCloudClient:
@@ -64,75 +90,102 @@ class AnsibleCloudClient:
 
     @property
     def volumes(self) -> CloudVolumeClient:
-        return CloudVolumeClient(self.module, "v1/volumes/")
+        return CloudVolumeClient(self.module, "v1/volumes/", self.client)
 
     @property
     def images(self) -> CloudImageClient:
-        return CloudImageClient(self.module, "v1/images/")
+        return CloudImageClient(self.module, "v1/images/", self.client)
 
     @property
     def instances(self) -> CloudInstanceClient:
-        return CloudInstanceClient(self.module, "v1/instances/")
+        return CloudInstanceClient(self.module, "v1/instances/", self.client)
 
     @property
     def networks(self) -> CloudNetworkClient:
-        return CloudNetworkClient(self.module, "v1/networks/")
+        return CloudNetworkClient(self.module, "v1/networks/", self.client)
 
     @property
     def snapshots(self) -> CloudSnapshotClient:
-        return CloudSnapshotClient(self.module, "v1/snapshots/")
+        return CloudSnapshotClient(self.module, "v1/snapshots/", self.client)
 
     @property
     def routers(self) -> CloudRouterClient:
-        return CloudRouterClient(self.module, "v1/routers/")
+        return CloudRouterClient(self.module, "v1/routers/", self.client)
 
     @property
     def subnets(self) -> CloudSubnetClient:
-        return CloudSubnetClient(self.module, "v1/subnets/")
+        return CloudSubnetClient(self.module, "v1/subnets/", self.client)
 
     @property
     def keypairs(self) -> CloudKeypairClient:
-        return CloudKeypairClient(self.module, "v1/keypairs/")
+        return CloudKeypairClient(self.module, "v1/keypairs/", self.client)
 
     @property
     def servergroups(self) -> CloudServerGroupClient:
-        return CloudServerGroupClient(self.module, "v1/servergroups/")
+        return CloudServerGroupClient(self.module, "v1/servergroups/", self.client)
 
     @property
     def lifecycle_policy(self) -> CloudLifecyclePolicyClient:
-        return CloudLifecyclePolicyClient(self.module, "v1/lifecycle_policy/")
+        return CloudLifecyclePolicyClient(self.module, "v1/lifecycle_policy/", self.client)
 
     @property
     def reserved_fips(self) -> CloudReservedFipClient:
-        return CloudReservedFipClient(self.module, "v1/reserved_fixed_ips/")
+        return CloudReservedFipClient(self.module, "v1/reserved_fixed_ips/", self.client)
 
     @property
     def securitygroups(self) -> CloudSecurityGroupClient:
-        return CloudSecurityGroupClient(self.module, "v1/securitygroups/")
+        return CloudSecurityGroupClient(self.module, "v1/securitygroups/", self.client)
 
     @property
     def securitygroup_rules(self) -> CloudSecurityGroupRuleClient:
-        return CloudSecurityGroupRuleClient(self.module, "v1/securitygroups/")
+        return CloudSecurityGroupRuleClient(self.module, "v1/securitygroups/", self.client)
 
     @property
     def loadbalancers(self) -> CloudLoadbalancerClient:
-        return CloudLoadbalancerClient(self.module, "v1/loadbalancers/")
+        return CloudLoadbalancerClient(self.module, "v1/loadbalancers/", self.client)
 
     @property
     def loadbalancer_listeners(self) -> CloudLbListenerClient:
-        return CloudLbListenerClient(self.module, "v1/lblisteners/")
+        return CloudLbListenerClient(self.module, "v1/lblisteners/", self.client)
 
     @property
     def loadbalancer_pools(self) -> CloudLbPoolClient:
-        return CloudLbPoolClient(self.module, "v1/lbpools/")
+        return CloudLbPoolClient(self.module, "v1/lbpools/", self.client)
 
     @property
     def loadbalancer_members(self) -> CloudLbPoolMemberClient:
-        return CloudLbPoolMemberClient(self.module, "v1/lbpools/")
+        return CloudLbPoolMemberClient(self.module, "v1/lbpools/", self.client)
 
     @property
     def secrets(self) -> CloudSecretClient:
-        return CloudSecretClient(self.module, "v1/secrets/")
+        return CloudSecretClient(self.module, "v1/secrets/", self.client)
+
+    @property
+    def tasks(self) -> CloudTaskClient:
+        return CloudTaskClient(self.module, "v1/tasks/", self.client)
+
+    def resolve_created_resources(self, tasks: list, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> dict:
+        """Fetch the resources created by finished tasks, keyed by resource type"""
+        ids_by_type = {}
+        for task in tasks:
+            if task["state"] != "FINISHED":
+                continue
+            for resource_type, resource_ids in (task.get("created_resources") or {}).items():
+                if resource_type in TASK_RESOURCE_CLIENTS:
+                    ids_by_type.setdefault(resource_type, []).extend(resource_ids)
+
+        # One get_many per type, so several resources of a type cost a single list request
+        def fetch(resource_type: str) -> dict:
+            return getattr(self, TASK_RESOURCE_CLIENTS[resource_type])._get_many(ids_by_type[resource_type])
+
+        created = {}
+        for resource_type, (resources, error) in zip(
+            ids_by_type, run_concurrently(fetch, list(ids_by_type), max_concurrency)
+        ):
+            if error:
+                raise error
+            created[resource_type] = [resources[resource_id] for resource_id in ids_by_type[resource_type]]
+        return created
 
     @staticmethod
     def get_api_spec() -> dict:
@@ -168,4 +221,64 @@ class AnsibleCloudClient:
                 type="str",
                 fallback=(env_fallback, ["CLOUD_REGION_NAME"]),
             ),
+            api_profile=dict(
+                type="bool",
+                fallback=(env_fallback, ["CLOUD_API_PROFILE"]),
+                default=False,
+            ),
+        )
+
+    @classmethod
+    def get_item_spec(cls, spec: dict) -> dict:
+        """Options of the module I(spec) that a single item or operation can set.
+
+        These are the options of the module, minus the API ones, with their types, choices and
+        I(no_log), but neither required nor defaulted, since the module-level values fill them in.
+        """
+        api_spec = cls.get_api_spec()
+        return {
+            name: {key: value for key, value in option.items() if key not in ("required", "default", "fallback")}
+            for name, option in spec.items()
+            if name not in api_spec
+        }
+
+    @classmethod
+    def get_bulk_spec(cls, spec: Optional[dict] = None) -> dict:
+        """Spec of I(items) and I(max_concurrency), every item being validated against the module I(spec)"""
+        options = cls.get_item_spec(spec or {})
+        items = dict(
+            type="list",
+            elements="dict",
+            required=False,
+        )
+        if options:
+            items["options"] = options
+        return dict(
+            items=items,
+            max_concurrency=dict(
+                type="int",
+                default=DEFAULT_MAX_CONCURRENCY,
+            ),
+        )
+
+    @staticmethod
+    def get_wait_spec() -> dict:
+        return dict(
+            wait=dict(
+                type="bool",
+                default=True,
+            ),
+            resolve_resources=dict(
+                type="bool",
+                default=True,
+            ),
+            wait_for_status=dict(
+                type="list",
+                elements="str",
+                required=False,
+            ),
+            wait_timeout=dict(
+                type="int",
+                default=600,
+            ),
         )
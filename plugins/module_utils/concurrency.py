@@ -0,0 +1,92 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """Call I(func) for every item on a bounded thread pool.
+
+    Returns a ``(result, error)`` pair per item, in the order of I(items).
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return func(item), None
+        except Exception as exc:
+            return None, exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items)))) as executor:
+        return list(executor.map(call, items))
+
+
+class DependencyFailed(Exception):
+    """A node of a graph was not run because one of its dependencies failed"""
+
+
+def get_graph_order(dependencies: Dict[str, Iterable[str]]) -> List[str]:
+    """Order the nodes of a graph so that every node comes after its dependencies.
+
+    Raises ValueError if a node depends on an unknown node or if the graph has a cycle.
+    """
+    pending = {name: set(deps) for name, deps in dependencies.items()}
+    for name, deps in pending.items():
+        unknown = deps - pending.keys()
+        if unknown:
+            raise ValueError(f"{name} depends on unknown {', '.join(sorted(unknown))}")
+    order = []
+    while pending:
+        ready = [name for name, deps in pending.items() if not deps - set(order)]
+        if not ready:
+            raise ValueError(f"Dependency cycle between {', '.join(sorted(pending))}")
+        order.extend(ready)
+        for name in ready:
+            del pending[name]
+    return order
+
+
+def run_graph(
+    nodes: Dict[str, Tuple[Iterable[str], Callable[[], Any]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Tuple[Any, Optional[Exception]]]:
+    """Call the function of every node once all of its dependencies succeeded.
+
+    I(nodes) maps a name to ``(dependencies, func)``. Nodes whose dependencies are done
+    run concurrently on a bounded thread pool. A failed node does not stop the others,
+    but the nodes depending on it get a DependencyFailed error instead of running.
+    Returns a ``(result, error)`` pair per node name.
+    """
+    dependencies = {name: set(deps) for name, (deps, _) in nodes.items()}
+    get_graph_order(dependencies)
+    results = {}
+    running = {}
+
+    def call(name: str):
+        try:
+            return nodes[name][1](), None
+        except Exception as exc:
+            return None, exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(nodes) or 1))) as executor:
+        while len(results) < len(nodes):
+            for name, deps in dependencies.items():
+                if name in results or name in running or not deps <= results.keys():
+                    continue
+                failed = sorted(dep for dep in deps if results[dep][1] is not None)
+                if failed:
+                    results[name] = (None, DependencyFailed(f"Not run, {', '.join(failed)} failed"))
+                else:
+                    running[name] = executor.submit(call, name)
+            if not running:
+                continue
+            done, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+            for name in [name for name, future in running.items() if future in done]:
+                results[name] = running.pop(name).result()
+    return results
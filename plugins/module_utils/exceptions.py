@@ -2,3 +2,11 @@ class ValidationError(Exception):
     def __init__(self, message: str, *args: object) -> None:
         self.message = message
         super().__init__(self.message, *args)
+
+
+class CloudAPIError(Exception):
+    def __init__(self, message: str, *args: object, status: int = None, **details) -> None:
+        self.message = message
+        self.status = status
+        self.details = details
+        super().__init__(self.message, *args)
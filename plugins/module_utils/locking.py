@@ -0,0 +1,104 @@
+import fcntl
+import hashlib
+import json
+import os
+import re
+from contextlib import contextmanager
+from tempfile import mkstemp
+from typing import Iterator, Optional
+
+# Per-user directory of the controller-local state files, only readable by its owner
+STATE_DIR = os.path.join("~", ".ansible", "tmp", "gcore_cloud")
+# Module params that tell apart the API endpoint, project and region a state file belongs to
+SCOPE_PARAMS = ("api_host", "project_id", "project_name", "region_id", "region_name")
+
+
+def get_state_dir() -> str:
+    """Create the per-user state directory if needed and return its path"""
+    path = os.path.expanduser(STATE_DIR)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    os.chmod(path, 0o700)
+    return path
+
+
+def get_state_path(name: str, params: Optional[dict] = None) -> str:
+    """Default path of a controller-local state file shared by parallel forks.
+
+    With the module I(params), the file is specific to their API host, project and region.
+    Characters of I(name) that are not safe in a file name are replaced.
+    """
+    name = re.sub(r"[^\w.-]", "_", name)
+    if params is not None:
+        scope = json.dumps([params.get(key) for key in SCOPE_PARAMS], default=str)
+        name = f"{name}_{hashlib.sha256(scope.encode()).hexdigest()[:16]}"
+    return os.path.join(get_state_dir(), f"{name}.json")
+
+
+@contextmanager
+def _open_lock_file(path: str) -> Iterator[int]:
+    fd = os.open(f"{path}.lock", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on I(path) for the duration of the block.
+
+    The lock is an advisory ``flock`` on a sibling ``.lock`` file, so it serializes
+    module runs of parallel forks on the same controller.
+    """
+    with _open_lock_file(path) as lock_fd:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def try_file_lock(path: str) -> Iterator[bool]:
+    """Like file_lock, but yield False right away instead of waiting when the lock is held elsewhere"""
+    with _open_lock_file(path) as lock_fd:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+def write_state(path: str, state: dict) -> None:
+    """Atomically replace the JSON state at I(path) with a file only readable by its owner"""
+    fd, tmp_path = mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def locked_state(path: str) -> Iterator[dict]:
+    """Read the JSON state at I(path) under lock and write it back when the block ends.
+
+    The state is written back even if the block raises, so the changes made to it
+    before the failure, e.g. resources already leased or created, are not lost.
+    """
+    with file_lock(path):
+        try:
+            with open(path) as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError):
+            state = {}
+        try:
+            yield state
+        finally:
+            write_state(path, state)
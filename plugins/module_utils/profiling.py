@@ -0,0 +1,58 @@
+import re
+from threading import Lock
+from typing import Optional
+
+# Path segments that identify one resource, folded so that requests are grouped by endpoint
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.IGNORECASE)
+
+
+def get_endpoint(method: str, url: str, path_params: Optional[str] = None) -> str:
+    """Name the endpoint of a request, such as ``GET v1/volumes/{id}``"""
+    path = "/".join(part.strip("/") for part in (url, path_params) if part)
+    segments = ["{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("/") if segment]
+    return f"{method} {'/'.join(segments)}"
+
+
+class ApiStats:
+    """Counters of the API requests and polling of one module run, safe to update from several threads"""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.requests = 0
+        self.request_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.poll_time = 0.0
+        self.endpoints = {}
+
+    def record_request(self, endpoint: str, seconds: float, bytes_sent: int, bytes_received: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.request_time += seconds
+            self.bytes_sent += bytes_sent
+            self.bytes_received += bytes_received
+            stats = self.endpoints.setdefault(
+                endpoint, {"requests": 0, "request_time": 0.0, "bytes_sent": 0, "bytes_received": 0}
+            )
+            stats["requests"] += 1
+            stats["request_time"] += seconds
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+
+    def record_poll(self, seconds: float) -> None:
+        with self._lock:
+            self.poll_time += seconds
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "request_time": round(self.request_time, 3),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "poll_time": round(self.poll_time, 3),
+                "endpoints": {
+                    endpoint: dict(stats, request_time=round(stats["request_time"], 3))
+                    for endpoint, stats in self.endpoints.items()
+                },
+            }
@@ -0,0 +1,258 @@
+from typing import Optional
+
+from ansible_collections.gcore.cloud.plugins.module_utils.batch import (
+    BatchRunner,
+    get_dependencies,
+    get_graph_response,
+    resolve_references,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    get_graph_order,
+    run_concurrently,
+    run_graph,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+
+# Resource clients with a STATE_CONFIG, which a stack can converge and destroy
+STACK_RESOURCES = (
+    "networks",
+    "subnets",
+    "routers",
+    "securitygroups",
+    "keypairs",
+    "servergroups",
+    "volumes",
+    "snapshots",
+    "lifecycle_policy",
+    "loadbalancers",
+    "loadbalancer_listeners",
+    "loadbalancer_pools",
+    "secrets",
+)
+
+
+class PlanAction:
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    NONE = "none"
+
+
+def get_dependents(dependencies: dict, names: set) -> dict:
+    """Map each of I(names) to the I(names) that depend on it, directly or through other nodes"""
+    dependents = {name: set() for name in names}
+    for name in dependencies:
+        pending = list(dependencies[name])
+        seen = set()
+        while pending:
+            dependency = pending.pop()
+            if dependency in seen or dependency not in dependencies:
+                continue
+            seen.add(dependency)
+            pending.extend(dependencies[dependency])
+        if name in names:
+            for dependency in seen & names:
+                dependents[dependency].add(name)
+    return dependents
+
+
+class StackRunner:
+    """Converge a whole topology of resources with as few requests and as much concurrency as possible.
+
+    A stack is a list of resources shaped like the operations of BatchRunner, minus the
+    command and state. Planning lists every resource type of the stack once, matches the
+    resources by the ID recorded by a previous run or by name, and decides per resource
+    whether to create, update, delete it or leave it alone. A recorded resource that left
+    the stack is only deleted if it still has the name it was recorded with. Applying
+    runs the plan as a dependency graph, destroying in reverse dependency order.
+    """
+
+    def __init__(self, api: AnsibleCloudClient, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self.runner = BatchRunner(api, max_concurrency)
+
+    def fetch(self, resource_types: set) -> dict:
+        """List every resource of the given types, one paged list per type"""
+        resource_types = sorted(resource_types)
+
+        def fetch_type(resource_type: str) -> list:
+            client = getattr(self.api, resource_type)
+            return client.api_client.get_all(client.url)
+
+        current = {}
+        for resource_type, (resources, error) in zip(
+            resource_types, run_concurrently(fetch_type, resource_types, self.max_concurrency)
+        ):
+            if error:
+                raise error
+            current[resource_type] = resources
+        return current
+
+    def plan(self, state: str, resources: list, recorded: Optional[dict] = None) -> dict:
+        """Compute what to do with every resource of the stack and every recorded one left out of it.
+
+        I(recorded) maps resource names to the C(resource), C(id), C(name) and C(depends_on)
+        saved by a previous apply. Returns the plan as an ordered dict of name to C(resource), C(action),
+        C(id), C(depends_on), C(changes) and the C(current) resource.
+        """
+        recorded = recorded or {}
+        for resource in resources:
+            if resource["resource"] not in STACK_RESOURCES:
+                raise ValidationError(f"Resource {resource['name']} has unsupported type {resource['resource']}")
+        dependencies = get_dependencies([dict(resource, state=state) for resource in resources])
+        desired = {resource["name"]: resource for resource in resources}
+        removed = {name: record for name, record in recorded.items() if name not in desired}
+        current = self.fetch(
+            {resource["resource"] for resource in resources} | {record["resource"] for record in removed.values()}
+        )
+
+        plan = {}
+        known = {}
+        for name in get_graph_order(dependencies):
+            resource = desired[name]
+            client = getattr(self.api, resource["resource"])
+            params = resource.get("params") or {}
+            try:
+                resolved = resolve_references(params, known)
+            except ValidationError:
+                resolved = None
+            found = self._match(client, resolved, recorded.get(name), current[resource["resource"]])
+            if found:
+                known[name] = found
+
+            changes = []
+            if state == "absent":
+                action = PlanAction.DELETE if found else PlanAction.NONE
+            elif not found:
+                action = PlanAction.CREATE
+            elif resolved is None:
+                action = PlanAction.UPDATE
+            else:
+                changes = [
+                    getattr(command, "value", command)
+                    for command, _ in client._plan_changes("present", resolved, found)
+                ]
+                action = PlanAction.UPDATE if changes else PlanAction.NONE
+            plan[name] = self._get_plan_item(client, resource["resource"], action, found, dependencies[name], changes)
+
+        for name, record in removed.items():
+            client = getattr(self.api, record["resource"])
+            found = self._find_by_id(client, current[record["resource"]], record.get("id"))
+            # The ID may have been reused or the resource taken over since, leave it alone then
+            if found and found.get(client.STATE_CONFIG.get("name_field", "name")) != record.get("name"):
+                found = None
+            action = PlanAction.DELETE if found else PlanAction.NONE
+            plan[name] = self._get_plan_item(client, record["resource"], action, found, record.get("depends_on"))
+        return plan
+
+    @staticmethod
+    def _get_plan_item(client, resource_type, action, found, depends_on, changes=None) -> dict:
+        return {
+            "resource": resource_type,
+            "action": action,
+            "id": found[client.STATE_CONFIG.get("id_field", "id")] if found else None,
+            "depends_on": sorted(depends_on or []),
+            "changes": changes or [],
+            "current": found,
+        }
+
+    def _match(self, client, resolved: Optional[dict], record: Optional[dict], resources: list) -> Optional[dict]:
+        found = self._find_by_id(client, resources, (record or {}).get("id"))
+        if found or resolved is None:
+            return found
+        # The list filters of the per-resource lookup are applied here to the bulk list
+        filters = {
+            field: resolved[param]
+            for field, param in client.STATE_CONFIG.get("list_filters", {}).items()
+            if resolved.get(param) is not None
+        }
+        candidates = [
+            resource
+            for resource in resources
+            if all(resource.get(field, value) == value for field, value in filters.items())
+        ]
+        return client._find_by_name(candidates, resolved)
+
+    @staticmethod
+    def _find_by_id(client, resources: list, resource_id: Optional[str]) -> Optional[dict]:
+        if not resource_id:
+            return None
+        id_field = client.STATE_CONFIG.get("id_field", "id")
+        return next((resource for resource in resources if resource.get(id_field) == resource_id), None)
+
+    def apply(self, plan: dict, resources: list) -> dict:
+        """Run a plan of the given stack resources, then delete the resources that left the stack"""
+        desired = {resource["name"]: resource for resource in resources}
+        self.runner.resources.update(
+            {name: item["current"] for name, item in plan.items() if name in desired and item["current"]}
+        )
+        dependencies = {name: item["depends_on"] for name, item in plan.items()}
+        outcomes = {}
+
+        changes = {
+            name: (dependencies[name], self._make_change(name, item, desired[name]))
+            for name, item in plan.items()
+            if name in desired and item["action"] != PlanAction.DELETE
+        }
+        if changes:
+            outcomes.update(run_graph(changes, self.max_concurrency))
+
+        deletes = {name for name, item in plan.items() if item["action"] == PlanAction.DELETE}
+        dependents = get_dependents(dependencies, deletes)
+        nodes = {name: (dependents[name], self._make_delete(plan[name])) for name in deletes}
+        if nodes:
+            outcomes.update(run_graph(nodes, self.max_concurrency))
+        for name, item in plan.items():
+            if name not in outcomes:
+                outcomes[name] = ({"changed": False, "data": None}, None)
+        return get_graph_response({name: outcomes[name] for name in plan})
+
+    def _make_change(self, name: str, item: dict, resource: dict):
+        def run() -> dict:
+            result = {"changed": False, "data": item["current"]}
+            if item["action"] != PlanAction.NONE:
+                client = getattr(self.api, item["resource"])
+                params = resolve_references(resource.get("params") or {}, self.runner.resources)
+                for command, command_params in client._plan_changes("present", params, item["current"]):
+                    result = self.runner.run_operation(item["resource"], None, command, command_params)
+            self.runner.resources[name] = result.get("data") or item["current"]
+            return result
+
+        return run
+
+    def _make_delete(self, item: dict):
+        def run() -> dict:
+            client = getattr(self.api, item["resource"])
+            result = {"changed": False, "data": None}
+            for command, command_params in client._plan_changes("absent", {}, item["current"]):
+                result = self.runner.run_operation(item["resource"], None, command, command_params)
+            return result
+
+        return run
+
+    def get_records(self, plan: dict, response: dict, recorded: Optional[dict] = None) -> dict:
+        """Record the ID of every resource of the stack after applying a plan, for the next plan to match"""
+        records = dict(recorded or {})
+        for name, item in plan.items():
+            result = response["results"].get(name) or {}
+            if result.get("failed") or result.get("skipped"):
+                continue
+            data = result.get("data") or item["current"]
+            if item["action"] == PlanAction.DELETE or not data:
+                records.pop(name, None)
+                continue
+            config = getattr(self.api, item["resource"]).STATE_CONFIG
+            records[name] = {
+                "resource": item["resource"],
+                "id": item["id"] or data.get(config.get("id_field", "id")),
+                "name": data.get(config.get("name_field", "name")),
+                "depends_on": item["depends_on"],
+            }
+        return records
@@ -0,0 +1,94 @@
+from ipaddress import ip_address, ip_network
+from typing import Optional
+
+# Resource types of the topology, keyed by the AnsibleCloudClient property listing them
+TOPOLOGY_RESOURCES = ("networks", "subnets", "routers", "reserved_fips", "securitygroups", "instances")
+
+
+def project(resource: dict, fields: Optional[list]) -> dict:
+    """Keep only I(fields) of a resource, and always its ID"""
+    if not fields:
+        return dict(resource)
+    return {field: resource[field] for field in ["id", *fields] if field in resource}
+
+
+def build_topology(resources: dict, fields: Optional[dict] = None) -> dict:
+    """Join listed resources into a graph indexed by ID.
+
+    I(resources) maps every type of TOPOLOGY_RESOURCES that was fetched to its list.
+    Networks, subnets, routers, ports and instances reference each other by ID through
+    the ``subnets``, ``routers``, ``ports``, ``instances`` and ``networks`` keys; reserved
+    fixed IPs are indexed by port ID under ``ports``.
+    """
+    fields = fields or {}
+    graph = {}
+    for resource_type, key in (
+        ("networks", "id"),
+        ("subnets", "id"),
+        ("routers", "id"),
+        ("reserved_fips", "port_id"),
+        ("securitygroups", "id"),
+        ("instances", "id"),
+    ):
+        if resource_type in resources:
+            name = "ports" if resource_type == "reserved_fips" else resource_type
+            graph[name] = {item[key]: project(item, fields.get(name)) for item in resources[resource_type] or []}
+
+    networks = graph.get("networks", {})
+    subnets = graph.get("subnets", {})
+    for network in networks.values():
+        network.update(subnets=[], routers=[], ports=[], instances=[])
+    for subnet in subnets.values():
+        subnet.update(routers=[], ports=[], instances=[])
+
+    def link(index: dict, resource_id: Optional[str], key: str, value: str) -> None:
+        if resource_id in index and value not in index[resource_id][key]:
+            index[resource_id][key].append(value)
+
+    subnet_networks = {}
+    for subnet in resources.get("subnets") or []:
+        subnet_networks[subnet["id"]] = subnet.get("network_id")
+        link(networks, subnet.get("network_id"), "subnets", subnet["id"])
+
+    for router in resources.get("routers") or []:
+        router_subnets = []
+        for interface in router.get("interfaces") or []:
+            subnet_id = interface.get("subnet_id")
+            if subnet_id is None:
+                continue
+            router_subnets.append(subnet_id)
+            link(subnets, subnet_id, "routers", router["id"])
+            link(networks, interface.get("network_id") or subnet_networks.get(subnet_id), "routers", router["id"])
+        if "routers" in graph:
+            graph["routers"][router["id"]]["subnets"] = router_subnets
+
+    for port in resources.get("reserved_fips") or []:
+        link(subnets, port.get("subnet_id"), "ports", port["port_id"])
+        link(networks, port.get("network_id"), "ports", port["port_id"])
+
+    # Instances only report their addresses per network name, subnets are found by CIDR
+    network_names = {network.get("name"): network["id"] for network in resources.get("networks") or []}
+    subnet_ranges = [
+        (ip_network(subnet["cidr"], strict=False), subnet["id"])
+        for subnet in resources.get("subnets") or []
+        if subnet.get("cidr")
+    ]
+    for instance in resources.get("instances") or []:
+        instance_networks = []
+        for network_name, addresses in (instance.get("addresses") or {}).items():
+            network_id = network_names.get(network_name)
+            if network_id:
+                instance_networks.append(network_id)
+                link(networks, network_id, "instances", instance["id"])
+            for address in addresses or []:
+                try:
+                    addr = ip_address(address.get("addr"))
+                except ValueError:
+                    continue
+                for subnet_range, subnet_id in subnet_ranges:
+                    if addr in subnet_range and subnet_networks.get(subnet_id) in (network_id, None):
+                        link(subnets, subnet_id, "instances", instance["id"])
+        if "instances" in graph:
+            graph["instances"][instance["id"]]["networks"] = instance_networks
+
+    return graph
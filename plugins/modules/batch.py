@@ -0,0 +1,225 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: batch
+author:
+    - GCore (@GCore)
+short_description: Run dependent operations on GCore Cloud resources concurrently.
+description:
+    - Run a list of operations on any GCore Cloud resource in a single task.
+    - Operations reference the resources returned by other operations, for example C(ops.net1.id) for the
+      ID of the resource of the operation named C(net1). Every operation waits for the operations it
+      references or lists in I(depends_on), and independent operations run at the same time.
+    - All operations share one API client, so their task waits overlap.
+    - Writes to the same loadbalancer, its listeners, pools and members run one at a time,
+      each waiting for the loadbalancer to be ACTIVE.
+    - A failed operation does not stop the others, but the operations depending on it are skipped.
+
+options:
+    operations:
+        description:
+            - Operations to run.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            name:
+                description:
+                    - Unique name of the operation, used to reference its resource.
+                type: str
+                required: true
+            resource:
+                description:
+                    - Type of resource the operation runs on.
+                type: str
+                required: true
+                choices: [networks, subnets, routers, reserved_fips, securitygroups, securitygroup_rules, keypairs,
+                          servergroups, images, volumes, snapshots, lifecycle_policy, instances, loadbalancers,
+                          loadbalancer_listeners, loadbalancer_pools, loadbalancer_members, secrets]
+            command:
+                description:
+                    - Command to run, as the I(command) option of the module managing this type of resource.
+                    - Mutually exclusive with I(state).
+                type: str
+            state:
+                description:
+                    - State to converge to, as the I(state) option of the module managing this type of resource.
+                    - Mutually exclusive with I(command).
+                type: str
+                choices: [present, absent]
+            params:
+                description:
+                    - Options of the module managing this type of resource, except the API ones.
+                    - The defaults of that module are not applied, options left out take the API defaults.
+                    - Once references are resolved, params are validated against the options of that module, with
+                      their types and choices; unknown options fail the operation and I(no_log) ones are masked.
+                    - Operations run the same special paths as the module, e.g. I(members) replaces the members of a
+                      pool and I(volume_ids) attaches volumes in one go. I(cidr_allocate) and I(quota_admission)
+                      are not supported.
+                    - Strings may hold references like C({{ ops.net1.id }}) to the resource of another operation,
+                      with C(.key) and C([index]) steps. Mark them C(!unsafe) so that Ansible does not template
+                      them. A string that is a single reference takes the type of the referenced value.
+                type: dict
+                default: {}
+            depends_on:
+                description:
+                    - Names of operations to wait for, besides the referenced ones.
+                type: list
+                elements: str
+                default: []
+    max_concurrency:
+        description:
+            - Maximum number of operations running at the same time.
+        type: int
+        default: 10
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+"""
+
+EXAMPLES = """
+- name: Build a network, its subnet, a router and an instance
+  gcore.cloud.batch:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    operations:
+      - name: net
+        resource: networks
+        command: create
+        params:
+          name: app-net
+      - name: subnet
+        resource: subnets
+        command: create
+        params:
+          name: app-subnet
+          network_id: !unsafe "{{ ops.net.id }}"
+          cidr: 192.168.10.0/24
+      - name: router
+        resource: routers
+        command: create
+        params:
+          name: app-router
+          interfaces:
+            - type: subnet
+              subnet_id: !unsafe "{{ ops.subnet.id }}"
+      - name: sg
+        resource: securitygroups
+        command: create
+        params:
+          security_group:
+            name: app-sg
+      - name: vm
+        resource: instances
+        command: create
+        depends_on: [router]
+        params:
+          names: [app-1]
+          flavor: g1-standard-1-2
+          volumes:
+            - source: image
+              image_id: 55d662eb-b2d5-4b3c-bc84-a2265e25c86e
+              size: 10
+              boot_index: 0
+          interfaces:
+            - type: subnet
+              network_id: !unsafe "{{ ops.net.id }}"
+              subnet_id: !unsafe "{{ ops.subnet.id }}"
+          security_groups:
+            - id: !unsafe "{{ ops.sg.id }}"
+  register: env
+
+- name: Show the network ID
+  ansible.builtin.debug:
+    msg: "{{ env.results.net.data.id }}"
+"""
+
+RETURN = """
+results:
+    description:
+        - Result of every operation, by operation name.
+        - Operations skipped because an operation they depend on failed have I(skipped) set.
+    returned: always
+    type: dict
+    sample: {
+        'net': {'changed': True, 'data': {'id': '726ecfcc-7fd0-4e30-a86e-7892524aa483', 'name': 'app-net'}},
+        'subnet': {'changed': False, 'failed': True, 'msg': 'Failed to perfom operation'},
+        'router': {'changed': False, 'skipped': True, 'msg': 'Not run, subnet failed'},
+    }
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.batch import (
+    BATCH_RESOURCES,
+    BatchRunner,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+
+
+def manage(module: AnsibleModule):
+    runner = BatchRunner(AnsibleCloudClient(module), module.params["max_concurrency"])
+    try:
+        result = runner.run(module.params["operations"])
+    except ValidationError as exc:
+        module.fail_json(msg=exc.message)
+    if result.get("failed"):
+        module.fail_json(**result)
+    module.exit_json(**result)
+
+
+def main():
+    module_spec = dict(
+        operations=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=True),
+                resource=dict(type="str", required=True, choices=list(BATCH_RESOURCES)),
+                command=dict(type="str"),
+                state=dict(type="str", choices=["present", "absent"]),
+                params=dict(type="dict", default={}),
+                depends_on=dict(type="list", elements="str", default=[]),
+            ),
+            mutually_exclusive=[("command", "state")],
+            required_one_of=[("command", "state")],
+        ),
+        max_concurrency=dict(type="int", default=10),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        supports_check_mode=False,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -19,8 +19,9 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if I(items) is not passed.
         choices: [create, update, download, delete]
-        required: true
+        required: false
         type: str
     image_id:
         description:
@@ -113,6 +114,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -302,14 +305,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.image import (
-    ImageManageAction,
-)
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.image import (
-    HwMachineType,
-    ImageArchitectureType,
-    ImageHwFirmwareType,
-    ImageOsType,
-    SshKey,
+    CloudImageClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -319,30 +315,21 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.images.execute_command(command=command)
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.images.execute_many(items, command=command, max_concurrency=max_concurrency)
+    else:
+        result = api.images.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(ImageManageAction), required=True),
-        image_id=dict(type="str", required=False),
-        volume_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        url=dict(type="str", required=False),
-        ssh_key=dict(type="str", choices=list(SshKey), required=False),
-        is_baremetal=dict(type="bool", required=False),
-        os_type=dict(type="str", choices=list(ImageOsType), required=False),
-        hw_firmware_type=dict(type="str", choices=list(ImageHwFirmwareType), required=False),
-        hw_machine_type=dict(type="str", choices=list(HwMachineType), required=False),
-        architecture=dict(type="str", choices=list(ImageArchitectureType), required=False),
-        cow_format=dict(type="bool", required=False),
-        os_distro=dict(type="str", required=False),
-        os_version=dict(type="str", required=False),
-        metadata=dict(type="dict", required=False),
-    )
+    module_spec = CloudImageClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
@@ -352,6 +339,7 @@ def main():
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "items"),
         ],
         supports_check_mode=True,
     )
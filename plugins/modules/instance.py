@@ -19,8 +19,9 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if I(items) is not passed.
         choices: [create, update, delete, start, stop, powercycle, reboot, suspend, resume, add_to_servergroup, remove_from_servergroup]
-        required: true
+        required: false
         type: str
     instance_id:
         description:
@@ -152,8 +153,26 @@ options:
             - Optional if I(command) is start.
         type: bool
         required: false
+    quota_admission:
+        description:
+            - With I(items) and I(command=create), check the quota before starting any instance.
+            - The whole batch is checked with one C(check_limits) request. If it does not fit, only the largest
+              part of the items that fits is created. The remaining items are checked again once these creates
+              are accepted, so they only start if quota was released meanwhile, e.g. by other forks.
+            - Creates started by other forks of the same controller and not finished yet are accounted for
+              through a local ledger file per API host, project and region.
+            - C(check_limits) takes one flavor, volumes and interfaces shape per request, so a shape is only
+              admitted once the creates of other shapes in the ledger are done, and its check covers every
+              create in flight.
+            - Items that do not fit the quota are reported as failed without being started.
+            - Disabled by default, in which case every item is sent and the API rejects the ones over quota.
+        type: bool
+        default: false
+        required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -210,13 +229,14 @@ EXAMPLES = """
     command: stop
     instance_id: "{{ instance_id }}"
 
-- name: Start instance
+- name: Start instance and wait until it is active
   gcore.cloud.instance:
     api_key: "{{ api_key }}"
     region_id: "{{ region_id }}"
     project_id: "{{ project_id }}"
     command: start
     instance_id: "{{ instance_id }}"
+    wait_for_status: [ACTIVE]
 
 - name: Powercycle instance
   gcore.cloud.instance:
@@ -427,118 +447,39 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.instance import (
+    CloudInstanceClient,
     InstanceManageAction,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+)
 
 
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.instances.execute_command(command=command)
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    quota_admission = module.params.pop("quota_admission")
+    if items and command == InstanceManageAction.CREATE and quota_admission:
+        ledger_path = get_state_path("instance_admission", module.params)
+        result = api.instances.create_in_waves(items, ledger_path, max_concurrency=max_concurrency)
+    elif items:
+        result = api.instances.execute_many(items, command=command, max_concurrency=max_concurrency)
+    else:
+        result = api.instances.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(InstanceManageAction),
-            required=True,
-        ),
-        flavor=dict(
-            type="str",
-            required=False,
-        ),
-        keypair_name=dict(
-            type="str",
-            required=False,
-        ),
-        user_data=dict(
-            type="str",
-            required=False,
-        ),
-        username=dict(
-            type="str",
-            required=False,
-        ),
-        password=dict(
-            type="str",
-            no_log=True,
-            required=False,
-        ),
-        instance_id=dict(
-            type="str",
-            required=False,
-        ),
-        names=dict(
-            type="list",
-            elements="str",
-            required=False,
-        ),
-        name_templates=dict(
-            type="list",
-            elements="str",
-            required=False,
-        ),
-        interfaces=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        metadata=dict(
-            type="dict",
-            required=False,
-        ),
-        volumes=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        security_groups=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        configuration=dict(
-            type="dict",
-            required=False,
-        ),
-        allow_app_ports=dict(
-            type="bool",
-            required=False,
-        ),
-        servergroup_id=dict(
-            type="str",
-            required=False,
-        ),
-        floatings=dict(
-            type="list",
-            elements="str",
-            required=False,
-        ),
-        reserved_fixed_ips=dict(
-            type="list",
-            elements="str",
-            required=False,
-        ),
-        activate_profile=dict(
-            type="bool",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        volumes_to_delete=dict(
-            type="str",
-            required=False,
-        ),
-    )
+    module_spec = CloudInstanceClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
@@ -548,6 +489,7 @@ def main():
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "items"),
         ],
         supports_check_mode=True,
     )
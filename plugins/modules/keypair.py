@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, delete, share]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the keypair.
+            - The keypair is looked up by I(keypair_id) or, if it is not passed, by I(sshkey_name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     keypair_id:
         description:
             - The ID of keypair
@@ -48,6 +58,7 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
 """
 
 EXAMPLES = """
@@ -84,6 +95,15 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     keypair_id: "{{ keypair_id }}"
+
+- name: Ensure keypair exists
+  gcore.cloud.keypair:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    sshkey_name: test-keypair
+    public_key: "{{ public_key }}"
 """
 
 RETURN = """
@@ -155,7 +175,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.keypair import (
-    KeypairManageAction,
+    CloudKeypairClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -165,29 +185,34 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.keypairs.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.keypairs.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.keypairs.reconcile(state=state)
+    else:
+        result = api.keypairs.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(KeypairManageAction), required=True),
-        keypair_id=dict(type="str", required=False),
-        shared_in_project=dict(type="bool", required=False),
-        sshkey_name=dict(type="str", required=False),
-        public_key=dict(type="str", required=False),
-    )
+    module_spec = CloudKeypairClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
@@ -21,9 +21,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete, add_schedules, remove_schedules, add_volumes, remove_volumes]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the lifecycle policy.
+            - The lifecycle policy is looked up by I(lifecycle_policy_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     lifecycle_policy_id:
         description:
             - Lifecycle policy ID.
@@ -42,9 +52,27 @@ options:
             - Ids of volumes which should be archived.
             - Used if I(command) is create.
             - Required if I(command) is add_volumes or remove_volumes.
+            - With I(state=present), the exact set of volumes of the policy. After the policy is looked up, it is
+              read once more with its volumes and only the missing or extra volumes are added or removed, in
+              chunks of I(volumes_chunk_size). A new policy is created with the first chunk.
         type: list
         elements: str
         required: false
+    volume_selector:
+        description:
+            - With I(state=present), the volumes of the policy are the ones returned by the volume list with
+              these filters, e.g. I(metadata_kv) or I(instance_id). Every page of the list is read.
+            - Unknown or empty filters are rejected rather than selecting every volume.
+            - Only valid with I(state=present), for the module and for every item using it.
+            - Mutually exclusive with I(volume_ids).
+        type: dict
+        required: false
+    volumes_chunk_size:
+        description:
+            - Maximum number of volume IDs sent in one add or remove request when I(state=present).
+        type: int
+        default: 100
+        required: false
     schedules:
         description:
             - Schedules.
@@ -76,6 +104,7 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
 """
 
 EXAMPLES = """
@@ -140,6 +169,27 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     lifecycle_policy_id: "{{ lifecycle_policy_id }}"
+
+- name: Ensure lifecycle policy exists
+  gcore.cloud.lifecycle_policy:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-policy
+    action: volume_snapshot
+    status: active
+
+- name: Ensure lifecycle policy covers every volume marked for backup
+  gcore.cloud.lifecycle_policy:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: backup-policy
+    action: volume_snapshot
+    volume_selector:
+      metadata_kv: '{"backup": "true"}'
 """
 
 RETURN = """
@@ -207,12 +257,11 @@ from traceback import format_exc
 
 from ansible.module_utils.basic import AnsibleModule, to_native
 
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.lifecycle_policy import (
-    LifecyclePolicyManageAction,
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    ResourceState,
 )
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.lifecycle_policy import (
-    LifecyclePolicyAction,
-    LifecyclePolicyStatus,
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.lifecycle_policy import (
+    CloudLifecyclePolicyClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -222,24 +271,31 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.lifecycle_policy.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if module.params["volume_selector"] is not None and state != ResourceState.PRESENT:
+        module.fail_json(msg="volume_selector can only be used with state=present")
+    if items:
+        result = api.lifecycle_policy.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.lifecycle_policy.reconcile_volumes(state=state)
+    else:
+        result = api.lifecycle_policy.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(LifecyclePolicyManageAction), required=True),
-        lifecycle_policy_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        volume_ids=dict(type="list", elements="str", required=False),
-        schedules=dict(type="list", elements="dict", required=False),
-        schedule_ids=dict(type="list", elements="str", required=False),
-        action=dict(type="str", choices=list(LifecyclePolicyAction), required=False),
-        status=dict(type="str", choices=list(LifecyclePolicyStatus), required=False),
-    )
+    module_spec = CloudLifecyclePolicyClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
-    module = AnsibleModule(argument_spec=spec, supports_check_mode=True)
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[("command", "state"), ("volume_ids", "volume_selector")],
+        required_one_of=[("command", "state", "items")],
+        supports_check_mode=True,
+    )
     try:
         manage(module)
     except Exception as exc:
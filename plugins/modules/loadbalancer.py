@@ -14,14 +14,26 @@ author:
 short_description: Manages loadblancers
 description:
     - Create, update or delete loadbalancer
+    - With I(items), changes to the same loadbalancer are applied one at a time, each one after the loadbalancer
+      is C(ACTIVE) again, while different loadbalancers are changed in parallel.
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the loadbalancer.
+            - The loadbalancer is looked up by I(loadbalancer_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     loadbalancer_id:
         description:
             - Loadbalancer Id.
@@ -96,6 +108,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -123,6 +137,15 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     loadbalancer_id: "{{ loadbalancer_id }}"
+
+- name: Ensure loadbalancer exists
+  gcore.cloud.loadbalancer:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-loadbalancer
+    flavor: lb1-1-2
 """
 
 RETURN = """
@@ -331,7 +354,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer import (
-    LoadbalancerManageAction,
+    CloudLoadbalancerClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -341,36 +364,35 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.loadbalancers.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.loadbalancers.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.loadbalancers.reconcile(state=state)
+    else:
+        result = api.loadbalancers.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(LoadbalancerManageAction), required=True),
-        loadbalancer_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        name_template=dict(type="str", required=False),
-        flavor=dict(type="str", required=False),
-        listeners=dict(type="list", elements="dict", required=False),
-        vip_network_id=dict(type="str", required=False),
-        vip_subnet_id=dict(type="str", required=False),
-        vip_port_id=dict(type="str", required=False),
-        floating_ip=dict(type="dict", required=False),
-        metadata=dict(type="dict", required=False),
-        logging=dict(type="dict", required=False),
-    )
+    module_spec = CloudLoadbalancerClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
@@ -14,14 +14,26 @@ author:
 short_description: Manages loadbalancer listeners.
 description:
     - Create, update or delete loadbalancer listener.
+    - With I(items), changes to the same loadbalancer are applied one at a time, each one after the loadbalancer
+      is C(ACTIVE) again, while different loadbalancers are changed in parallel.
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the listener.
+            - The listener is looked up by I(loadbalancer_listener_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     loadbalancer_listener_id:
         description:
             - Loadbalancer Id.
@@ -90,6 +102,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -120,6 +134,17 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     loadbalancer_listener_id: "{{ loadbalancer_listener_id }}"
+
+- name: Ensure listener exists
+  gcore.cloud.loadbalancer_listener:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-listener
+    loadbalancer_id: "{{ loadbalancer_id }}"
+    protocol: TCP
+    protocol_port: 80
 """
 
 RETURN = """
@@ -226,10 +251,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_listener import (
-    LbListenerManageAction,
-)
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer_listener import (
-    LbListenerProtocol,
+    CloudLbListenerClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -239,34 +261,37 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.loadbalancer_listeners.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.loadbalancer_listeners.execute_many(
+            items, command=command, state=state, max_concurrency=max_concurrency
+        )
+    elif state:
+        result = api.loadbalancer_listeners.reconcile(state=state)
+    else:
+        result = api.loadbalancer_listeners.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(LbListenerManageAction), required=True),
-        loadbalancer_listener_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        protocol=dict(type="str", choices=list(LbListenerProtocol), required=False),
-        protocol_port=dict(type="int", required=False),
-        loadbalancer_id=dict(type="str", required=False),
-        insert_x_forwarded=dict(type="bool", required=False),
-        secret_id=dict(type="str", required=False),
-        allowed_cidrs=dict(type="list", elements="str", required=False),
-        sni_secret_id=dict(type="list", elements="str", required=False),
-    )
+    module_spec = CloudLbListenerClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
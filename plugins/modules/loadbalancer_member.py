@@ -14,20 +14,39 @@ author:
 short_description: Manages loadbalancer members.
 description:
     - Create, delete loadbalancer members.
+    - With I(items), changes to the same loadbalancer are applied one at a time, each one after the loadbalancer
+      is C(ACTIVE) again, while different loadbalancers are changed in parallel.
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(items) nor I(members) is passed.
         choices: [create, delete]
-        required: true
+        required: false
         type: str
     loadbalancer_pool_id:
         description:
             - Loadbalancer pool ID.
-            - Required if I(command) is create or delete.
+            - Required if I(command) is create or delete, or I(members) is passed.
         type: str
         required: false
+    members:
+        description:
+            - Desired members of the pool I(loadbalancer_pool_id).
+            - Each member accepts the same keys as a single member, at least I(address) and I(protocol_port).
+            - Members are matched on address and port; I(weight) and the other keys are updated in place.
+            - All changes are pushed as a single pool update, and the loadbalancer is awaited once
+              for C(ACTIVE) when I(wait) is true.
+        type: list
+        elements: dict
+    purge_members:
+        description:
+            - Remove the members of the pool that are not listed in I(members).
+            - If C(false), members are only added or updated.
+        type: bool
+        default: true
+        required: false
     loadbalancer_pool_member_id:
         description:
             - Loadbalancer pool ID.
@@ -96,6 +115,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -117,6 +138,19 @@ EXAMPLES = """
     command: delete
     loadbalancer_pool_id: "{{ loadbalancer_pool_id }}"
     loadbalancer_pool_member_id: "{{ loadbalancer_pool_member_id }}"
+
+- name: Keep pool members in sync
+  gcore.cloud.loadbalancer_member:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    loadbalancer_pool_id: "{{ loadbalancer_pool_id }}"
+    members:
+      - address: 192.168.40.33
+        protocol_port: 80
+        weight: 2
+      - address: 192.168.40.34
+        protocol_port: 80
 """
 
 RETURN = """
@@ -125,6 +159,7 @@ loadbalancer_member:
         - Response depends of I(command).
         - If I(command) is create then response will loadbalancer pool.
         - If I(command) is delete then response will be a dict of resource ID.
+        - With I(members), a dictionary with the C(added) and C(updated) members and the C(removed) member IDs.
     returned: always
     type: complex
     contains:
@@ -230,7 +265,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_member import (
-    LbPoolMemeberManageAction,
+    CloudLbPoolMemberClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -240,38 +275,42 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.loadbalancer_members.execute_command(command=command)
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    members = module.params.pop("members")
+    if members is not None:
+        result = api.loadbalancer_members.sync(
+            module.params["loadbalancer_pool_id"],
+            members,
+            purge=module.params["purge_members"],
+        )
+    elif items:
+        result = api.loadbalancer_members.execute_many(items, command=command, max_concurrency=max_concurrency)
+    else:
+        result = api.loadbalancer_members.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(LbPoolMemeberManageAction), required=True),
-        loadbalancer_pool_id=dict(type="str", required=False),
-        loadbalancer_pool_member_id=dict(type="str", required=False),
-        protocol_port=dict(type="int", required=False),
-        address=dict(type="str", required=False),
-        subnet_id=dict(type="str", required=False),
-        instance_id=dict(type="str", required=False),
-        admin_state_up=dict(type="bool", required=False),
-        weight=dict(type="int", required=False),
-        monitor_address=dict(type="str", required=False),
-        monitor_port=dict(type="int", required=False),
-        id=dict(type="str", required=False),
-        operating_status=dict(type="str", required=False),
-    )
+    module_spec = CloudLbPoolMemberClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "members"),
+            ("items", "members"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "items", "members"),
         ],
+        required_by={"members": "loadbalancer_pool_id"},
         supports_check_mode=True,
     )
     try:
@@ -14,14 +14,26 @@ author:
 short_description: Manages loadbalancer pools.
 description:
     - Create, update, delete loadbalancer pools.
+    - With I(items), changes to the same loadbalancer are applied one at a time, each one after the loadbalancer
+      is C(ACTIVE) again, while different loadbalancers are changed in parallel.
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the pool.
+            - The pool is looked up by I(loadbalancer_pool_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     loadbalancer_pool_id:
         description:
             - Loadbalancer pool ID.
@@ -114,6 +126,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -158,6 +172,18 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     loadbalancer_pool_id: "{{ loadbalancer_pool_id }}"
+
+- name: Ensure pool exists
+  gcore.cloud.loadbalancer_pool:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-pool
+    loadbalancer_id: "{{ loadbalancer_id }}"
+    listener_id: "{{ listener_id }}"
+    lb_algorithm: ROUND_ROBIN
+    protocol: TCP
 """
 
 RETURN = """
@@ -276,11 +302,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_pool import (
-    LbPoolManageAction,
-)
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.loadbalancer_pool import (
-    LbPoolAlgorithm,
-    LbPoolProtocol,
+    CloudLbPoolClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -290,37 +312,37 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.loadbalancer_pools.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.loadbalancer_pools.execute_many(
+            items, command=command, state=state, max_concurrency=max_concurrency
+        )
+    elif state:
+        result = api.loadbalancer_pools.reconcile(state=state)
+    else:
+        result = api.loadbalancer_pools.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(LbPoolManageAction), required=True),
-        loadbalancer_pool_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        lb_algorithm=dict(type="str", choices=list(LbPoolAlgorithm), required=False),
-        protocol=dict(type="str", choices=list(LbPoolProtocol), required=False),
-        loadbalancer_id=dict(type="str", required=False),
-        listener_id=dict(type="str", required=False),
-        members=dict(type="list", elements="dict", required=False),
-        healthmonitor=dict(type="dict", required=False),
-        session_persistence=dict(type="dict", required=False),
-        timeout_client_data=dict(type="int", required=False),
-        timeout_member_connect=dict(type="int", required=False),
-        timeout_member_data=dict(type="int", required=False),
-    )
+    module_spec = CloudLbPoolClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the network.
+            - The network is looked up by I(network_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     network_id:
         description:
             - The ID of network
@@ -55,6 +65,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -82,6 +94,14 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     network_id: "{{ network_id }}"
+
+- name: Ensure network exists
+  gcore.cloud.network:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-network
 """
 
 RETURN = """
@@ -186,7 +206,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.network import (
-    NetworkManageAction,
+    CloudNetworkClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -196,30 +216,35 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.networks.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.networks.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.networks.reconcile(state=state)
+    else:
+        result = api.networks.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(NetworkManageAction), required=True),
-        network_id=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        create_router=dict(type="bool", required=False),
-        type=dict(type="str", choices=["vlan", "vxlan"], required=False),
-        metadata=dict(type="dict", required=False),
-    )
+    module_spec = CloudNetworkClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
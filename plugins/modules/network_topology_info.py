@@ -0,0 +1,169 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: network_topology_info
+author:
+    - GCore (@GCore)
+short_description: Gather the network topology of a GCore project.
+description:
+    - Gather networks, subnets, routers, reserved fixed IPs, securitygroups and instances of a project in one task.
+    - The resource lists are fetched in parallel through a single API client.
+    - The result is a graph indexed by ID, where networks and subnets reference their subnets, routers,
+      ports and instances.
+
+options:
+    resources:
+        description:
+            - Resource types to gather.
+            - Links to a type that is not gathered are left empty.
+        type: list
+        elements: str
+        choices: [networks, subnets, routers, reserved_fips, securitygroups, instances]
+        default: [networks, subnets, routers, reserved_fips, securitygroups, instances]
+    fields:
+        description:
+            - Fields to keep per resource type, e.g. C(subnets) mapped to C([name, cidr]).
+            - Keys are the keys of the returned graph, i.e. C(ports) for reserved fixed IPs.
+            - The resource ID and the links of the graph are always returned.
+            - Types without fields are returned whole.
+        type: dict
+        required: false
+    max_concurrency:
+        description:
+            - Maximum number of resource lists fetched at the same time.
+        type: int
+        default: 10
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+"""
+
+EXAMPLES = """
+- name: Gather network topology
+  gcore.cloud.network_topology_info:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    fields:
+      networks: [name]
+      subnets: [name, cidr, gateway_ip]
+      instances: [name, status]
+  register: topology
+
+- name: Show the instances of every subnet
+  ansible.builtin.debug:
+    msg: "{{ item.value.name }}: {{ item.value.instances | map('extract', topology.data.instances, 'name') }}"
+  loop: "{{ topology.data.subnets | dict2items }}"
+"""
+
+RETURN = """
+data:
+    description: Resources indexed by ID, per resource type.
+    returned: always
+    type: complex
+    contains:
+        networks:
+            description: Networks, with the IDs of their C(subnets), C(routers), C(ports) and C(instances).
+            returned: if gathered
+            type: dict
+            sample: {'726ecfcc-7fd0-4e30-a86e-7892524aa483': {'name': 'private', 'subnets': ['b39792c3-3160-4356-912e-ba396c95cdcf']}}
+        subnets:
+            description: Subnets, with the IDs of their C(routers), C(ports) and C(instances).
+            returned: if gathered
+            type: dict
+        routers:
+            description: Routers, with the IDs of the C(subnets) they are attached to.
+            returned: if gathered
+            type: dict
+        ports:
+            description: Reserved fixed IPs, indexed by port ID.
+            returned: if gathered
+            type: dict
+        securitygroups:
+            description: Securitygroups.
+            returned: if gathered
+            type: dict
+        instances:
+            description: Instances, with the IDs of their C(networks).
+            returned: if gathered
+            type: dict
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    run_concurrently,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.topology import (
+    TOPOLOGY_RESOURCES,
+    build_topology,
+)
+
+
+def manage(module: AnsibleModule):
+    api = AnsibleCloudClient(module)
+    resource_types = list(dict.fromkeys(module.params["resources"]))
+
+    def fetch(resource_type: str) -> list:
+        client = getattr(api, resource_type)
+        return client.api_client.get_all(client.url)
+
+    resources = {}
+    for resource_type, (items, error) in zip(
+        resource_types, run_concurrently(fetch, resource_types, module.params["max_concurrency"])
+    ):
+        if isinstance(error, CloudAPIError):
+            module.fail_json(msg=f"Failed to list {resource_type}: {error.message}", **error.details)
+        elif error:
+            raise error
+        resources[resource_type] = items
+    module.exit_json(changed=False, data=build_topology(resources, module.params["fields"]))
+
+
+def main():
+    module_spec = dict(
+        resources=dict(
+            type="list",
+            elements="str",
+            choices=list(TOPOLOGY_RESOURCES),
+            default=list(TOPOLOGY_RESOURCES),
+        ),
+        fields=dict(type="dict", required=False),
+        max_concurrency=dict(type="int", default=10),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
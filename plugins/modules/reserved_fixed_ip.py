@@ -19,8 +19,9 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if I(items) is not passed.
         choices: [create, update, delete]
-        required: true
+        required: false
         type: str
     port_id:
         description:
@@ -61,6 +62,8 @@ options:
         type: str
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -237,10 +240,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.reserved_fip import (
-    ReservedFipManageAction,
-)
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.reserved_fip import (
-    ReservedFipType,
+    CloudReservedFipClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -250,22 +250,21 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.reserved_fips.execute_command(command=command)
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.reserved_fips.execute_many(items, command=command, max_concurrency=max_concurrency)
+    else:
+        result = api.reserved_fips.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(ReservedFipManageAction), required=True),
-        port_id=dict(type="str", required=False),
-        type=dict(type="str", choices=list(ReservedFipType), required=False),
-        is_vip=dict(type="bool", required=False),
-        subnet_id=dict(type="str", required=False),
-        network_id=dict(type="str", required=False),
-        ip_address=dict(type="str", required=False),
-    )
+    module_spec = CloudReservedFipClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
@@ -275,6 +274,7 @@ def main():
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "items"),
         ],
         supports_check_mode=True,
     )
@@ -0,0 +1,168 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: reserved_fixed_ip_pool
+author:
+    - GCore (@GCore)
+short_description: Keep a warm pool of reserved fixed IPs and hand them out.
+description:
+    - Keep I(size) available reserved fixed IPs in a network or subnet and lease I(count) of them to the caller.
+    - The pool is the set of available reserved fixed IPs of the network or subnet.
+    - Leases are recorded in a local state file under an exclusive lock, so parallel forks running on the same
+      controller never get the same address.
+    - Missing addresses are topped up in the background; the creation tasks are not awaited and their
+      addresses become available for later runs. Only if the pool is empty are leased addresses created
+      and awaited, outside the lock, so other forks are not held up meanwhile.
+    - A leased address leaves the pool once it is no longer available, e.g. attached to an instance,
+      or returns to it after I(lease_timeout).
+
+options:
+    network_id:
+        description:
+            - Network of the pool; addresses are created in any of its subnets.
+            - Mutually exclusive with I(subnet_id).
+        type: str
+    subnet_id:
+        description:
+            - Subnet of the pool.
+            - Mutually exclusive with I(network_id).
+        type: str
+    size:
+        description:
+            - Number of available addresses to keep in the pool, besides the leased ones.
+        type: int
+        default: 5
+    count:
+        description:
+            - Number of addresses to lease.
+            - Use C(0) to only top the pool up.
+        type: int
+        default: 1
+    lease_timeout:
+        description:
+            - Seconds after which a leased address that is still available returns to the pool.
+        type: int
+        default: 900
+    state_file:
+        description:
+            - Path of the local file holding leases and pending top-ups.
+            - Defaults to a file in C(~/.ansible/tmp/gcore_cloud) on the controller, only readable by its owner,
+              specific to the API host, project and region.
+        type: path
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+notes:
+    - Run the module on the controller, e.g. with I(delegate_to=localhost), so that all forks share the state file.
+"""
+
+EXAMPLES = """
+- name: Take a reserved fixed IP for the instance
+  gcore.cloud.reserved_fixed_ip_pool:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    network_id: "{{ network_id }}"
+    size: 10
+  delegate_to: localhost
+  register: reserved
+
+- name: Create instance with the leased address
+  gcore.cloud.instance:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    names: ["{{ inventory_hostname }}"]
+    flavor: g1-standard-1-2
+    volumes: "{{ boot_volumes }}"
+    interfaces:
+      - type: reserved_fixed_ip
+        port_id: "{{ reserved.data[0].port_id }}"
+  delegate_to: localhost
+"""
+
+RETURN = """
+data:
+    description: Reserved fixed IPs leased to the caller.
+    returned: always
+    type: list
+    elements: dict
+    sample: [{'port_id': '1f0ca628-a73b-42c0-bdac-7b10d023e097', 'fixed_ip_address': '192.168.10.15'}]
+available:
+    description: Number of available addresses left in the pool, without the pending top-ups.
+    returned: always
+    type: int
+    sample: 9
+pending_tasks:
+    description: IDs of the top-up tasks still running.
+    returned: always
+    type: list
+    elements: str
+    sample: ['d74c2bb9-cea7-4b23-a009-2f13518ae66d']
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+)
+
+
+def manage(module: AnsibleModule):
+    api = AnsibleCloudClient(module)
+    result = api.reserved_fips.lease_from_pool(
+        module.params["state_file"] or get_state_path("reserved_fixed_ip_pool", module.params),
+        size=module.params["size"],
+        count=module.params["count"],
+        network_id=module.params["network_id"],
+        subnet_id=module.params["subnet_id"],
+        lease_timeout=module.params["lease_timeout"],
+    )
+    module.exit_json(**result)
+
+
+def main():
+    module_spec = dict(
+        network_id=dict(type="str", required=False),
+        subnet_id=dict(type="str", required=False),
+        size=dict(type="int", default=5),
+        count=dict(type="int", default=1),
+        lease_timeout=dict(type="int", default=900),
+        state_file=dict(type="path", required=False),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+            ("network_id", "subnet_id"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+            ("network_id", "subnet_id"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
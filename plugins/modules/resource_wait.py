@@ -0,0 +1,195 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: resource_wait
+author:
+    - GCore (@GCore)
+short_description: Wait for GCore cloud resources to reach a status.
+description:
+    - Wait until every resource in I(resource_ids) reaches one of I(statuses).
+    - All pending resources are read in the same round, through one list request when there are several.
+    - The poll interval starts at one second and grows up to 15 seconds while resources are converging.
+    - Fails as soon as a resource reaches one of I(failed_statuses), or when I(timeout) expires.
+
+options:
+    resource:
+        description:
+            - Type of the resources to wait for.
+            - Loadbalancers, listeners and pools are checked on their I(provisioning_status),
+              other resources on I(status).
+        type: str
+        required: true
+        choices:
+            - instances
+            - volumes
+            - snapshots
+            - images
+            - networks
+            - subnets
+            - routers
+            - reserved_fips
+            - secrets
+            - loadbalancers
+            - loadbalancer_listeners
+            - loadbalancer_pools
+    resource_ids:
+        description:
+            - IDs of the resources to wait for.
+        type: list
+        elements: str
+        required: true
+    statuses:
+        description:
+            - Statuses to wait for, any of them ends the wait for a resource.
+            - Compared case-insensitively, like I(failed_statuses).
+            - Use C(DELETED) to wait until the resources no longer exist.
+        type: list
+        elements: str
+        required: true
+    failed_statuses:
+        description:
+            - Statuses that end the wait with a failure, compared case-insensitively, so that C(ERROR)
+              also matches the lowercase C(error) of volumes.
+        type: list
+        elements: str
+        default: [ERROR]
+    status_field:
+        description:
+            - Resource field holding the status, overrides the default of I(resource).
+        type: str
+    timeout:
+        description:
+            - Maximum time in seconds to wait for all resources.
+        type: int
+        default: 600
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+"""
+
+EXAMPLES = """
+- name: Extend volumes without waiting for their tasks
+  gcore.cloud.volume:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: extend
+    size: 20
+    wait: false
+    items:
+      - volume_id: "{{ volume_ids[0] }}"
+      - volume_id: "{{ volume_ids[1] }}"
+
+- name: Wait for all volumes to be available again
+  gcore.cloud.resource_wait:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    resource: volumes
+    resource_ids: "{{ volume_ids }}"
+    statuses: [available]
+
+- name: Wait for a loadbalancer to leave PENDING_UPDATE
+  gcore.cloud.resource_wait:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    resource: loadbalancers
+    resource_ids: [cb1b4d4c-1b1b-4f4d-9d3a-3b0e5c5e3c5e]
+    statuses: [ACTIVE]
+
+- name: Wait for volumes to be removed
+  gcore.cloud.resource_wait:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    resource: volumes
+    resource_ids: "{{ volume_ids }}"
+    statuses: [DELETED]
+"""
+
+RETURN = """
+data:
+    description:
+        - Final resource dictionaries, in the order of I(resource_ids).
+        - Resources that no longer exist are returned as C(null).
+    returned: always
+    type: list
+    elements: dict
+    sample: [{'id': '8dc30d49-bb34-4920-9bbd-03a2587ec0ad', 'name': 'web-1', 'status': 'SHUTOFF'}]
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+
+RESOURCES = [
+    "instances",
+    "volumes",
+    "snapshots",
+    "images",
+    "networks",
+    "subnets",
+    "routers",
+    "reserved_fips",
+    "secrets",
+    "loadbalancers",
+    "loadbalancer_listeners",
+    "loadbalancer_pools",
+]
+
+
+def manage(module: AnsibleModule):
+    api = AnsibleCloudClient(module)
+    client = getattr(api, module.params["resource"])
+    resources = client.wait_for(
+        module.params["resource_ids"],
+        module.params["statuses"],
+        timeout=module.params["timeout"],
+        failed_statuses=module.params["failed_statuses"],
+        status_field=module.params["status_field"],
+    )
+    module.exit_json(changed=False, data=resources)
+
+
+def main():
+    module_spec = dict(
+        resource=dict(type="str", required=True, choices=RESOURCES),
+        resource_ids=dict(type="list", elements="str", required=True),
+        statuses=dict(type="list", elements="str", required=True),
+        failed_statuses=dict(type="list", elements="str", default=["ERROR"]),
+        status_field=dict(type="str", required=False),
+        timeout=dict(type="int", default=600),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
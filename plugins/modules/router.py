@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete, attach, detach]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the router.
+            - The router is looked up by I(router_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     router_id:
         description:
             - The ID of the router you want to get.
@@ -65,6 +75,8 @@ options:
 
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -113,6 +125,14 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     router_id: "{{ router_id }}"
+
+- name: Ensure router exists
+  gcore.cloud.router:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-router
 """
 
 RETURN = """
@@ -204,7 +224,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.router import (
-    RouterManageAction,
+    CloudRouterClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -214,55 +234,35 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.routers.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.routers.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.routers.reconcile(state=state)
+    else:
+        result = api.routers.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(RouterManageAction),
-            required=True,
-        ),
-        router_id=dict(
-            type="str",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        external_gateway_info=dict(
-            type="dict",
-            required=False,
-        ),
-        interfaces=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        routes=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        subnet_id=dict(
-            type="str",
-            required=False,
-        ),
-    )
+    module_spec = CloudRouterClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
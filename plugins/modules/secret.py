@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the secret.
+            - The secret is looked up by I(secret_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     secret_id:
         description:
             - Secret ID.
@@ -49,6 +59,8 @@ options:
         type: dict
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -73,6 +85,15 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     comamnd: delete
     secret_id: "{{ secret_id }}"
+
+- name: Ensure secret exists
+  gcore.cloud.secret:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-secret
+    payload: "{{ payload }}"
 """
 
 RETURN = """
@@ -140,7 +161,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.secret import (
-    SecretManageAction,
+    CloudSecretClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -150,29 +171,35 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.secrets.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.secrets.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.secrets.reconcile(state=state)
+    else:
+        result = api.secrets.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(SecretManageAction), required=True),
-        secret_id=dict(type="str", required=False),
-        expiration=dict(type="str", required=False),
-        name=dict(type="str", required=False),
-        payload=dict(type="dict", required=False),
-    )
+    module_spec = CloudSecretClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
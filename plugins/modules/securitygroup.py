@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete, copy]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the securitygroup.
+            - The securitygroup is looked up by I(securitygroup_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     securitygroup_id:
         description:
             - The ID of securitygroup.
@@ -56,6 +66,7 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
 """
 
 EXAMPLES = """
@@ -97,6 +108,15 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     securitygroup_id: "{{ securitygroup_id }}"
+
+- name: Ensure securitygroup exists
+  gcore.cloud.securitygroup:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: my_new_sg
+    security_group: {'name': 'my_new_sg'}
 """
 
 RETURN = """
@@ -191,7 +211,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.securitygroup import (
-    SecurityGroupManageAction,
+    CloudSecurityGroupClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -201,30 +221,34 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.securitygroups.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.securitygroups.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.securitygroups.reconcile(state=state)
+    else:
+        result = api.securitygroups.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(SecurityGroupManageAction), required=True),
-        securitygroup_id=dict(type="str", required=False),
-        instances=dict(type="list", elements="str", required=False),
-        security_group=dict(type="dict", required=False),
-        name=dict(type="str", required=False),
-        changed_rules=dict(type="list", elements="dict", required=False),
-    )
+    module_spec = CloudSecurityGroupClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
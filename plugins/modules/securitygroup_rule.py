@@ -14,20 +14,40 @@ author:
 short_description: Manages securitygroup rules.
 description:
     - Create or delete rule from securitygroup.
+    - Or keep all rules of a securitygroup in sync with I(rules).
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(items) nor I(rules) is passed.
         choices: [create, delete]
-        required: true
+        required: false
         type: str
     securitygroup_id:
         description:
             - The ID of securitygroup.
-            - Required if I(command) is create.
+            - Required if I(command) is create or I(rules) is passed.
         type: str
         required: false
+    rules:
+        description:
+            - Desired set of rules of I(securitygroup_id).
+            - Each rule accepts the same keys as a single rule, e.g. I(direction), I(protocol), I(port_range_min).
+            - Rules are compared on direction, ethertype, protocol, port range, remote IP prefix and remote group,
+              so only missing rules are created and only rules not listed are deleted.
+            - The securitygroup is read once; a securitygroup that is already in sync costs a single request.
+            - Rules are created and deleted in parallel, up to I(max_concurrency) at a time.
+        type: list
+        elements: dict
+        required: false
+    purge_rules:
+        description:
+            - Delete the rules of the securitygroup that are not listed in I(rules).
+            - If C(false), rules are only added.
+        type: bool
+        default: true
+        required: false
     securitygroup_rule_id:
         description:
             - The ID of securitygroup rule.
@@ -124,6 +144,7 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
 """
 
 EXAMPLES = """
@@ -144,6 +165,24 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     securitygroup_rule_id: "{{ securitygroup_rule_id }}"
+
+- name: Keep securitygroup rules in sync
+  gcore.cloud.securitygroup_rule:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    securitygroup_id: "{{ securitygroup_id }}"
+    rules:
+      - direction: ingress
+        protocol: tcp
+        port_range_min: 22
+        port_range_max: 22
+        remote_ip_prefix: 10.0.0.0/8
+      - direction: ingress
+        protocol: tcp
+        port_range_min: 443
+        port_range_max: 443
+      - direction: egress
 """
 
 RETURN = """
@@ -151,6 +190,7 @@ securitygroup:
     description:
         - Response depends of I(command).
         - Resource dictionary.
+        - With I(rules), a dictionary with the C(created) rules and the C(deleted) rule IDs.
     returned: always
     type: complex
     contains:
@@ -225,13 +265,8 @@ from traceback import format_exc
 
 from ansible.module_utils.basic import AnsibleModule, to_native
 
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.securitygroup_rule import (
-    DirectionType,
-    Ethertype,
-    SecurityGroupProtocol,
-)
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.securitygroup_rule import (
-    SecurityGroupRuleManageAction,
+    CloudSecurityGroupRuleClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -241,38 +276,42 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.securitygroup_rules.execute_command(command=command)
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    rules = module.params.pop("rules")
+    if rules is not None:
+        result = api.securitygroup_rules.sync(
+            module.params["securitygroup_id"],
+            rules,
+            purge=module.params["purge_rules"],
+            max_concurrency=max_concurrency,
+        )
+    elif items:
+        result = api.securitygroup_rules.execute_many(items, command=command, max_concurrency=max_concurrency)
+    else:
+        result = api.securitygroup_rules.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(type="str", choices=list(SecurityGroupRuleManageAction), required=True),
-        securitygroup_id=dict(type="str", required=False),
-        securitygroup_rule_id=dict(type="str", required=False),
-        direction=dict(type="str", choices=list(DirectionType), required=False),
-        ethertype=dict(type="str", choices=list(Ethertype), required=False),
-        description=dict(type="str", required=False),
-        remote_group_id=dict(type="str", required=False),
-        port_range_min=dict(type="int", required=False),
-        port_range_max=dict(type="int", required=False),
-        remote_ip_prefix=dict(type="str", required=False),
-        protocol=dict(type="str", choices=list(SecurityGroupProtocol), required=False),
-        id=dict(type="str", required=False),
-        revision_number=dict(type="int", required=False),
-    )
+    module_spec = CloudSecurityGroupRuleClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "rules"),
+            ("items", "rules"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "items", "rules"),
         ],
+        required_by={"rules": "securitygroup_id"},
         supports_check_mode=True,
     )
     try:
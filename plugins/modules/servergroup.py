@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the servergroup.
+            - The servergroup is looked up by I(servergroup_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     name:
         description:
             - Server group name.
@@ -43,6 +53,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -62,6 +74,15 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     servergroup_id: "{{ servergroup_id }}"
+
+- name: Ensure servergroup exists
+  gcore.cloud.servergroup:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-servergroup
+    policy: anti-affinity
 """
 
 RETURN = """
@@ -113,11 +134,8 @@ from traceback import format_exc
 
 from ansible.module_utils.basic import AnsibleModule, to_native
 
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.servergroup import (
-    ServerGroupPolicy,
-)
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.servergroup import (
-    ServerGroupManageAction,
+    CloudServerGroupClient,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
@@ -127,42 +145,35 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.servergroups.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    if items:
+        result = api.servergroups.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.servergroups.reconcile(state=state)
+    else:
+        result = api.servergroups.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(ServerGroupManageAction),
-            required=True,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        policy=dict(
-            type="str",
-            choices=list(ServerGroupPolicy),
-            required=False,
-        ),
-        servergroup_id=dict(
-            type="str",
-            required=False,
-        ),
-    )
+    module_spec = CloudServerGroupClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
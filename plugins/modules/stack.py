@@ -0,0 +1,285 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: stack
+author:
+    - GCore (@GCore)
+short_description: Converge or destroy a whole topology of GCore Cloud resources.
+description:
+    - Take the desired state of a set of resources, such as networks, subnets, routers and loadbalancers,
+      and converge them in a single task.
+    - The current resources are fetched with one paged list per resource type. Resources are matched
+      by the ID recorded by the previous run of the same stack, or else by name.
+    - A plan of the resources to create, update or delete is computed and saved to I(plan_path). In check
+      mode only the plan is computed and saved. A run with the same resources applies the saved plan
+      without fetching again if the plan is younger than I(plan_max_age).
+    - The plan is applied as a dependency graph, independent resources changing at the same time.
+      Resources referencing others, for example with C(ops.net1.id), wait for them.
+    - Resources recorded by a previous run but no longer listed are deleted once the others are applied,
+      unless their name changed since they were recorded.
+    - With I(state=absent) every resource of the stack is deleted, dependents first, independent
+      resources at the same time.
+    - Writes to the same loadbalancer, its listeners and pools run one at a time, each waiting for the
+      loadbalancer to be ACTIVE.
+options:
+    name:
+        description:
+            - Name of the stack, used for the default I(plan_path).
+        type: str
+        required: true
+    resources:
+        description:
+            - Desired resources of the stack.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            name:
+                description:
+                    - Unique name of the resource in the stack, used to reference it.
+                type: str
+                required: true
+            resource:
+                description:
+                    - Type of the resource.
+                type: str
+                required: true
+                choices: [networks, subnets, routers, securitygroups, keypairs, servergroups, volumes, snapshots,
+                          lifecycle_policy, loadbalancers, loadbalancer_listeners, loadbalancer_pools, secrets]
+            params:
+                description:
+                    - Options of the module managing this type of resource with I(state=present), except the
+                      API ones, including the name used to find the resource.
+                    - The defaults of that module are not applied, options left out take the API defaults.
+                    - Strings may hold references like C({{ ops.net1.id }}) to another resource of the stack,
+                      with C(.key) and C([index]) steps. Mark them C(!unsafe) so that Ansible does not template
+                      them. A string that is a single reference takes the type of the referenced value.
+                type: dict
+                default: {}
+            depends_on:
+                description:
+                    - Names of resources to wait for, besides the referenced ones.
+                type: list
+                elements: str
+                default: []
+    state:
+        description:
+            - Whether the resources of the stack should exist.
+        type: str
+        choices: [present, absent]
+        default: present
+    plan_path:
+        description:
+            - Path of the JSON file holding the last plan and the IDs of the resources of the stack.
+            - Defaults to a file in C(~/.ansible/tmp/gcore_cloud) on the controller, named after the stack and
+              specific to the API host, project and region.
+            - Runs of the same stack are serialized with a lock on this file.
+        type: path
+    plan_max_age:
+        description:
+            - Maximum age in seconds of a saved plan for the same resources and state to be applied as is.
+            - With C(0), the plan is always computed again.
+        type: int
+        default: 0
+    max_concurrency:
+        description:
+            - Maximum number of resources changing at the same time.
+        type: int
+        default: 10
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+notes:
+    - Instances and loadbalancer members cannot be part of a stack, use M(gcore.cloud.batch) for them.
+"""
+
+EXAMPLES = """
+- name: Plan an environment
+  gcore.cloud.stack:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    name: review-42
+    resources: &review_resources
+      - name: net
+        resource: networks
+        params:
+          name: review-42-net
+      - name: subnet
+        resource: subnets
+        params:
+          name: review-42-subnet
+          network_id: !unsafe "{{ ops.net.id }}"
+          cidr: 192.168.10.0/24
+      - name: router
+        resource: routers
+        params:
+          name: review-42-router
+          interfaces:
+            - type: subnet
+              subnet_id: !unsafe "{{ ops.subnet.id }}"
+  check_mode: true
+  register: stack_plan
+
+- name: Apply the saved plan
+  gcore.cloud.stack:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    name: review-42
+    resources: *review_resources
+    plan_max_age: 600
+
+- name: Tear the environment down
+  gcore.cloud.stack:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    name: review-42
+    resources: *review_resources
+    state: absent
+"""
+
+RETURN = """
+plan:
+    description:
+        - Action taken on every resource of the stack and on every recorded resource that left it.
+    returned: always
+    type: dict
+    sample: {
+        'net': {'resource': 'networks', 'action': 'none', 'id': '726ecfcc-7fd0-4e30-a86e-7892524aa483',
+                'depends_on': [], 'changes': []},
+        'subnet': {'resource': 'subnets', 'action': 'update', 'id': '3ed9e2ce-f906-47fb-ba32-c25a3f63df4f',
+                   'depends_on': ['net'], 'changes': ['update']},
+        'router': {'resource': 'routers', 'action': 'create', 'id': null, 'depends_on': ['subnet'], 'changes': []},
+    }
+results:
+    description:
+        - Result of every resource of the plan, by name. Not returned in check mode.
+        - Resources skipped because a resource they depend on failed have I(skipped) set.
+    returned: success
+    type: dict
+    sample: {
+        'net': {'changed': False, 'data': {'id': '726ecfcc-7fd0-4e30-a86e-7892524aa483', 'name': 'review-42-net'}},
+        'router': {'changed': True, 'data': {'id': '2f3d4b1a-6a55-4a57-b6a3-4d5ee1c2f0a1', 'name': 'review-42-router'}},
+    }
+"""
+
+import hashlib
+import json
+import time
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+    ValidationError,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+    locked_state,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.stack import (
+    STACK_RESOURCES,
+    PlanAction,
+    StackRunner,
+)
+
+
+def get_digest(params: dict) -> str:
+    desired = {key: params[key] for key in ("project_id", "project_name", "region_id", "region_name", "state")}
+    desired["resources"] = params["resources"]
+    return hashlib.sha256(json.dumps(desired, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def manage(module: AnsibleModule):
+    params = module.params
+    runner = StackRunner(AnsibleCloudClient(module), params["max_concurrency"])
+    plan_path = params["plan_path"] or get_state_path(f"stack_{params['name']}", params)
+    digest = get_digest(params)
+    error = None
+    details = {}
+    with locked_state(plan_path) as saved:
+        plan = saved.get("plan")
+        if (
+            module.check_mode
+            or plan is None
+            or saved.get("digest") != digest
+            or time.time() - saved.get("timestamp", 0) > params["plan_max_age"]
+        ):
+            try:
+                plan = runner.plan(params["state"], params["resources"], saved.get("resources"))
+            except ValidationError as exc:
+                error = exc.message
+            except CloudAPIError as exc:
+                error, details = exc.message, exc.details
+        if error:
+            result = None
+        elif module.check_mode:
+            saved.update(plan=plan, digest=digest, timestamp=time.time())
+            result = {"changed": any(item["action"] != PlanAction.NONE for item in plan.values())}
+        else:
+            result = runner.apply(plan, params["resources"])
+            saved.update(plan=None, resources=runner.get_records(plan, result, saved.get("resources")))
+
+    if error:
+        module.fail_json(msg=error, **details)
+    result["plan"] = {
+        name: {key: value for key, value in item.items() if key != "current"} for name, item in plan.items()
+    }
+    if result.get("failed"):
+        module.fail_json(**result)
+    module.exit_json(**result)
+
+
+def main():
+    module_spec = dict(
+        name=dict(type="str", required=True),
+        resources=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=True),
+                resource=dict(type="str", required=True, choices=list(STACK_RESOURCES)),
+                params=dict(type="dict", default={}),
+                depends_on=dict(type="list", elements="str", default=[]),
+            ),
+        ),
+        state=dict(type="str", choices=["present", "absent"], default="present"),
+        plan_path=dict(type="path"),
+        plan_max_age=dict(type="int", default=0),
+        max_concurrency=dict(type="int", default=10),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the subnet.
+            - The subnet is looked up by I(subnet_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     subnet_id:
         description:
             - Subnet ID
@@ -50,9 +60,35 @@ options:
     cidr:
         description:
             - CIDR.
-            - Required if I(command) is create
+            - Required if I(command) is create, unless I(cidr_allocate) is passed.
         type: str
         required: false
+    cidr_allocate:
+        description:
+            - Pick I(cidr) automatically as the first free block of I(supernet).
+            - The CIDRs of the existing subnets are listed once and indexed, and every subnet created by the task,
+              including the ones of I(items) without I(cidr), gets its own block.
+            - Allocation and creation hold a lock on the controller, so parallel forks never pick the same block.
+        type: dict
+        required: false
+        suboptions:
+            supernet:
+                description:
+                    - Range to allocate the subnet from, e.g. C(10.20.0.0/16).
+                type: str
+                required: true
+            prefix_length:
+                description:
+                    - Prefix length of the allocated block, e.g. C(24).
+                type: int
+                required: true
+            scope:
+                description:
+                    - Subnets to avoid, those of I(network_id) or all subnets of the project.
+                    - With the network scope, items setting their own I(network_id) avoid the subnets of that network.
+                type: str
+                choices: [network, project]
+                default: network
     connect_to_network_router:
         description:
             - True if the network's router should get a gateway in this subnet.
@@ -90,6 +126,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -103,6 +141,18 @@ EXAMPLES = """
     network_id: "{{ network_id }}"
     cidr: "{{ cidr }}"
 
+- name: Create subnet in the first free /24 of the network range
+  gcore.cloud.subnet:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    name: "{{ subnet_name }}"
+    network_id: "{{ network_id }}"
+    cidr_allocate:
+      supernet: 10.20.0.0/16
+      prefix_length: 24
+
 - name: Update subnet
   gcore.cloud.subnet:
     api_key: "{{ api_key }}"
@@ -130,6 +180,16 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     subnet_id: "{{ subnet_id }}"
+
+- name: Ensure subnet exists
+  gcore.cloud.subnet:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-subnet
+    network_id: "{{ network_id }}"
+    cidr: 192.168.10.0/24
 """
 
 RETURN = """
@@ -256,82 +316,87 @@ from traceback import format_exc
 
 from ansible.module_utils.basic import AnsibleModule, to_native
 
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.base import (
+    ResourceState,
+)
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.subnet import (
+    CloudSubnetClient,
     SubnetManageAction,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
     AnsibleCloudClient,
 )
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    file_lock,
+    get_state_path,
+)
+
+
+def allocate_cidrs(api: AnsibleCloudClient, module: AnsibleModule, cidr_allocate: dict, items: list):
+    targets = [item for item in items if not item.get("cidr")] if items else [module.params]
+    if not targets or (not items and module.params["cidr"]):
+        return
+    # With the network scope, items of other networks get their blocks from the subnets of their own network
+    groups = {}
+    for target in targets:
+        network_id = None
+        if cidr_allocate["scope"] == "network":
+            network_id = target.get("network_id") or module.params["network_id"]
+        groups.setdefault(network_id, []).append(target)
+    for network_id, group in groups.items():
+        cidrs = api.subnets.allocate_cidrs(
+            cidr_allocate["supernet"],
+            cidr_allocate["prefix_length"],
+            count=len(group),
+            network_id=network_id,
+        )
+        for target, cidr in zip(group, cidrs):
+            target["cidr"] = cidr
+
+
+def run(api: AnsibleCloudClient, command: str, state: str, items: list, max_concurrency: int) -> dict:
+    if items:
+        result = api.subnets.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.subnets.reconcile(state=state)
+    else:
+        result = api.subnets.execute_command(command=command)
+    return result
 
 
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.subnets.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    cidr_allocate = module.params.pop("cidr_allocate")
+    if cidr_allocate and (command == SubnetManageAction.CREATE or state == ResourceState.PRESENT):
+        with file_lock(get_state_path("subnet_cidr_allocate", module.params)):
+            allocate_cidrs(api, module, cidr_allocate, items)
+            result = run(api, command, state, items, max_concurrency)
+    else:
+        result = run(api, command, state, items, max_concurrency)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(SubnetManageAction),
-            required=True,
-        ),
-        subnet_id=dict(
-            type="str",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        network_id=dict(
-            type="str",
-            required=False,
-        ),
-        enable_dhcp=dict(
-            type="bool",
-            required=False,
-        ),
-        cidr=dict(
-            type="str",
-            required=False,
-        ),
-        connect_to_network_router=dict(
-            type="bool",
-            required=False,
-        ),
-        dns_nameservers=dict(
-            type="list",
-            elements="str",
-            required=False,
-        ),
-        gateway_ip=dict(
-            type="str",
-            required=False,
-        ),
-        host_routes=dict(
-            type="list",
-            elements="dict",
-            required=False,
-        ),
-        metadata=dict(
-            type="dict",
-            required=False,
-        ),
-    )
+    module_spec = CloudSubnetClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
         supports_check_mode=True,
     )
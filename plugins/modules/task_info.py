@@ -0,0 +1,162 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: task_info
+author:
+    - GCore (@GCore)
+short_description: Gather infos about GCore cloud tasks.
+description:
+    - Gather infos about GCore cloud tasks without waiting for them.
+
+options:
+    task_id:
+        description:
+            - The ID of the task you want to get.
+            - The module will fail if the provided ID is invalid.
+        type: str
+        required: false
+    task_ids:
+        description:
+            - List of task IDs to get at once.
+        type: list
+        elements: str
+        required: false
+    max_concurrency:
+        description:
+            - Maximum number of tasks fetched at the same time.
+        type: int
+        default: 10
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+"""
+
+EXAMPLES = """
+- name: Gather task info
+  gcore.cloud.task_info:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    task_id: "{{ task_id }}"
+
+- name: Gather info about tasks started without waiting
+  gcore.cloud.task_info:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    task_ids: "{{ created.results | map(attribute='data.tasks') | flatten }}"
+"""
+
+RETURN = """
+task_info:
+    description:
+        - Task dictionary if I(task_id) is passed, otherwise list of task dictionaries.
+    returned: always
+    type: complex
+    contains:
+        id:
+            description: Task ID
+            returned: always
+            type: str
+            sample: d74c2bb9-cea7-4b23-a009-2f13518ae66d
+        task_type:
+            description: Type of the task
+            returned: always
+            type: str
+            sample: create_vm
+        state:
+            description: Task state
+            returned: always
+            type: str
+            sample: RUNNING
+        created_on:
+            description: Datetime when the task was created
+            returned: always
+            type: str
+            sample: 2019-05-29T05:32:41
+        finished_on:
+            description: Datetime when the task finished
+            returned: if available
+            type: str
+            sample: 2019-05-29T05:35:12
+        created_resources:
+            description: IDs of the resources created by the task, keyed by resource type
+            returned: if available
+            type: dict
+            sample: {'volumes': ['726ecfcc-7fd0-4e30-a86e-7892524aa483']}
+        data:
+            description: Parameters of the request that started the task
+            returned: if available
+            type: dict
+            sample: {'volume_id': '726ecfcc-7fd0-4e30-a86e-7892524aa483'}
+        error:
+            description: Error text if the task failed
+            returned: if available
+            type: str
+            sample: null
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.task import (
+    TaskGetAction,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+
+
+def manage(module: AnsibleModule):
+    api = AnsibleCloudClient(module)
+    task_ids = module.params.get("task_ids")
+    if task_ids:
+        try:
+            tasks = api.tasks.get_many(task_ids, max_concurrency=module.params["max_concurrency"])
+        except CloudAPIError as exc:
+            module.fail_json(msg=exc.message, **exc.details)
+        module.exit_json(changed=False, data=tasks)
+    result = api.tasks.execute_command(command=TaskGetAction.GET_BY_ID)
+    module.exit_json(**result)
+
+
+def main():
+    module_spec = dict(
+        task_id=dict(type="str", required=False),
+        task_ids=dict(type="list", elements="str", required=False),
+        max_concurrency=dict(type="int", default=10),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+            ("task_id", "task_ids"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+            ("task_id", "task_ids"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
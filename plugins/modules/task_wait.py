@@ -0,0 +1,164 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: task_wait
+author:
+    - GCore (@GCore)
+short_description: Wait for GCore cloud tasks to finish.
+description:
+    - Wait for many GCore cloud tasks at once, e.g. the ones started by modules with I(wait=false).
+    - All pending tasks are polled in the same round, so the wait lasts as long as the slowest task.
+    - Once every task has finished, resources created by the tasks are fetched and returned.
+    - Fails if any task ends in a state other than FINISHED, after all of them have ended.
+
+options:
+    task_ids:
+        description:
+            - List of task IDs to wait for.
+        type: list
+        elements: str
+        required: true
+    timeout:
+        description:
+            - Maximum time in seconds to wait for all tasks.
+        type: int
+        default: 1800
+    resolve_resources:
+        description:
+            - Fetch the resources created by the tasks.
+            - If C(false), only the task dictionaries are returned.
+        type: bool
+        default: true
+    max_concurrency:
+        description:
+            - Maximum number of requests sent at the same time while polling tasks and fetching resources.
+        type: int
+        default: 10
+extends_documentation_fragment:
+    - gcore.cloud.cloud.documentation
+"""
+
+EXAMPLES = """
+- name: Start instance creation without waiting
+  gcore.cloud.instance:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    wait: false
+    flavor: g1-standard-1-2
+    volumes: "{{ boot_volumes }}"
+    interfaces: [{'type': 'external'}]
+    items:
+      - names: [web-1]
+      - names: [web-2]
+      - names: [web-3]
+  register: created
+
+- name: Configure other services meanwhile
+  ansible.builtin.debug:
+    msg: "..."
+
+- name: Wait for all instances
+  gcore.cloud.task_wait:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    task_ids: "{{ created.results | map(attribute='data.tasks') | flatten }}"
+  register: finished
+
+- name: Show created instances
+  ansible.builtin.debug:
+    var: finished.created_resources.instances
+"""
+
+RETURN = """
+data:
+    description: Final task dictionaries, in the order of I(task_ids).
+    returned: always
+    type: list
+    elements: dict
+    sample: [{'id': 'd74c2bb9-cea7-4b23-a009-2f13518ae66d', 'state': 'FINISHED', 'task_type': 'create_vm'}]
+created_resources:
+    description:
+        - Resources created by the finished tasks, keyed by resource type.
+        - Only resource types known to the collection are fetched.
+    returned: if I(resolve_resources) is true
+    type: dict
+    sample: {'instances': [{'id': '8dc30d49-bb34-4920-9bbd-03a2587ec0ad', 'name': 'web-1', 'status': 'ACTIVE'}]}
+deleted_resources:
+    description: IDs of the resources removed by finished delete tasks, keyed by resource type.
+    returned: always
+    type: dict
+    sample: {'volumes': ['726ecfcc-7fd0-4e30-a86e-7892524aa483']}
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils.basic import AnsibleModule, to_native
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+
+
+def manage(module: AnsibleModule):
+    api = AnsibleCloudClient(module)
+    max_concurrency = module.params["max_concurrency"]
+    try:
+        tasks = api.tasks.wait_for_tasks(
+            module.params["task_ids"],
+            timeout=module.params["timeout"],
+            max_concurrency=max_concurrency,
+        )
+        result = dict(changed=False, data=tasks, deleted_resources=api.tasks.get_deleted_resources(tasks))
+        if module.params["resolve_resources"]:
+            result["created_resources"] = api.resolve_created_resources(tasks, max_concurrency=max_concurrency)
+    except CloudAPIError as exc:
+        module.fail_json(msg=exc.message, **exc.details)
+
+    failed = api.tasks.get_failed(tasks)
+    if failed:
+        module.fail_json(msg=f"{len(failed)} of {len(tasks)} tasks did not finish successfully", **result)
+    module.exit_json(**result)
+
+
+def main():
+    module_spec = dict(
+        task_ids=dict(type="list", elements="str", required=True),
+        timeout=dict(type="int", default=1800),
+        resolve_resources=dict(type="bool", default=True),
+        max_concurrency=dict(type="int", default=10),
+    )
+    spec = AnsibleCloudClient.get_api_spec()
+    spec.update(module_spec)
+    module = AnsibleModule(
+        argument_spec=spec,
+        mutually_exclusive=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        required_one_of=[
+            ("project_id", "project_name"),
+            ("region_id", "region_name"),
+        ],
+        supports_check_mode=True,
+    )
+    try:
+        manage(module)
+    except Exception as exc:
+        module.fail_json(msg=to_native(exc), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
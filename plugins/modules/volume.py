@@ -14,19 +14,39 @@ author:
 short_description: Manages volumes
 description:
     - Create/update/delete or attach/detach or retype/revert or extend volume
+    - Several volumes can be attached or detached at once with I(volume_ids).
 
 options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, update, delete, attach, detach, extend, retype, revert]
-        required: true
+        required: false
         type: str
+    state:
+        description:
+            - Desired state of the volume.
+            - The volume is looked up by I(volume_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
+        type: str
+        required: false
 
     volume_id:
         description:
             - Volume ID
         type: str
+    volume_ids:
+        description:
+            - IDs of several volumes to attach to or detach from I(instance_id) at once.
+            - Only valid with I(command) attach or detach, instead of I(volume_id).
+            - Volumes already in the wanted state are skipped; the others are sent concurrently,
+              up to I(max_concurrency), and their tasks are awaited together.
+            - The result is a map of volume ID to its attachment to the instance.
+        type: list
+        elements: str
     type_name:
         description:
             - One of 'standard', 'ssd_hiiops', 'cold', 'ultra', 'ssd_lowlatency'.
@@ -101,6 +121,8 @@ options:
         type: str
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -157,6 +179,30 @@ EXAMPLES = """
     volume_id: "{{ volume_id }}"
     instance_id: "{{ instance_id }}"
 
+- name: Attach several volumes to instance at once
+  gcore.cloud.volume:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: attach
+    volume_ids: "{{ data_volume_ids }}"
+    instance_id: "{{ instance_id }}"
+  register: attached
+
+- name: Create data volumes attached to instance
+  gcore.cloud.volume:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    source: new-volume
+    size: 100
+    instance_id_to_attach_to: "{{ instance_id }}"
+    items:
+      - name: data-1
+      - name: data-2
+      - name: data-3
+
 - name: Detach existing volume from instance
   gcore.cloud.volume:
     api_key: "{{ api_key }}"
@@ -199,6 +245,32 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     volume_id: "{{ volume_id }}"
+
+- name: Ensure volume exists
+  gcore.cloud.volume:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    source: new-volume
+    type_name: standard
+    name: test-volume
+    size: 2
+
+- name: Create several volumes in one task
+  gcore.cloud.volume:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    source: new-volume
+    type_name: ssd_hiiops
+    max_concurrency: 20
+    items:
+      - name: data-1
+        size: 100
+      - name: data-2
+        size: 200
 """
 
 RETURN = """
@@ -340,18 +412,20 @@ volume:
             returned: if available
             type: bool
             sample: false
+attachments:
+    description:
+        - Map of volume ID to its attachment to the instance, C(null) if the volume is not attached.
+    returned: if I(volume_ids) is passed, or I(items) create volumes with I(instance_id_to_attach_to)
+    type: dict
+    sample: {'726ecfcc-7fd0-4e30-a86e-7892524aa483': {'server_id': '8dc30d49-bb34-4920-9bbd-03a2587ec0ad', 'device': '/dev/vdb'}}
 """
 
 from traceback import format_exc
 
 from ansible.module_utils.basic import AnsibleModule, to_native
 
-from ansible_collections.gcore.cloud.plugins.module_utils.clients.schemas.volume import (
-    RetypableVolumeType,
-    VolumeSource,
-    VolumeType,
-)
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
+    CloudVolumeClient,
     VolumeManageAction,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
@@ -362,88 +436,55 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.volumes.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    volume_ids = module.params.pop("volume_ids")
+    if volume_ids:
+        result = api.volumes.attach_many(
+            command, volume_ids, module.params["instance_id"], max_concurrency=max_concurrency
+        )
+        result["attachments"] = result.pop("data")
+    elif items:
+        result = api.volumes.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+        instance_ids = [
+            item.get("instance_id_to_attach_to") or module.params["instance_id_to_attach_to"] for item in items
+        ]
+        instance_ids = [instance_id for instance_id in instance_ids if instance_id]
+        if command == VolumeManageAction.CREATE and instance_ids and module.params["wait"]:
+            result["attachments"] = api.volumes.get_attachments(instance_ids)
+    elif state:
+        result = api.volumes.reconcile(state=state)
+    else:
+        result = api.volumes.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(VolumeManageAction),
-            required=True,
-        ),
-        volume_id=dict(
-            type="str",
-            required=False,
-        ),
-        type_name=dict(
-            type="str",
-            choices=list(VolumeType),
-            required=False,
-        ),
-        volume_type=dict(
-            type="str",
-            choices=list(RetypableVolumeType),
-            required=False,
-        ),
-        name=dict(
-            type="str",
-        ),
-        instance_id_to_attach_to=dict(
-            type="str",
-            required=False,
-        ),
-        attachment_tag=dict(
-            type="str",
-            required=False,
-        ),
-        lifecycle_policy_ids=dict(
-            type="list",
-            elements="int",
-            required=False,
-        ),
-        metadata=dict(
-            type="dict",
-            required=False,
-        ),
-        size=dict(
-            type="int",
-            required=False,
-        ),
-        source=dict(
-            type="str",
-            choices=list(VolumeSource),
-            required=False,
-        ),
-        image_id=dict(
-            type="str",
-            required=False,
-        ),
-        snapshot_id=dict(
-            type="str",
-        ),
-        instance_id=dict(
-            type="str",
-        ),
-        snapshots=dict(
-            type="str",
-        ),
-    )
+    module_spec = CloudVolumeClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
+            ("volume_id", "volume_ids"),
+            ("items", "volume_ids"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
+        required_by={"volume_ids": ("command", "instance_id")},
         supports_check_mode=True,
     )
+    if module.params["volume_ids"] and module.params["command"] not in ("attach", "detach"):
+        module.fail_json(msg="volume_ids can only be used with command attach or detach")
     try:
         manage(module)
     except Exception as exc:
@@ -19,9 +19,19 @@ options:
     command:
         description:
             - Operation to perform.
+            - Required if neither I(state) nor I(items) is passed.
         choices: [create, delete]
-        required: true
+        required: false
+        type: str
+    state:
+        description:
+            - Desired state of the snapshot.
+            - The snapshot is looked up by I(snapshot_id) or, if it is not passed, by I(name).
+            - Only the requests needed to reach the state are sent, so converged runs make no changes.
+            - Mutually exclusive with I(command).
+        choices: [present, absent]
         type: str
+        required: false
     snapshot_id:
         description:
             - Snapshot ID.
@@ -31,9 +41,27 @@ options:
     volume_id:
         description:
             - Volume ID to make snapshot of.
-            - Required if I(command) is create
+            - Required if I(command) is create, unless I(volume_ids) or I(volume_filters) is passed.
         type: str
         required: false
+    volume_ids:
+        description:
+            - IDs of several volumes to snapshot at once.
+            - Only valid with I(command) create, instead of I(volume_id).
+            - Every snapshot is named C(<name>-<volume name>).
+            - Snapshots are requested concurrently, up to I(max_concurrency), and their tasks are awaited together.
+        type: list
+        elements: str
+        required: false
+    volume_filters:
+        description:
+            - Snapshot every volume returned by the volume list with these filters.
+            - Accepts the filters of the volume list, e.g. I(instance_id), I(metadata_kv) or I(name_part).
+              Unknown or empty filters are rejected rather than snapshotting every volume.
+            - Only valid with I(command) create, instead of I(volume_id). Combined with I(volume_ids), the listed
+              volumes must match the filters.
+        type: dict
+        required: false
     name:
         description:
             - Snapshot name.
@@ -54,6 +82,8 @@ options:
         required: false
 extends_documentation_fragment:
     - gcore.cloud.cloud.documentation
+    - gcore.cloud.cloud.bulk
+    - gcore.cloud.cloud.wait
 """
 
 EXAMPLES = """
@@ -74,6 +104,27 @@ EXAMPLES = """
     project_id: "{{ project_id }}"
     command: delete
     snapshot_id: "{{ snapshot_id }}"
+
+- name: Ensure snapshot exists
+  gcore.cloud.volume_snapshot:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    state: present
+    name: test-snapshot
+    volume_id: "{{ volume_id }}"
+
+- name: Snapshot every volume marked for backup
+  gcore.cloud.volume_snapshot:
+    api_key: "{{ api_key }}"
+    region_id: "{{ region_id }}"
+    project_id: "{{ project_id }}"
+    command: create
+    name: pre-maintenance
+    volume_filters:
+      metadata_kv: '{"backup": "true"}'
+    max_concurrency: 20
+  register: backup
 """
 
 RETURN = """
@@ -155,6 +206,13 @@ volume_snapshot:
             returned: if available
             type: dict
             sample: {'bootable': 'False', 'task_id': 'a4d72afa-1c67-44af-9f91-0b893cd204da', 'volume_type': 'standard', 'volume_name': 'namevolume'}
+snapshots:
+    description:
+        - Map of volume ID to the snapshot created from it.
+        - A volume maps to C(null) in check mode, and to its task IDs if I(wait) is false.
+    returned: if I(volume_ids) or I(volume_filters) is passed
+    type: dict
+    sample: {'726ecfcc-7fd0-4e30-a86e-7892524aa483': {'id': 'a5a4f4d6-3ae8-4c87-a3c5-9a8b2d2a3e55', 'name': 'backup-data-1'}}
 """
 
 from traceback import format_exc
@@ -162,6 +220,7 @@ from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule, to_native
 
 from ansible_collections.gcore.cloud.plugins.module_utils.clients.snapshot import (
+    CloudSnapshotClient,
     SnapshotManageAction,
 )
 from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
@@ -172,52 +231,57 @@ from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
 def manage(module: AnsibleModule):
     api = AnsibleCloudClient(module)
     command = module.params.pop("command")
-    result = api.snapshots.execute_command(command=command)
+    state = module.params.pop("state")
+    items = module.params.pop("items")
+    max_concurrency = module.params.pop("max_concurrency")
+    volume_ids = module.params.pop("volume_ids")
+    volume_filters = module.params.pop("volume_filters")
+    if volume_ids is not None or volume_filters is not None:
+        result = api.snapshots.create_many(
+            module.params["name"],
+            volume_ids=volume_ids,
+            volume_filters=volume_filters,
+            max_concurrency=max_concurrency,
+        )
+        result["snapshots"] = result.pop("data")
+    elif items:
+        result = api.snapshots.execute_many(items, command=command, state=state, max_concurrency=max_concurrency)
+    elif state:
+        result = api.snapshots.reconcile(state=state)
+    else:
+        result = api.snapshots.execute_command(command=command)
     module.exit_json(**result)
 
 
 def main():
-    module_spec = dict(
-        command=dict(
-            type="str",
-            choices=list(SnapshotManageAction),
-            required=True,
-        ),
-        snapshot_id=dict(
-            type="str",
-            required=False,
-        ),
-        volume_id=dict(
-            type="str",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        description=dict(
-            type="str",
-            required=False,
-        ),
-        metadata=dict(
-            type="dict",
-            required=False,
-        ),
-    )
+    module_spec = CloudSnapshotClient.get_module_spec()
     spec = AnsibleCloudClient.get_api_spec()
     spec.update(module_spec)
+    spec.update(AnsibleCloudClient.get_wait_spec())
+    spec.update(AnsibleCloudClient.get_bulk_spec(spec))
     module = AnsibleModule(
         argument_spec=spec,
         mutually_exclusive=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state"),
+            ("volume_id", "volume_ids"),
+            ("volume_id", "volume_filters"),
+            ("items", "volume_ids"),
+            ("items", "volume_filters"),
         ],
         required_one_of=[
             ("project_id", "project_name"),
             ("region_id", "region_name"),
+            ("command", "state", "items"),
         ],
+        required_by={"volume_ids": ("command", "name"), "volume_filters": ("command", "name")},
         supports_check_mode=True,
     )
+    if (module.params["volume_ids"] is not None or module.params["volume_filters"] is not None) and module.params[
+        "command"
+    ] != SnapshotManageAction.CREATE:
+        module.fail_json(msg="volume_ids and volume_filters can only be used with command create")
     try:
         manage(module)
     except Exception as exc:
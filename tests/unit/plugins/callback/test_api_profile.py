@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mock import MagicMock, patch
+
+from ansible_collections.gcore.cloud.plugins.callback.api_profile import CallbackModule
+
+
+def make_result(task: str, host: str, result: dict):
+    runner_result = MagicMock()
+    runner_result._task.get_name.return_value = task
+    runner_result._task.get_path.return_value = None
+    runner_result._host.get_name.return_value = host
+    runner_result._result = result
+    return runner_result
+
+
+def make_stats(requests: int, request_time: float, poll_time: float, endpoint: str) -> dict:
+    return {
+        "requests": requests,
+        "request_time": request_time,
+        "bytes_sent": 0,
+        "bytes_received": 100 * requests,
+        "poll_time": poll_time,
+        "endpoints": {endpoint: {"requests": requests, "request_time": request_time, "bytes_received": 100}},
+    }
+
+
+class TestApiProfile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.report_path = os.path.join(tempfile.mkdtemp(), "report.json")
+        environ = patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        self.callback = CallbackModule()
+        self.callback._display = MagicMock()
+        options = {"top": 2, "report_path": self.report_path}
+        self.callback.get_option = lambda name: options[name]
+
+    def test_stats_are_ranked_and_reported(self):
+        self.callback.v2_runner_on_ok(
+            make_result("create", "vm-1", {"api_stats": make_stats(2, 1.0, 10.0, "POST v1/instances")})
+        )
+        self.callback.v2_runner_on_ok(
+            make_result(
+                "attach",
+                "vm-2",
+                {
+                    "results": [
+                        {"api_stats": make_stats(5, 2.0, 1.0, "GET v1/volumes")},
+                        {"api_stats": make_stats(5, 2.0, 1.0, "GET v1/volumes")},
+                    ]
+                },
+            )
+        )
+        self.callback.v2_runner_on_ok(make_result("debug", "vm-1", {"msg": "no api calls"}))
+
+        self.callback.v2_playbook_on_stats(MagicMock())
+
+        with open(self.report_path) as report_file:
+            report = json.load(report_file)
+        self.assertEqual(report["totals"]["requests"], 12)
+        self.assertEqual([task["name"] for task in report["slowest_tasks"]], ["create", "attach"])
+        self.assertEqual([host["name"] for host in report["polling_hosts"]], ["vm-1", "vm-2"])
+        self.assertEqual(
+            report["busiest_endpoints"][0], dict(report["endpoints"]["GET v1/volumes"], name="GET v1/volumes")
+        )
+        self.assertEqual(report["endpoints"]["GET v1/volumes"]["requests"], 10)
+        self.callback._display.banner.assert_called_once_with("GCORE API PROFILE")
+
+    def test_nothing_is_printed_without_stats(self):
+        self.callback.v2_playbook_on_stats(MagicMock())
+
+        self.callback._display.banner.assert_not_called()
+        self.assertFalse(os.path.exists(self.report_path))
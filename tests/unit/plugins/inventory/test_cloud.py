@@ -0,0 +1,319 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from mock import MagicMock, patch
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:  # ansible-core < 2.19 trusts every template
+    trust_as_template = str
+
+from ansible_collections.gcore.cloud.plugins.inventory.cloud import InventoryModule
+from ansible_collections.gcore.cloud.plugins.module_utils import locking
+
+
+def make_plugin(**options) -> InventoryModule:
+    defaults = {
+        "page_size": 2,
+        "prefetch": False,
+        "status": [],
+        "os_type": "",
+    }
+    defaults.update(options)
+    plugin = InventoryModule()
+    plugin.get_option = lambda name: defaults.get(name)
+    plugin._scope = (1, 2)
+    return plugin
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self) -> None:
+        self.servers = [{"id": f"vm-{index}", "status": "ACTIVE"} for index in range(5)]
+
+    def request(self, path, query_params, page_cap=None, count=True):
+        limit = min(query_params["limit"], page_cap or query_params["limit"])
+        page = self.servers[query_params["offset"] : query_params["offset"] + limit]
+        return page, len(self.servers) if count else None
+
+    def test_instances_are_listed_page_by_page(self):
+        for prefetch in (False, True):
+            plugin = make_plugin(prefetch=prefetch)
+            plugin._request = MagicMock(side_effect=self.request)
+
+            servers = list(plugin._get_servers_list())
+
+            self.assertEqual(servers, self.servers)
+            self.assertEqual(
+                [call.args[1]["offset"] for call in plugin._request.call_args_list],
+                [0, 2, 4],
+            )
+
+    def test_short_pages_do_not_end_the_list(self):
+        # The API caps pages at one item, below the page_size of 2
+        for count in (True, False):
+            plugin = make_plugin()
+            plugin._request = MagicMock(
+                side_effect=lambda path, query_params: self.request(path, query_params, 1, count)
+            )
+
+            servers = list(plugin._get_servers_list())
+
+            self.assertEqual(servers, self.servers)
+            self.assertEqual(plugin._request.call_count, 5 if count else 6)
+
+    def test_instances_are_reduced_to_the_configured_fields(self):
+        self.servers = [
+            {
+                "instance_id": "vm-1",
+                "status": "ACTIVE",
+                "addresses": {},
+                "metadata": {"os_type": "linux"},
+                "volumes": [{"id": "vol-1"}],
+            }
+        ]
+        plugin = make_plugin(instance_fields=["status"], os_type="linux")
+        plugin._request = MagicMock(side_effect=self.request)
+
+        servers = list(plugin._get_servers_list())
+
+        self.assertEqual(
+            servers,
+            [{"instance_id": "vm-1", "status": "ACTIVE", "addresses": {}, "metadata": {"os_type": "linux"}}],
+        )
+
+
+class TestEnrichment(unittest.TestCase):
+    def test_hosts_are_joined_to_bulk_lists(self):
+        lists = {
+            "v1/volumes": [{"id": "vol-1", "attachments": [{"server_id": "vm-1", "device": "/dev/vda"}]}],
+            "v1/securitygroups": [{"id": "sg-1", "name": "default"}],
+            "v1/lbpools": [
+                {"id": "pool-1", "members": [{"address": "10.0.0.5", "subnet_id": "sn-1", "protocol_port": 80}]},
+                {"id": "pool-2", "members": [{"address": "10.0.0.5", "subnet_id": "sn-2", "protocol_port": 80}]},
+                {"id": "pool-3", "members": [{"address": "10.0.0.5", "protocol_port": 80}]},
+            ],
+            "v1/flavors": [{"flavor_id": "g1-standard-1-2", "vcpus": 1}],
+        }
+        plugin = make_plugin(enrich=["volumes", "security_groups", "lb_pools", "flavor"], page_size=100)
+        plugin._request = MagicMock(side_effect=lambda path, query_params: (lists[path], len(lists[path])))
+        server = {
+            "instance_id": "vm-1",
+            "security_groups": [{"name": "default"}],
+            "addresses": {"private": [{"addr": "10.0.0.5", "subnet_id": "sn-1"}]},
+            "flavor": {"flavor_id": "g1-standard-1-2"},
+        }
+
+        variables = plugin._get_enrichment_vars(server, plugin._get_enrichments())
+
+        self.assertEqual(variables["gcore_volumes"][0]["id"], "vol-1")
+        self.assertEqual(variables["gcore_security_groups"][0]["id"], "sg-1")
+        self.assertEqual([pool["id"] for pool in variables["gcore_lb_pools"]], ["pool-1"])
+        self.assertEqual(variables["gcore_flavor"]["vcpus"], 1)
+        self.assertEqual(plugin._request.call_count, 4)
+
+    def test_disabled_enrichments_make_no_requests(self):
+        plugin = make_plugin(enrich=[])
+        plugin._request = MagicMock()
+
+        self.assertEqual(plugin._get_enrichment_vars({"instance_id": "vm-1"}, plugin._get_enrichments()), {})
+        plugin._request.assert_not_called()
+
+
+class TestAddressSelection(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = {
+            "addresses": {
+                "private": [{"addr": "10.0.0.5", "type": "fixed"}, {"addr": "fd00::5", "type": "fixed"}],
+                "internal": [{"addr": "192.168.0.5", "type": "fixed"}],
+                "ext": [{"addr": "2a03::5", "type": "fixed"}, {"addr": "92.38.157.5", "type": "fixed"}],
+            }
+        }
+        self.networks = [{"name": "private"}, {"name": "internal"}, {"name": "ext", "external": True}]
+
+    def select(self, **options):
+        plugin = make_plugin(enrich=[], page_size=100, **options)
+        plugin._request = MagicMock(return_value=(self.networks, len(self.networks)))
+        select_address = plugin._get_address_selector(plugin._get_enrichments().get("networks", {}))
+        return select_address(self.server)
+
+    def test_first_address_is_used_by_default(self):
+        self.assertEqual(self.select(), "10.0.0.5")
+
+    def test_addresses_are_ranked_by_kind_network_and_version(self):
+        self.assertEqual(self.select(address_preference=["public", "private"]), "2a03::5")
+        self.assertEqual(self.select(address_preference=["public"], address_ip_version=4), "92.38.157.5")
+        self.assertEqual(self.select(address_preference=["private"], address_networks=["internal"]), "192.168.0.5")
+        self.assertEqual(self.select(address_preference=["private"], address_ip_version=6), "fd00::5")
+
+    def test_floating_address_is_preferred(self):
+        self.assertIsNone(self.select(address_preference=["floating"]))
+
+        self.server["addresses"]["private"].append({"addr": "92.38.157.6", "type": "floating"})
+
+        self.assertEqual(self.select(address_preference=["floating", "private"]), "92.38.157.6")
+
+
+class TestExpressions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.servers = [
+            {
+                "instance_id": f"vm-{index}",
+                "instance_name": f"server-{index}",
+                "status": "ACTIVE" if index % 2 else "SHUTOFF",
+                "metadata": {"os_type": "linux", "is_windows": False},
+                "addresses": {"private": [{"addr": f"10.0.0.{index % 250}"}]},
+            }
+            for index in range(10000)
+        ]
+
+    def populate(self, templar, **options) -> InventoryModule:
+        defaults = {
+            "inventory_hostname": "uuid",
+            "group": "gcore",
+            "strict": False,
+            "compose": {},
+            "groups": {},
+            "keyed_groups": [],
+            "enrich": [],
+            "leading_separator": True,
+        }
+        plugin = make_plugin(**dict(defaults, **options))
+        plugin.inventory = InventoryData()
+        plugin.templar = templar
+        plugin._populate(self.servers, {})
+        return plugin
+
+    def test_lookups_bypass_templating_for_10k_hosts(self):
+        templar = MagicMock()
+        templar.template.return_value = None
+        started = time.perf_counter()
+        plugin = self.populate(
+            templar,
+            compose={"os_type": "metadata.os_type"},
+            groups={"windows": "metadata['is_windows']"},
+            keyed_groups=[{"key": "status", "prefix": "status"}],
+        )
+        elapsed = time.perf_counter() - started
+
+        templar.evaluate_expression.assert_not_called()
+        templar.evaluate_conditional.assert_not_called()
+        self.assertEqual(plugin.inventory.get_host("vm-1").vars["os_type"], "linux")
+        self.assertEqual(len(plugin.inventory.groups["status_ACTIVE"].hosts), 5000)
+        self.assertNotIn("windows", plugin.inventory.groups)
+        self.assertLess(elapsed, 60)
+
+    def test_other_expressions_are_templated(self):
+        self.servers = self.servers[:2]
+        plugin = self.populate(
+            Templar(loader=DataLoader()),
+            strict=True,
+            compose={"name": trust_as_template("instance_name | upper")},
+            groups={"active": trust_as_template("status == 'ACTIVE'")},
+            keyed_groups=[{"key": "name", "prefix": "name"}],
+        )
+
+        self.assertEqual(plugin.inventory.get_host("vm-1").vars["name"], "SERVER-1")
+        self.assertEqual([host.name for host in plugin.inventory.groups["active"].hosts], ["vm-1"])
+        self.assertIn("name_SERVER_0", plugin.inventory.groups)
+
+    def test_missing_key_is_undefined(self):
+        self.servers = self.servers[:1]
+        with self.assertRaises(AnsibleParserError):
+            self.populate(MagicMock(), strict=True, keyed_groups=[{"key": "metadata.missing"}])
+
+
+def patch_state_dir(test: unittest.TestCase) -> None:
+    patcher = patch.object(locking, "STATE_DIR", tempfile.mkdtemp())
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
+class FileCache(dict):
+    """Cache that persists its entries, so that a detached process can be observed"""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        locking.write_state(self.path, dict(self))
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self) -> None:
+        patch_state_dir(self)
+        self.plugin = make_plugin(cache_refresh_after=300)
+        self.plugin._cache = {}
+        self.plugin._fetch_snapshot = MagicMock(return_value={"timestamp": time.time(), "servers": []})
+        self.plugin._refresh_in_background = MagicMock()
+
+    def test_fresh_snapshot_is_served_from_the_cache(self):
+        self.plugin._cache["key"] = {"timestamp": time.time() - 10, "servers": [{"instance_id": "vm-1"}]}
+
+        snapshot = self.plugin._get_snapshot("key", read_cache=True)
+
+        self.assertEqual(snapshot["servers"], [{"instance_id": "vm-1"}])
+        self.plugin._fetch_snapshot.assert_not_called()
+        self.plugin._refresh_in_background.assert_not_called()
+
+    def test_stale_snapshot_is_served_while_refreshed_in_background(self):
+        self.plugin._cache["key"] = {"timestamp": time.time() - 600, "servers": [{"instance_id": "vm-1"}]}
+
+        snapshot = self.plugin._get_snapshot("key", read_cache=True)
+
+        self.assertEqual(snapshot["servers"], [{"instance_id": "vm-1"}])
+        self.plugin._fetch_snapshot.assert_not_called()
+        self.plugin._refresh_in_background.assert_called_once_with("key")
+
+    def test_missing_or_flushed_snapshot_is_fetched(self):
+        self.plugin._cache["key"] = {"timestamp": time.time() - 600, "servers": [{"instance_id": "vm-1"}]}
+
+        snapshot = self.plugin._get_snapshot("key", read_cache=False)
+
+        self.assertEqual(snapshot["servers"], [])
+        self.assertIs(self.plugin._cache["key"], snapshot)
+        self.plugin._refresh_in_background.assert_not_called()
+
+
+class TestBackgroundRefresh(unittest.TestCase):
+    def setUp(self) -> None:
+        patch_state_dir(self)
+        self.cache_path = locking.get_state_path("cache")
+        self.plugin = make_plugin(cache_refresh_after=300)
+        self.plugin._cache = FileCache(self.cache_path)
+        self.plugin.set_cache_plugin = MagicMock()
+        self.plugin.display = MagicMock()
+
+    def wait_for(self, path: str) -> None:
+        deadline = time.time() + 10
+        while not os.path.exists(path):
+            if time.time() > deadline:
+                self.fail(f"{path} was not written by the refresher")
+            time.sleep(0.05)
+
+    def test_cache_is_refreshed_by_a_detached_process(self):
+        self.plugin._fetch_snapshot = MagicMock(return_value={"timestamp": 1, "servers": [{"instance_id": "vm-1"}]})
+
+        self.plugin._refresh_in_background("key")
+
+        self.wait_for(self.cache_path)
+        with open(self.cache_path) as cache_file:
+            self.assertEqual(json.load(cache_file)["key"]["servers"], [{"instance_id": "vm-1"}])
+
+    def test_failed_refresh_is_reported_by_the_next_runs(self):
+        self.plugin._fetch_snapshot = MagicMock(side_effect=AnsibleParserError("Cannot parse the JSON from response."))
+
+        self.plugin._refresh_in_background("key")
+
+        self.wait_for(locking.get_state_path("inventory_key_refresh_error"))
+        self.plugin._cache = {"key": {"timestamp": time.time(), "servers": []}}
+        self.plugin._get_snapshot("key", read_cache=True)
+        self.assertIn("Cannot parse the JSON", self.plugin.display.warning.call_args.args[0])
@@ -0,0 +1,123 @@
+import json
+import os
+import stat
+import tempfile
+import unittest
+
+from ansible.errors import AnsibleLookupError
+from mock import MagicMock, patch
+
+from ansible_collections.gcore.cloud.plugins.lookup import resource
+from ansible_collections.gcore.cloud.plugins.lookup.resource import LookupModule
+from ansible_collections.gcore.cloud.plugins.module_utils import locking
+
+
+def make_lookup(lists: dict) -> LookupModule:
+    defaults = {
+        "api_host": "https://api.test.com",
+        "api_timeout": 30,
+        "details": False,
+        "errors": "strict",
+        "cache": False,
+        "cache_timeout": 300,
+    }
+    options = {}
+    lookup = LookupModule()
+    lookup.set_options = lambda var_options=None, direct=None: options.update(defaults, **direct)
+    lookup.get_option = lambda name: options.get(name)
+    lookup._request = MagicMock(side_effect=lambda path, query_params: get_page(lists[path], query_params))
+    return lookup
+
+
+def get_page(items: list, query_params: dict, page_cap: int = 2) -> dict:
+    # The API caps pages at I(page_cap) items, whatever the requested limit
+    offset = query_params["offset"]
+    return {"count": len(items), "results": items[offset : offset + min(query_params["limit"], page_cap)]}
+
+
+class TestResourceLookup(unittest.TestCase):
+    def setUp(self) -> None:
+        resource._INDEXES.clear()
+        resource._SCOPES.clear()
+        self.lists = {
+            "v1/projects": [{"id": 1, "name": "prod"}],
+            "v1/regions": [{"id": 2, "display_name": "Luxembourg"}],
+            "v1/networks/1/2": [
+                {"id": "net-1", "name": "prod-net", "external": False},
+                {"id": "net-2", "name": "dup"},
+                {"id": "net-4", "name": "last"},
+            ],
+            "v1/flavors/1/2": [{"flavor_id": "g1-standard-1-2", "flavor_name": "g1-standard-1-2", "vcpus": 1}],
+        }
+        self.options = dict(api_key="key", project_name="prod", region_name="Luxembourg")
+
+    def test_names_are_resolved_from_one_list_request_per_type(self):
+        lookup = make_lookup(self.lists)
+
+        self.assertEqual(lookup.run(["prod-net"], resource="network", **self.options), ["net-1"])
+        flavors = lookup.run(["g1-standard-1-2"], resource="flavor", details=True, **self.options)
+        self.assertEqual(flavors[0]["vcpus"], 1)
+
+        self.assertEqual(
+            [(call.args[0], call.args[1]["offset"]) for call in lookup._request.call_args_list],
+            [
+                ("v1/projects", 0),
+                ("v1/regions", 0),
+                ("v1/networks/1/2", 0),
+                ("v1/networks/1/2", 2),
+                ("v1/flavors/1/2", 0),
+            ],
+        )
+
+    def test_resources_past_the_first_page_are_found(self):
+        lookup = make_lookup(self.lists)
+
+        self.assertEqual(lookup.run(["last"], resource="network", **self.options), ["net-4"])
+
+    def test_index_is_shared_by_the_lookups_of_the_process(self):
+        make_lookup(self.lists).run(["prod-net"], resource="network", **self.options)
+        lookup = make_lookup(self.lists)
+
+        self.assertEqual(lookup.run(["dup"], resource="network", **self.options), ["net-2"])
+        lookup._request.assert_not_called()
+
+    def test_project_names_are_resolved_per_api_key(self):
+        make_lookup(self.lists).run(["prod-net"], resource="network", **self.options)
+        lookup = make_lookup(self.lists)
+
+        lookup.run(["prod-net"], resource="network", **dict(self.options, api_key="other-key"))
+
+        self.assertEqual([call.args[0] for call in lookup._request.call_args_list[:2]], ["v1/projects", "v1/regions"])
+
+    def test_missing_or_ambiguous_names(self):
+        self.lists["v1/networks/1/2"].append({"id": "net-3", "name": "dup"})
+        lookup = make_lookup(self.lists)
+
+        with self.assertRaises(AnsibleLookupError):
+            lookup.run(["dup"], resource="network", **self.options)
+        self.assertEqual(lookup.run(["missing"], resource="network", errors="ignore", **self.options), [None])
+
+    def test_index_is_shared_through_the_cache_file(self):
+        options = dict(resource="network", cache=True, project_id=1, region_id=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(locking, "STATE_DIR", tmp):
+                first = make_lookup(self.lists)
+                first.run(["prod-net"], api_key="key", **options)
+                resource._INDEXES.clear()
+                second = make_lookup(self.lists)
+                result = second.run(["prod-net"], api_key="key", **options)
+                resource._INDEXES.clear()
+                other_key = make_lookup(self.lists)
+                other_key.run(["prod-net"], api_key="other-key", **options)
+
+                cache_files = [name for name in os.listdir(tmp) if name.endswith(".json")]
+                modes = {stat.S_IMODE(os.stat(os.path.join(tmp, name)).st_mode) for name in cache_files}
+                with open(os.path.join(tmp, cache_files[0])) as cache_file:
+                    cached = json.load(cache_file)["index"]
+
+        self.assertEqual(result, ["net-1"])
+        second._request.assert_not_called()
+        other_key._request.assert_called()
+        self.assertEqual(len(cache_files), 2)
+        self.assertEqual(modes, {0o600})
+        self.assertEqual(cached["prod-net"], [{"id": "net-1", "name": "prod-net"}])
@@ -1,13 +1,28 @@
+import io
+import json
 import unittest
+from typing import Optional
 
-from mock import MagicMock
+from mock import MagicMock, patch
 
 from ansible_collections.gcore.cloud.plugins.module_utils.api import CloudAPIClient
 
+# Module params shared by the client tests
+API_PARAMS = {
+    "api_key": "test_api_key",
+    "api_timeout": 60,
+    "project_id": 100,
+    "region_id": 10,
+    "api_host": "https://api.test.com",
+}
 
-def mock_module(params: dict):
+
+def mock_module(params: Optional[dict] = None):
+    """Module with the API params, overridden or extended by I(params), that fails by raising SystemExit"""
     module = MagicMock()
-    module.params = params
+    module.params = {**API_PARAMS, **(params or {})}
+    module.check_mode = False
+    module.fail_json.side_effect = SystemExit
     return module
 
 
@@ -32,3 +47,92 @@ class TestApiClient(unittest.TestCase):
         self.assertEqual(self.api_client.project_id, self.project_id)
         self.assertEqual(self.api_client.region_id, self.region_id)
         self.assertEqual(self.api_client.api_host, f"{self.api_host}/")
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.api.fetch_url")
+    def test_pages_follow_the_count_whatever_their_size(self, fetch_url):
+        self.module.from_json.side_effect = json.loads
+        pages = iter([[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]])
+        fetch_url.side_effect = lambda **kwargs: (
+            io.BytesIO(json.dumps({"count": 5, "results": next(pages)}).encode()),
+            {"status": 200},
+        )
+
+        items = self.api_client.get_all("v1/volumes/")
+
+        self.assertEqual([item["id"] for item in items], [1, 2, 3, 4, 5])
+        self.assertEqual(fetch_url.call_count, 3)
+        self.assertIn("limit=1000&offset=2", fetch_url.call_args_list[1].kwargs["url"])
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.api.fetch_url")
+    def test_failed_project_lookup_reports_the_api_error(self, fetch_url):
+        self.module.params.update(project_id=None, project_name="prod")
+        fetch_url.return_value = (
+            None,
+            {"status": 403, "url": "https://api.test.com/v1/projects", "body": '{"message": "Forbidden"}'},
+        )
+
+        with self.assertRaises(SystemExit):
+            CloudAPIClient(self.module)
+
+        self.module.fail_json.assert_called_once_with(
+            msg="Failed to perfom operation", url="https://api.test.com/v1/projects", message_error="Forbidden"
+        )
+
+
+class TestApiProfile(unittest.TestCase):
+    def setUp(self) -> None:
+        params = {
+            "api_key": "test_api_key",
+            "api_timeout": 60,
+            "project_id": 100,
+            "region_id": 10,
+            "api_host": "https://api.test.com/cloud",
+            "api_profile": True,
+        }
+        self.module = mock_module(params)
+        self.exit_json = self.module.exit_json
+        self.module.from_json.side_effect = lambda text: text
+        self.api_client = CloudAPIClient(self.module)
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.api.fetch_url")
+    def test_requests_are_counted_by_endpoint(self, fetch_url):
+        # The body read is counted, whatever the Content-Length header says
+        fetch_url.side_effect = lambda **kwargs: (io.BytesIO(b'{"id": 1}'), {"status": 200, "content-length": "0"})
+
+        self.api_client.get("v1/volumes/", path_params="3fa85f64-5717-4562-b3fc-2c963f66afa6")
+        self.api_client.get("v1/volumes/", path_params="0e4c3d3f-5717-4562-b3fc-2c963f66afa6")
+        self.api_client.record_poll(2)
+        self.module.exit_json(changed=True)
+
+        api_stats = self.exit_json.call_args.kwargs["api_stats"]
+        self.assertEqual(api_stats["requests"], 2)
+        self.assertEqual(api_stats["bytes_received"], 18)
+        self.assertEqual(api_stats["poll_time"], 2)
+        self.assertEqual(list(api_stats["endpoints"]), ["GET v1/volumes/{id}"])
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.api.fetch_url")
+    def test_clients_of_one_module_share_the_stats(self, fetch_url):
+        fetch_url.side_effect = lambda **kwargs: (io.BytesIO(b'{"id": 1}'), {"status": 200})
+        other_client = CloudAPIClient(self.module)
+
+        self.api_client.get("v1/volumes/")
+        other_client.get("v1/networks/")
+        self.module.exit_json(changed=True)
+
+        self.assertEqual(self.exit_json.call_args.kwargs["api_stats"]["requests"], 2)
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.api.fetch_url")
+    def test_project_and_region_lookups_are_counted(self, fetch_url):
+        self.module.params.update(project_id=None, project_name="prod", region_id=None, region_name="Luxembourg")
+        self.module.from_json.side_effect = json.loads
+        fetch_url.side_effect = lambda *args, **kwargs: (
+            io.BytesIO(json.dumps({"results": [{"id": 1, "name": "prod", "display_name": "Luxembourg"}]}).encode()),
+            {"status": 200},
+        )
+
+        CloudAPIClient(self.module)
+        self.module.exit_json(changed=True)
+
+        self.assertEqual(
+            list(self.exit_json.call_args.kwargs["api_stats"]["endpoints"]), ["GET v1/projects", "GET v1/regions"]
+        )
@@ -0,0 +1,225 @@
+import unittest
+
+from mock import MagicMock, patch
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
+    CloudVolumeClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestReconcile(unittest.TestCase):
+    def setUp(self) -> None:
+        params = {
+            "volume_id": None,
+            "name": "data",
+            "size": 10,
+            "source": "new-volume",
+            "type_name": "standard",
+        }
+        self.module = mock_module(params)
+        self.client = CloudVolumeClient(self.module, "v1/volumes/")
+        self.client.api_client = MagicMock()
+
+    def test_converged_resource_makes_no_writes(self):
+        self.client.api_client.get_all.return_value = [{"id": "vol-1", "name": "data", "size": 10}]
+
+        result = self.client.reconcile(state="present")
+
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["data"]["id"], "vol-1")
+        self.client.api_client.get_all.assert_called_once_with("v1/volumes/", query_params={"name_part": "data"})
+        self.client.api_client.post.assert_not_called()
+        self.client.api_client.patch.assert_not_called()
+
+    def test_only_differing_fields_are_written(self):
+        self.client.api_client.get_all.return_value = [{"id": "vol-1", "name": "data", "size": 5}]
+        self.client.api_client.post.return_value = {"tasks": ["task-1"]}
+        self.client._wait_from_task = MagicMock(return_value={"data": {"volume_id": "vol-1"}})
+
+        result = self.client.reconcile(state="present")
+
+        self.assertTrue(result["changed"])
+        self.client.api_client.patch.assert_not_called()
+        kwargs = self.client.api_client.post.call_args.kwargs
+        self.assertEqual(kwargs["path_params"], "vol-1/extend")
+        self.assertEqual(kwargs["data"], {"size": 10})
+
+    def test_absent_resource_is_not_deleted_again(self):
+        self.client.api_client.get_all.return_value = []
+
+        result = self.client.reconcile(state="absent")
+
+        self.assertFalse(result["changed"])
+        self.client.api_client.delete.assert_not_called()
+
+    def test_check_mode_reports_change_without_writing(self):
+        self.module.check_mode = True
+        self.client.api_client.get_all.return_value = []
+
+        result = self.client.reconcile(state="present")
+
+        self.assertTrue(result["changed"])
+        self.client.api_client.post.assert_not_called()
+
+
+class TestExecuteMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module({"volume_id": None, "name": None})
+        self.client = CloudVolumeClient(self.module, "v1/volumes/")
+        self.client.api_client = MagicMock()
+
+    def test_failed_item_does_not_stop_the_others(self):
+        self.client.api_client.patch.side_effect = lambda **kwargs: {"id": kwargs["path_params"], **kwargs["data"]}
+        items = [
+            {"volume_id": "vol-1", "name": "first"},
+            {"volume_id": "vol-2"},
+            {"volume_id": "vol-3", "name": "third"},
+        ]
+
+        result = self.client.execute_many(items, command="update", max_concurrency=2)
+
+        self.assertTrue(result["changed"])
+        self.assertTrue(result["failed"])
+        self.assertEqual(result["results"][0]["data"], {"id": "vol-1", "name": "first"})
+        self.assertIn("name", result["results"][1]["msg"])
+        self.assertEqual(result["results"][2]["data"], {"id": "vol-3", "name": "third"})
+        self.module.fail_json.assert_not_called()
+
+    def test_created_resources_are_fetched_with_one_list_request(self):
+        self.module.params.update(source="new-volume", size=1)
+        task_ids = iter(["task-1", "task-2", "task-3"])
+        self.client.api_client.post.side_effect = lambda **kwargs: {"tasks": [next(task_ids)]}
+        self.client._wait_from_task = MagicMock(
+            side_effect=lambda task_id, **kwargs: {"created_resources": {"volumes": [f"vol-{task_id[-1]}"]}}
+        )
+        self.client.api_client.get_pages.return_value = [([{"id": f"vol-{index}"} for index in range(1, 10)], 9)]
+
+        result = self.client.execute_many([{"name": "a"}, {"name": "b"}, {"name": "c"}], command="create")
+
+        self.assertEqual(
+            sorted(item["data"]["id"] for item in result["results"]),
+            ["vol-1", "vol-2", "vol-3"],
+        )
+        self.client.api_client.get_pages.assert_called_once_with("v1/volumes/")
+        self.client.api_client.get.assert_not_called()
+
+    def test_failed_fetch_only_fails_its_item(self):
+        self.module.params.update(source="new-volume", size=1)
+        task_ids = iter(["task-1", "task-2"])
+        self.client.api_client.post.side_effect = lambda **kwargs: {"tasks": [next(task_ids)]}
+        self.client._wait_from_task = MagicMock(
+            side_effect=lambda task_id, **kwargs: {"created_resources": {"volumes": [f"vol-{task_id[-1]}"]}}
+        )
+        self.client.api_client.get_pages.return_value = [([{"id": "vol-1"}], 1)]
+        self.client.api_client.get.side_effect = CloudAPIError("Failed to perfom operation", status=404)
+
+        result = self.client.execute_many([{"name": "a"}, {"name": "b"}], command="create")
+
+        results = {(item.get("data") or {}).get("id", "failed"): item for item in result["results"]}
+        self.assertEqual(sorted(results), ["failed", "vol-1"])
+        self.assertTrue(results["failed"]["changed"])
+        self.assertEqual(results["failed"]["msg"], "Failed to perfom operation")
+        self.assertTrue(result["failed"])
+
+
+class TestGetMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudVolumeClient(mock_module(), "v1/volumes/")
+        self.client.api_client = MagicMock()
+        self.client.get_by_id = MagicMock(side_effect=lambda resource_id, **kwargs: {"id": resource_id})
+
+    def test_pages_are_listed_while_cheaper_than_fetching_by_id(self):
+        pages = [([{"id": f"vol-{index}"} for index in range(offset, offset + 10)], 1000) for offset in (0, 10)]
+        self.client.api_client.get_pages.return_value = iter(pages)
+
+        resources = self.client.get_many(["vol-1", "vol-2", "vol-500"])
+
+        self.assertEqual(sorted(resources), ["vol-1", "vol-2", "vol-500"])
+        self.client.get_by_id.assert_called_once_with(resource_id="vol-500", allow_not_found=False)
+
+
+class TestWaitForTasks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudVolumeClient(mock_module(), "v1/volumes/")
+        self.client.api_client = MagicMock()
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.clients.base.sleep")
+    def test_pending_tasks_are_polled_in_the_same_round(self, sleep):
+        states = {"task-1": ["RUNNING", "FINISHED"], "task-2": ["ERROR"]}
+
+        def get(url, **kwargs):
+            task_id = url.rsplit("/", 1)[-1]
+            return {"id": task_id, "state": states[task_id].pop(0)}
+
+        self.client.api_client.get.side_effect = get
+
+        tasks = self.client.wait_for_tasks(["task-1", "task-2"])
+
+        self.assertEqual([task["state"] for task in tasks], ["FINISHED", "ERROR"])
+        self.assertEqual(self.client.api_client.get.call_count, 3)
+        sleep.assert_called_once()
+
+    def test_wait_false_returns_task_ids(self):
+        self.client.module.params.update(name="data", size=1, source="new-volume", wait=False)
+        self.client.api_client.post.return_value = {"tasks": ["task-1"]}
+
+        result = self.client.execute_command(command="create")
+
+        self.assertEqual(result, {"changed": True, "data": {"tasks": ["task-1"]}})
+        self.client.api_client.get.assert_not_called()
+
+
+class TestWaitFor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudVolumeClient(mock_module(), "v1/volumes/")
+        self.client.api_client = MagicMock()
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.clients.base.sleep")
+    def test_pending_resources_are_listed_once_per_round(self, sleep):
+        rounds = iter(
+            [
+                [{"id": "vol-1", "status": "creating"}, {"id": "vol-2", "status": "available"}],
+                [{"id": "vol-1", "status": "available"}],
+            ]
+        )
+        self.client.api_client.get_pages.side_effect = lambda url, **kwargs: [(next(rounds), None)]
+        self.client.get_by_id = MagicMock(return_value={"id": "vol-1", "status": "available"})
+
+        resources = self.client.wait_for(["vol-1", "vol-2"], ["available"])
+
+        self.assertEqual([resource["id"] for resource in resources], ["vol-1", "vol-2"])
+        self.client.api_client.get_pages.assert_called_once_with("v1/volumes/")
+        self.client.get_by_id.assert_called_once_with(resource_id="vol-1", allow_not_found=True)
+        sleep.assert_called_once_with(1)
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.clients.base.sleep")
+    def test_failed_status_stops_waiting(self, sleep):
+        self.client.api_client.get.return_value = {"id": "vol-1", "status": "error"}
+
+        with self.assertRaises(SystemExit):
+            self.client.wait_for(["vol-1"], ["available"])
+
+        self.assertIn("error", self.client.module.fail_json.call_args.kwargs["msg"])
+        sleep.assert_not_called()
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.clients.base.sleep")
+    def test_statuses_match_whatever_their_case(self, sleep):
+        self.client.api_client.get.return_value = {"id": "vol-1", "status": "available"}
+
+        resources = self.client.wait_for(["vol-1"], ["AVAILABLE"])
+
+        self.assertEqual(resources, [{"id": "vol-1", "status": "available"}])
+        sleep.assert_not_called()
+
+    def test_deleted_resource_reaches_deleted_status(self):
+        self.client.api_client.get.return_value = None
+
+        resources = self.client.wait_for(["vol-1"], ["DELETED"])
+
+        self.assertEqual(resources, [None])
@@ -0,0 +1,155 @@
+import threading
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.batch import (
+    BatchRunner,
+    resolve_references,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.instance import (
+    CloudInstanceClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_listener import (
+    CloudLbListenerClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.network import (
+    CloudNetworkClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.subnet import (
+    CloudSubnetClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.concurrency import (
+    run_graph,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    CloudAPIError,
+    ValidationError,
+)
+
+
+class TestRunGraph(unittest.TestCase):
+    def test_independent_nodes_run_together_and_failures_skip_dependents(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fail():
+            raise CloudAPIError("boom")
+
+        results = run_graph(
+            {
+                "a": ([], barrier.wait),
+                "b": ([], barrier.wait),
+                "c": (["a", "b"], lambda: "c"),
+                "d": ([], fail),
+                "e": (["d"], lambda: "e"),
+                "f": (["e"], lambda: "f"),
+            }
+        )
+
+        self.assertEqual(results["c"], ("c", None))
+        self.assertEqual(results["d"][1].message, "boom")
+        self.assertIn("d failed", str(results["e"][1]))
+        self.assertIn("e failed", str(results["f"][1]))
+
+    def test_cycles_are_rejected(self):
+        with self.assertRaises(ValueError):
+            run_graph({"a": (["b"], str), "b": (["a"], str)})
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = MagicMock()
+        self.api.networks._run_operation.side_effect = lambda operation: {
+            "changed": True,
+            "data": {"id": "net-1", "subnets": [{"id": "sn-0"}]},
+        }
+        self.api.subnets._run_operation.side_effect = lambda operation: {
+            "changed": True,
+            "data": {"id": "subnet-1", **operation[2]},
+        }
+        del self.api.networks._get_loadbalancer_id
+        del self.api.subnets._get_loadbalancer_id
+        del self.api.instances._get_loadbalancer_id
+        self.api.get_item_spec = AnsibleCloudClient.get_item_spec
+        self.api.get_wait_spec = AnsibleCloudClient.get_wait_spec
+        self.api.module.no_log_values = set()
+        self.api.networks.get_module_spec = CloudNetworkClient.get_module_spec
+        self.api.subnets.get_module_spec = CloudSubnetClient.get_module_spec
+        self.api.instances.get_module_spec = CloudInstanceClient.get_module_spec
+        self.api.loadbalancer_listeners.get_module_spec = CloudLbListenerClient.get_module_spec
+
+    def test_references_are_resolved_in_dependency_order(self):
+        result = BatchRunner(self.api).run(
+            [
+                {
+                    "name": "subnet",
+                    "resource": "subnets",
+                    "command": "create",
+                    "params": {"network_id": "{{ ops.net.id }}", "name": "sub-{{ ops.net.subnets[0].id }}"},
+                },
+                {"name": "net", "resource": "networks", "command": "create", "params": {"name": "net"}},
+            ]
+        )
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["results"]["subnet"]["data"]["network_id"], "net-1")
+        self.assertEqual(result["results"]["subnet"]["data"]["name"], "sub-sn-0")
+        self.assertEqual(list(result["results"]), ["subnet", "net"])
+
+    def test_invalid_operations_are_rejected(self):
+        runner = BatchRunner(self.api)
+        for operations in (
+            [{"name": "a", "resource": "networks", "command": "create", "params": {"id": "{{ ops.b.id }}"}}],
+            [{"name": "a", "resource": "networks", "params": {}}],
+            [
+                {"name": "a", "resource": "networks", "state": "present", "depends_on": ["b"]},
+                {"name": "b", "resource": "networks", "state": "present", "depends_on": ["a"]},
+            ],
+        ):
+            with self.assertRaises(ValidationError):
+                runner.run(operations)
+
+    def test_params_are_validated_against_the_module_options(self):
+        self.api.instances._run_operation.return_value = {"changed": True, "data": {"id": "vm-1"}}
+
+        result = BatchRunner(self.api).run(
+            [
+                {
+                    "name": "vm",
+                    "resource": "instances",
+                    "command": "create",
+                    "params": {"names": ["vm"], "password": "s3cret", "wait": "no"},
+                },
+                {"name": "net", "resource": "networks", "command": "create", "params": {"nmae": "net"}},
+                {"name": "alloc", "resource": "subnets", "command": "create", "params": {"cidr_allocate": {}}},
+            ]
+        )
+
+        _, _, params = self.api.instances._run_operation.call_args.args[0]
+        self.assertEqual(params, {"names": ["vm"], "password": "s3cret", "wait": False})
+        self.assertIn("s3cret", self.api.module.no_log_values)
+        self.assertIn("nmae", result["results"]["net"]["msg"])
+        self.assertIn("cidr_allocate", result["results"]["alloc"]["msg"])
+        self.api.networks._run_operation.assert_not_called()
+        self.api.subnets._run_operation.assert_not_called()
+
+    def test_missing_reference_fails_the_operation(self):
+        with self.assertRaises(ValidationError):
+            resolve_references("{{ ops.net.missing }}", {"net": {"id": "net-1"}})
+
+    def test_loadbalancer_writes_wait_for_it(self):
+        self.api.loadbalancer_listeners._get_loadbalancer_id.return_value = "lb-1"
+        self.api.loadbalancer_listeners._run_operation.return_value = {"changed": True, "data": {"id": "ls-1"}}
+
+        result = BatchRunner(self.api).run(
+            [
+                {"name": "http", "resource": "loadbalancer_listeners", "command": "create", "params": {}},
+                {"name": "https", "resource": "loadbalancer_listeners", "command": "create", "params": {}},
+            ]
+        )
+
+        self.assertFalse(result.get("failed"))
+        self.assertEqual(self.api.loadbalancers._wait_for.call_count, 2)
@@ -0,0 +1,39 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cidr import CidrIndex
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.subnet import (
+    CloudSubnetClient,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestCidrIndex(unittest.TestCase):
+    def test_first_free_block_is_allocated(self):
+        index = CidrIndex("10.0.0.0/16", ["10.0.0.0/24", "10.0.1.0/25", "10.0.3.0/24", "192.168.0.0/24"])
+
+        self.assertEqual(index.allocate(24), "10.0.2.0/24")
+        self.assertEqual(index.allocate(24), "10.0.4.0/24")
+        self.assertEqual(index.allocate(25), "10.0.1.128/25")
+        self.assertEqual(index.allocate(23), "10.0.6.0/23")
+
+    def test_full_supernet_is_reported(self):
+        index = CidrIndex("10.0.0.0/23", ["10.0.0.0/24", "10.0.1.0/24"])
+
+        with self.assertRaises(ValueError):
+            index.allocate(24)
+
+
+class TestAllocateCidrs(unittest.TestCase):
+    def test_subnets_of_every_page_are_avoided(self):
+        client = CloudSubnetClient(mock_module(), "v1/subnets/")
+        client.api_client = MagicMock()
+        client.api_client.get_all.return_value = [{"cidr": "10.0.0.0/24"}, {"cidr": "10.0.1.0/24"}]
+
+        cidrs = client.allocate_cidrs("10.0.0.0/16", 24, count=2, network_id="net-1")
+
+        self.assertEqual(cidrs, ["10.0.2.0/24", "10.0.3.0/24"])
+        client.api_client.get_all.assert_called_once_with("v1/subnets/", query_params={"network_id": "net-1"})
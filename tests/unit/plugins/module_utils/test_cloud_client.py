@@ -0,0 +1,61 @@
+import unittest
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.cloud import (
+    AnsibleCloudClient,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestResolveCreatedResources(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = AnsibleCloudClient(mock_module())
+        self.api.client = MagicMock()
+
+    def test_resources_of_a_type_are_fetched_with_one_list(self):
+        self.api.client.get_pages.return_value = [([{"id": "vol-2", "name": "two"}, {"id": "vol-1", "name": "one"}], 2)]
+        tasks = [
+            {"state": "FINISHED", "created_resources": {"volumes": ["vol-1"]}},
+            {"state": "FINISHED", "created_resources": {"volumes": ["vol-2"], "unknown": ["x"]}},
+            {"state": "ERROR", "created_resources": {"volumes": ["vol-3"]}},
+        ]
+
+        created = self.api.resolve_created_resources(tasks)
+
+        self.assertEqual([volume["name"] for volume in created["volumes"]], ["one", "two"])
+        self.api.client.get_pages.assert_called_once_with("v1/volumes/")
+        self.api.client.get.assert_not_called()
+
+
+class TestBulkSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spec = AnsibleCloudClient.get_api_spec()
+        self.spec.update(
+            command=dict(type="str", choices=["create", "delete"]),
+            password=dict(type="str", no_log=True),
+            size=dict(type="int", default=10),
+            name=dict(type="str", required=True),
+        )
+        self.spec.update(AnsibleCloudClient.get_bulk_spec(self.spec))
+
+    def validate(self, items: list):
+        return ArgumentSpecValidator(self.spec).validate({"api_key": "key", "name": "vm", "items": items})
+
+    def test_items_are_coerced_and_masked_like_module_options(self):
+        result = self.validate([{"password": "secret", "size": "20"}])
+
+        self.assertEqual(result.error_messages, [])
+        self.assertEqual(result.validated_parameters["items"][0]["size"], 20)
+        # Options left out of an item are not defaulted, the module-level value applies
+        self.assertIsNone(result.validated_parameters["items"][0]["name"])
+        self.assertIn("secret", result._no_log_values)
+
+    def test_unknown_options_and_choices_are_rejected(self):
+        result = self.validate([{"pasword": "secret", "command": "stop"}])
+
+        self.assertEqual(len(result.error_messages), 2)
+        self.assertNotIn("api_key", self.spec["items"]["options"])
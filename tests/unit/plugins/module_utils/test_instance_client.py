@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+from time import time
+
+from mock import MagicMock, patch
+
+from ansible_collections.gcore.cloud.plugins.module_utils import locking
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.instance import (
+    CloudInstanceClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    get_state_path,
+    locked_state,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestCreateInWaves(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module(
+            {
+                "flavor": "g1-standard-1-2",
+                "volumes": [{"source": "image", "image_id": "image-1", "size": 10}],
+                "interfaces": [{"type": "external"}],
+                "wait": True,
+            }
+        )
+        self.client = CloudInstanceClient(self.module, "v1/instances/")
+        self.client.api_client = MagicMock()
+        self.ledger_path = os.path.join(tempfile.mkdtemp(), "ledger.json")
+        self.items = [{"names": [f"vm-{index}"]} for index in range(5)]
+        self.started = []
+        self.client.execute_many = MagicMock(side_effect=self.execute_many)
+
+    def execute_many(self, items, **kwargs):
+        self.started.append(len(items))
+        return {"changed": True, "results": [{"changed": True, "data": item} for item in items]}
+
+    def test_batch_that_fits_is_checked_once(self):
+        self.client.api_client.post.return_value = {}
+
+        result = self.client.create_in_waves(self.items, self.ledger_path)
+
+        self.assertFalse(result.get("failed"))
+        self.assertEqual(self.started, [5])
+        self.client.api_client.post.assert_called_once()
+        self.assertEqual(len(self.client.api_client.post.call_args.kwargs["data"]["names"]), 5)
+
+    def test_batch_is_split_into_waves_that_fit(self):
+        # Room for 3 instances, then for 1 more once the first wave is done
+        limits = iter([3, 1, 0])
+        quota = {"limit": next(limits)}
+        self.client.api_client.post.side_effect = lambda **kwargs: (
+            {} if len(kwargs["data"]["names"]) <= quota["limit"] else {"cpu_count_requested": 1}
+        )
+        self.client.execute_many.side_effect = lambda items, **kwargs: (
+            quota.update(limit=next(limits)) or self.execute_many(items)
+        )
+
+        result = self.client.create_in_waves(self.items, self.ledger_path)
+
+        self.assertEqual(self.started, [3, 1])
+        self.assertTrue(result["failed"])
+        self.assertEqual(result["results"][4]["msg"], "Quota exceeded")
+
+    def test_creates_of_another_shape_in_flight_are_waited_for(self):
+        self.client.api_client.post.return_value = {}
+        with open(self.ledger_path, "w") as ledger_file:
+            json.dump({"other": {"shape": "other-flavor", "count": 2, "expires": time() + 60}}, ledger_file)
+
+        def sleep(seconds):
+            with locked_state(self.ledger_path) as ledger:
+                ledger.pop("other")
+
+        self.client._sleep = MagicMock(side_effect=sleep)
+
+        self.client.create_in_waves(self.items, self.ledger_path)
+
+        self.client._sleep.assert_called_once()
+        self.assertEqual(self.started, [5])
+        self.assertEqual(len(self.client.api_client.post.call_args.kwargs["data"]["names"]), 5)
+        with open(self.ledger_path) as ledger_file:
+            self.assertEqual(json.load(ledger_file), {})
+
+
+class TestLedgerPath(unittest.TestCase):
+    @patch.object(locking, "STATE_DIR", tempfile.mkdtemp())
+    def test_ledger_is_scoped_per_project_and_region(self):
+        params = mock_module().params
+
+        self.assertNotEqual(
+            get_state_path("instance_admission", params),
+            get_state_path("instance_admission", {**params, "region_id": params["region_id"] + 1}),
+        )
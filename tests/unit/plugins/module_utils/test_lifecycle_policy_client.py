@@ -0,0 +1,76 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.lifecycle_policy import (
+    CloudLifecyclePolicyClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestSyncPolicyVolumes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudLifecyclePolicyClient(mock_module(), "v1/lifecycle_policy/")
+        self.client.api_client = MagicMock()
+        self.client.api_client.get.return_value = {
+            "id": 1,
+            "volumes": [{"volume_id": "vol-1"}, {"volume_id": "vol-2"}],
+        }
+
+    def test_only_the_difference_is_sent_in_chunks(self):
+        self.client.api_client.put.return_value = {"id": 1}
+
+        result = self.client.sync_volumes(1, ["vol-1", "vol-3", "vol-4", "vol-5"], chunk_size=2)
+
+        self.assertTrue(result["changed"])
+        sent = [
+            (call.kwargs["path_params"], call.kwargs["data"]["volume_ids"])
+            for call in self.client.api_client.put.call_args_list
+        ]
+        self.assertEqual(
+            sent,
+            [
+                ("1/add_volumes_to_policy", ["vol-3", "vol-4"]),
+                ("1/add_volumes_to_policy", ["vol-5"]),
+                ("1/remove_volumes_from_policy", ["vol-2"]),
+            ],
+        )
+
+    def test_converged_policy_makes_no_writes(self):
+        result = self.client.sync_volumes(1, ["vol-2", "vol-1"])
+
+        self.assertFalse(result["changed"])
+        self.client.api_client.put.assert_not_called()
+
+
+class TestSelectVolumes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudLifecyclePolicyClient(mock_module(), "v1/lifecycle_policy/")
+        self.client.api_client = MagicMock()
+
+    def test_every_page_of_matching_volumes_is_selected(self):
+        self.client.api_client.get_all.return_value = [{"id": "vol-1"}, {"id": "vol-2"}]
+
+        volume_ids = self.client._select_volumes({"metadata_kv": '{"backup": "true"}'})
+
+        self.assertEqual(volume_ids, ["vol-1", "vol-2"])
+        self.client.api_client.get_all.assert_called_once_with(
+            "v1/volumes/", query_params={"metadata_kv": '{"backup": "true"}'}
+        )
+
+    def test_unknown_filters_are_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.client._select_volumes({"metadata": "backup"})
+        self.client.api_client.get_all.assert_not_called()
+
+    def test_selector_is_rejected_outside_state_present(self):
+        selector = {"metadata_kv": '{"backup": "true"}'}
+        for state, command in ((None, "update"), ("absent", None)):
+            with self.assertRaises(ValidationError):
+                self.client._run_operation((state, command, {"lifecycle_policy_id": 1, "volume_selector": selector}))
+        self.client.api_client.get_all.assert_not_called()
@@ -0,0 +1,116 @@
+import unittest
+
+from mock import MagicMock, patch
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.loadbalancer_member import (
+    CloudLbPoolMemberClient,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestSyncMembers(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module({"wait": True})
+        self.client = CloudLbPoolMemberClient(self.module, "v1/lbpools/")
+        self.client.api_client = MagicMock()
+        self.pool = {
+            "id": "pool-1",
+            "lb_algorithm": "ROUND_ROBIN",
+            "loadbalancers": [{"id": "lb-1"}],
+            "members": [
+                {
+                    "id": "member-1",
+                    "address": "10.0.0.1",
+                    "protocol_port": 80,
+                    "weight": 1,
+                    "operating_status": "ONLINE",
+                },
+                {"id": "member-2", "address": "10.0.0.2", "protocol_port": 80, "weight": 1},
+            ],
+        }
+
+    def test_converged_pool_makes_no_writes(self):
+        self.client.api_client.get.return_value = self.pool
+
+        wanted = {
+            "address": "10.0.0.1",
+            "protocol_port": 80,
+            "instance_id": "vm-1",
+            "subnet_id": "sn-1",
+            "monitor_port": 8080,
+        }
+        result = self.client.sync("pool-1", [wanted, self.pool["members"][1]])
+
+        self.assertFalse(result["changed"])
+        self.client.api_client.patch.assert_not_called()
+
+    @patch("ansible_collections.gcore.cloud.plugins.module_utils.clients.base.sleep")
+    def test_changes_are_pushed_with_one_pool_update(self, sleep):
+        self.client.api_client.get.side_effect = [self.pool, {"id": "lb-1", "provisioning_status": "ACTIVE"}]
+        members = [
+            {"address": "10.0.0.1", "protocol_port": 80, "weight": 5},
+            {"address": "10.0.0.3", "protocol_port": 80},
+        ]
+
+        result = self.client.sync("pool-1", members)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["removed"], ["member-2"])
+        kwargs = self.client.api_client.patch.call_args.kwargs
+        self.assertEqual(kwargs["path_params"], "pool-1")
+        self.assertEqual(
+            kwargs["data"]["members"],
+            [
+                {"id": "member-1", "address": "10.0.0.1", "protocol_port": 80, "weight": 5},
+                {"address": "10.0.0.3", "protocol_port": 80},
+            ],
+        )
+        self.assertEqual(self.client.api_client.get.call_args.kwargs["path_params"], "lb-1")
+        sleep.assert_not_called()
+
+
+class TestLoadbalancerQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module()
+        self.client = CloudLbPoolMemberClient(self.module, "v1/lbpools/")
+        self.client.api_client = MagicMock()
+
+    def test_writes_to_the_same_loadbalancer_are_serialized(self):
+        pools = {"pool-1": "lb-1", "pool-2": "lb-1", "pool-3": "lb-2"}
+        calls = []
+
+        def get(url, path_params=None, **kwargs):
+            if url == "v1/lbpools/":
+                return {"id": path_params, "loadbalancers": [{"id": pools[path_params]}]}
+            calls.append(("wait", path_params))
+            return {"id": path_params, "provisioning_status": "ACTIVE"}
+
+        self.client.api_client.get.side_effect = get
+        self.client._execute_command = MagicMock(
+            side_effect=lambda command, params: calls.append(("write", params["loadbalancer_pool_id"]))
+            or {"changed": True, "data": None}
+        )
+        items = [{"loadbalancer_pool_id": pool_id} for pool_id in pools]
+
+        result = self.client.execute_many(items, command="delete")
+
+        self.assertEqual(len(result["results"]), 3)
+        lb_1 = [call for call in calls if call in (("wait", "lb-1"), ("write", "pool-1"), ("write", "pool-2"))]
+        self.assertEqual(lb_1, [("wait", "lb-1"), ("write", "pool-1"), ("wait", "lb-1"), ("write", "pool-2")])
+        self.assertIn(("wait", "lb-2"), calls)
+
+    def test_loadbalancer_is_resolved_once_per_pool(self):
+        self.client.api_client.get.side_effect = lambda url, path_params=None, **kwargs: (
+            {"id": path_params, "loadbalancers": [{"id": "lb-1"}]}
+            if url == "v1/lbpools/"
+            else {"id": path_params, "provisioning_status": "ACTIVE"}
+        )
+        self.client._execute_command = MagicMock(return_value={"changed": True, "data": None})
+        items = [{"loadbalancer_pool_id": "pool-1", "loadbalancer_member_id": f"member-{index}"} for index in range(3)]
+
+        self.client.execute_many(items, command="delete")
+
+        pool_reads = [call for call in self.client.api_client.get.call_args_list if call.args[0] == "v1/lbpools/"]
+        self.assertEqual(len(pool_reads), 1)
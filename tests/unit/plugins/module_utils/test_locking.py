@@ -0,0 +1,48 @@
+import json
+import os
+import stat
+import tempfile
+import unittest
+
+from mock import patch
+
+from ansible_collections.gcore.cloud.plugins.module_utils import locking
+
+
+class TestLockedState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.object(locking, "STATE_DIR", os.path.join(self.tmp.name, "gcore_cloud"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_state_is_private_to_the_user(self):
+        path = locking.get_state_path("stack_app")
+
+        with locking.locked_state(path) as state:
+            state["resources"] = {"net": "net-1"}
+
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode), 0o700)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        self.assertEqual(sorted(os.listdir(os.path.dirname(path))), ["stack_app.json", "stack_app.json.lock"])
+
+    def test_state_is_written_back_when_the_block_raises(self):
+        path = locking.get_state_path("ledger")
+
+        with self.assertRaises(RuntimeError):
+            with locking.locked_state(path) as state:
+                state["leases"] = {"fip-1": 1}
+                raise RuntimeError("create failed")
+
+        with open(path) as state_file:
+            self.assertEqual(json.load(state_file), {"leases": {"fip-1": 1}})
+
+    def test_state_path_is_sanitized_and_scoped(self):
+        params = {"api_host": "https://api.test.com", "project_id": 1, "region_id": 2}
+
+        path = locking.get_state_path("stack_../../etc/passwd", params)
+
+        self.assertEqual(os.path.dirname(path), locking.get_state_dir())
+        self.assertTrue(os.path.basename(path).startswith("stack_.._.._etc_passwd_"))
+        self.assertNotEqual(path, locking.get_state_path("stack_../../etc/passwd", dict(params, region_id=3)))
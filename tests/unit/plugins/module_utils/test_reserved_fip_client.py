@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.reserved_fip import (
+    CloudReservedFipClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.locking import (
+    try_file_lock,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestLeaseFromPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module()
+        self.client = CloudReservedFipClient(self.module, "v1/reserved_fixed_ips/")
+        self.client.api_client = MagicMock(project_id=100, region_id=10)
+        self.client.api_client.get_all.return_value = [
+            {"port_id": f"port-{index}", "network_id": "net-1"} for index in range(3)
+        ] + [{"port_id": "port-other", "network_id": "net-2"}]
+        self.client.api_client.get.return_value = {"id": "task-1", "state": "RUNNING"}
+        self.client.api_client.post.return_value = {"tasks": ["task-1"]}
+        self.state_path = os.path.join(tempfile.mkdtemp(), "pool.json")
+
+    def test_leases_are_not_handed_out_twice(self):
+        first = self.client.lease_from_pool(self.state_path, size=0, count=2, network_id="net-1")
+        second = self.client.lease_from_pool(self.state_path, size=0, count=1, network_id="net-1")
+
+        self.assertEqual([fip["port_id"] for fip in first["data"]], ["port-0", "port-1"])
+        self.assertEqual([fip["port_id"] for fip in second["data"]], ["port-2"])
+        self.assertTrue(first["changed"])
+        self.client.api_client.post.assert_not_called()
+
+    def test_check_mode_records_no_leases(self):
+        self.module.check_mode = True
+        planned = self.client.lease_from_pool(self.state_path, size=0, count=2, network_id="net-1")
+        self.module.check_mode = False
+        leased = self.client.lease_from_pool(self.state_path, size=0, count=2, network_id="net-1")
+
+        self.assertTrue(planned["changed"])
+        self.assertEqual([fip["port_id"] for fip in leased["data"]], ["port-0", "port-1"])
+
+    def test_pool_is_topped_up_without_waiting(self):
+        result = self.client.lease_from_pool(self.state_path, size=4, count=1, network_id="net-1")
+
+        self.assertEqual(result["available"], 2)
+        self.assertEqual(self.client.api_client.post.call_count, 2)
+        self.assertEqual(
+            self.client.api_client.post.call_args.kwargs["data"], {"type": "any_subnet", "network_id": "net-1"}
+        )
+        self.assertEqual(result["pending_tasks"], ["task-1"])
+
+    def test_missing_leases_are_awaited_outside_the_lock(self):
+        self.client.api_client.get_all.return_value = []
+        created = {"id": "task-1", "state": "FINISHED", "created_resources": {"ports": ["port-new"]}}
+
+        def wait_for_tasks(task_ids, timeout):
+            with try_file_lock(self.state_path) as locked:
+                self.assertTrue(locked)
+            with open(self.state_path) as state_file:
+                self.assertEqual(list(json.load(state_file)["100/10/net-1"]["leasing"]), ["task-1"])
+            return [created]
+
+        self.client.wait_for_tasks = MagicMock(side_effect=wait_for_tasks)
+        self.client._get_many = MagicMock(return_value={"port-new": {"port_id": "port-new"}})
+
+        result = self.client.lease_from_pool(self.state_path, size=0, count=1, network_id="net-1")
+
+        self.assertEqual(result["data"], [{"port_id": "port-new"}])
+        with open(self.state_path) as state_file:
+            pool = json.load(state_file)["100/10/net-1"]
+        self.assertEqual(list(pool["leases"]), ["port-new"])
+        self.assertEqual(pool["leasing"], {})
@@ -0,0 +1,60 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.securitygroup_rule import (
+    CloudSecurityGroupRuleClient,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestSyncRules(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module()
+        self.client = CloudSecurityGroupRuleClient(self.module, "v1/securitygroups/")
+        self.client.api_client = MagicMock()
+        self.client.api_client.get.return_value = {
+            "id": "sg-1",
+            "security_group_rules": [
+                {"id": "rule-1", "direction": "egress", "ethertype": "IPv4", "protocol": None},
+                {
+                    "id": "rule-2",
+                    "direction": "ingress",
+                    "ethertype": "IPv4",
+                    "protocol": "tcp",
+                    "port_range_min": 22,
+                    "port_range_max": 22,
+                    "remote_ip_prefix": "10.0.0.0/8",
+                },
+            ],
+        }
+
+    def test_converged_group_costs_one_request(self):
+        rules = [
+            {"direction": "egress", "remote_ip_prefix": "0.0.0.0/0"},
+            {"direction": "ingress", "protocol": "tcp", "port_range_min": 22, "remote_ip_prefix": "10.1.2.3/8"},
+        ]
+
+        result = self.client.sync("sg-1", rules)
+
+        self.assertFalse(result["changed"])
+        self.client.api_client.get.assert_called_once()
+        self.client.api_client.post.assert_not_called()
+        self.client.api_client.delete.assert_not_called()
+
+    def test_only_differing_rules_are_written(self):
+        self.client.api_client.post.side_effect = lambda **kwargs: {"id": "rule-3", **kwargs["data"]}
+        rules = [
+            {"direction": "egress"},
+            {"direction": "ingress", "protocol": "tcp", "port_range_min": 443, "port_range_max": 443},
+        ]
+
+        result = self.client.sync("sg-1", rules)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["deleted"], ["rule-2"])
+        self.assertEqual([rule["id"] for rule in result["data"]["created"]], ["rule-3"])
+        self.assertEqual(self.client.api_client.post.call_args.kwargs["path_params"], "sg-1/rules")
+        self.client.api_client.delete.assert_called_once()
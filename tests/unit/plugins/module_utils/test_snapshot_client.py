@@ -0,0 +1,75 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.snapshot import (
+    CloudSnapshotClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.exceptions import (
+    ValidationError,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestCreateMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = mock_module()
+        self.client = CloudSnapshotClient(self.module, "v1/snapshots/")
+        self.client.api_client = MagicMock()
+
+    def test_snapshots_are_indexed_by_volume(self):
+        volumes = [{"id": "vol-1", "name": "data-1"}, {"id": "vol-2", "name": "data-2"}]
+        snapshots = [{"id": "snap-1", "volume_id": "vol-1"}, {"id": "snap-2", "volume_id": "vol-2"}]
+        self.client.api_client.get_all.return_value = volumes
+        self.client.api_client.get_pages.return_value = [(snapshots, 2)]
+        self.client.api_client.post.side_effect = lambda **kwargs: {"tasks": [f"task-{kwargs['data']['volume_id']}"]}
+        self.client.wait_for_tasks = MagicMock(
+            return_value=[
+                {"id": "task-vol-1", "state": "FINISHED", "created_resources": {"snapshots": ["snap-1"]}},
+                {"id": "task-vol-2", "state": "FINISHED", "created_resources": {"snapshots": ["snap-2"]}},
+            ]
+        )
+
+        result = self.client.create_many("backup", volume_filters={"metadata_kv": '{"backup": "true"}'})
+
+        self.assertEqual(
+            {volume_id: snapshot["id"] for volume_id, snapshot in result["data"].items()},
+            {"vol-1": "snap-1", "vol-2": "snap-2"},
+        )
+        self.client.api_client.get_all.assert_called_once_with(
+            "v1/volumes/", query_params={"metadata_kv": '{"backup": "true"}'}
+        )
+        self.client.api_client.get_pages.assert_called_once_with("v1/snapshots/")
+        self.client.wait_for_tasks.assert_called_once()
+
+    def test_unknown_or_empty_filters_are_rejected(self):
+        for volume_filters in ({"metdata_kv": '{"backup": "true"}'}, {}):
+            with self.assertRaises(ValidationError):
+                self.client._create_many("backup", None, volume_filters, 10)
+        self.client.api_client.get_all.assert_not_called()
+        self.client.api_client.post.assert_not_called()
+
+    def test_volume_ids_are_fetched_by_id_past_the_first_page(self):
+        self.client.api_client.get_pages.return_value = [([{"id": "vol-1", "name": "data-1"}], 2)]
+        self.client.api_client.get.return_value = {"id": "vol-2", "name": "data-2"}
+        self.client.api_client.post.side_effect = lambda **kwargs: {"tasks": [f"task-{kwargs['data']['volume_id']}"]}
+        self.client.wait_for_tasks = MagicMock(return_value=[])
+
+        self.client._create_many("backup", ["vol-2"], None, 10)
+
+        self.client.api_client.get.assert_called_once_with("v1/volumes/", path_params="vol-2", allow_not_found=True)
+        self.assertEqual(self.client.api_client.post.call_args.kwargs["data"]["name"], "backup-data-2")
+
+    def test_operations_with_volume_ids_create_many_with_their_own_params(self):
+        self.client.api_client.get.return_value = {"id": "vol-1", "name": "data-1"}
+        self.client.api_client.post.side_effect = lambda **kwargs: {"tasks": [f"task-{kwargs['data']['volume_id']}"]}
+        self.client.wait_for_tasks = MagicMock()
+
+        params = {"name": "backup", "volume_ids": ["vol-1"], "description": "nightly", "wait": False}
+        result = self.client._run_operation((None, "create", params))
+
+        self.assertEqual(self.client.api_client.post.call_args.kwargs["data"]["description"], "nightly")
+        self.assertEqual(result["data"], {"vol-1": {"tasks": ["task-vol-1"]}})
+        self.client.wait_for_tasks.assert_not_called()
@@ -0,0 +1,122 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.network import (
+    CloudNetworkClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.subnet import (
+    CloudSubnetClient,
+)
+from ansible_collections.gcore.cloud.plugins.module_utils.stack import (
+    StackRunner,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+RESOURCES = [
+    {"name": "subnet", "resource": "subnets", "params": {"name": "app-subnet", "network_id": "{{ ops.net.id }}"}},
+    {"name": "net", "resource": "networks", "params": {"name": "app-net"}},
+    {
+        "name": "db_subnet",
+        "resource": "subnets",
+        "params": {"name": "db-subnet", "network_id": "{{ ops.db_net.id }}", "enable_dhcp": False},
+    },
+    {"name": "db_net", "resource": "networks", "params": {"name": "db-net"}},
+]
+
+
+class TestStackRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        module = mock_module()
+        self.calls = []
+        self.current = {
+            "v1/networks/": [{"id": "net-1", "name": "app-net"}, {"id": "net-old", "name": "old-net"}],
+            "v1/subnets/": [
+                {"id": "subnet-1", "name": "app-subnet", "network_id": "net-1"},
+                {"id": "subnet-2", "name": "app-subnet", "network_id": "net-other"},
+            ],
+        }
+        self.api = MagicMock()
+        self.api.networks = CloudNetworkClient(module, "v1/networks/")
+        self.api.subnets = CloudSubnetClient(module, "v1/subnets/")
+        for client in (self.api.networks, self.api.subnets):
+            client.api_client = MagicMock()
+            client.api_client.get_all.side_effect = lambda url, **kwargs: self.current[url]
+            client._execute_command = self._make_execute(client)
+
+    def _make_execute(self, client):
+        def execute(command, params):
+            self.calls.append((client.RESOURCE, command.value, params))
+            if command.value == "create":
+                return {"changed": True, "data": {"id": f"{params['name']}-id", **params}}
+            return {"changed": True, "data": None}
+
+        return execute
+
+    def test_plan_matches_resources_with_one_list_per_type(self):
+        recorded = {"old": {"resource": "networks", "id": "net-old", "name": "old-net"}}
+        plan = StackRunner(self.api).plan("present", RESOURCES, recorded)
+
+        self.assertEqual(
+            {name: (item["action"], item["id"]) for name, item in plan.items()},
+            {
+                "net": ("none", "net-1"),
+                "subnet": ("none", "subnet-1"),
+                "db_net": ("create", None),
+                "db_subnet": ("create", None),
+                "old": ("delete", "net-old"),
+            },
+        )
+        self.assertEqual(plan["db_subnet"]["depends_on"], ["db_net"])
+        self.assertEqual(self.api.networks.api_client.get_all.call_count, 1)
+        self.assertEqual(self.api.subnets.api_client.get_all.call_count, 1)
+        self.assertEqual(self.calls, [])
+
+    def test_apply_creates_in_dependency_order_then_deletes_removed_resources(self):
+        runner = StackRunner(self.api)
+        recorded = {"old": {"resource": "networks", "id": "net-old", "name": "old-net", "depends_on": []}}
+        plan = runner.plan("present", RESOURCES, recorded)
+
+        result = runner.apply(plan, RESOURCES)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            self.calls,
+            [
+                ("network", "create", {"name": "db-net"}),
+                ("subnet", "create", {"name": "db-subnet", "network_id": "db-net-id", "enable_dhcp": False}),
+                ("network", "delete", {"network_id": "net-old"}),
+            ],
+        )
+        self.assertFalse(result["results"]["net"]["changed"])
+        records = runner.get_records(plan, result, recorded)
+        self.assertEqual(
+            records["db_subnet"],
+            {"resource": "subnets", "id": "db-subnet-id", "name": "db-subnet", "depends_on": ["db_net"]},
+        )
+        self.assertEqual(records["net"]["id"], "net-1")
+        self.assertNotIn("old", records)
+
+    def test_recorded_resource_renamed_since_is_not_deleted(self):
+        self.current["v1/networks/"][1]["name"] = "someone-elses-net"
+        recorded = {"old": {"resource": "networks", "id": "net-old", "name": "old-net"}}
+
+        plan = StackRunner(self.api).plan("present", RESOURCES, recorded)
+
+        self.assertEqual((plan["old"]["action"], plan["old"]["id"]), ("none", None))
+
+    def test_destroy_deletes_dependents_first(self):
+        runner = StackRunner(self.api)
+        plan = runner.plan("absent", RESOURCES)
+
+        result = runner.apply(plan, RESOURCES)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            self.calls,
+            [("subnet", "delete", {"subnet_id": "subnet-1"}), ("network", "delete", {"network_id": "net-1"})],
+        )
+        self.assertEqual(plan["db_net"]["action"], "none")
+        self.assertEqual(runner.get_records(plan, result), {})
@@ -0,0 +1,34 @@
+import unittest
+
+from ansible_collections.gcore.cloud.plugins.module_utils.topology import (
+    build_topology,
+)
+
+
+class TestBuildTopology(unittest.TestCase):
+    def test_resources_are_linked_by_id(self):
+        resources = {
+            "networks": [{"id": "net-1", "name": "private", "mtu": 1450}],
+            "subnets": [{"id": "sub-1", "network_id": "net-1", "cidr": "10.0.0.0/24", "name": "a"}],
+            "routers": [{"id": "router-1", "interfaces": [{"subnet_id": "sub-1", "network_id": "net-1"}]}],
+            "reserved_fips": [{"port_id": "port-1", "network_id": "net-1", "subnet_id": "sub-1"}],
+            "instances": [{"id": "vm-1", "addresses": {"private": [{"addr": "10.0.0.5"}]}}],
+        }
+
+        graph = build_topology(resources, {"networks": ["name"]})
+
+        self.assertEqual(
+            graph["networks"]["net-1"],
+            {
+                "id": "net-1",
+                "name": "private",
+                "subnets": ["sub-1"],
+                "routers": ["router-1"],
+                "ports": ["port-1"],
+                "instances": ["vm-1"],
+            },
+        )
+        self.assertEqual(graph["subnets"]["sub-1"]["instances"], ["vm-1"])
+        self.assertEqual(graph["routers"]["router-1"]["subnets"], ["sub-1"])
+        self.assertEqual(graph["instances"]["vm-1"]["networks"], ["net-1"])
+        self.assertNotIn("securitygroups", graph)
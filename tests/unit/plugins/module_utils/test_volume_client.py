@@ -0,0 +1,49 @@
+import unittest
+
+from mock import MagicMock
+
+from ansible_collections.gcore.cloud.plugins.module_utils.clients.volume import (
+    CloudVolumeClient,
+)
+from ansible_collections.gcore.cloud.tests.unit.plugins.module_utils.test_api_client import (
+    mock_module,
+)
+
+
+class TestAttachMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = CloudVolumeClient(mock_module({"wait": True}), "v1/volumes/")
+        self.client.api_client = MagicMock()
+
+    def test_volumes_are_attached_with_one_task_wait(self):
+        attached = [{"id": "vol-1", "attachments": [{"server_id": "vm-1", "device": "/dev/vdb"}]}]
+        self.client.api_client.get.side_effect = [
+            attached,
+            attached + [{"id": "vol-2", "attachments": [{"server_id": "vm-1", "device": "/dev/vdc"}]}],
+        ]
+        self.client.api_client.post.return_value = {"tasks": ["task-2"]}
+        self.client.wait_for_tasks = MagicMock(return_value=[{"id": "task-2", "state": "FINISHED"}])
+
+        result = self.client.attach_many("attach", ["vol-1", "vol-2"], "vm-1")
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["data"]["vol-2"]["device"], "/dev/vdc")
+        self.assertEqual(self.client.api_client.post.call_args.kwargs["path_params"], "vol-2/attach")
+        self.client.wait_for_tasks.assert_called_once()
+
+    def test_repeated_volumes_are_sent_once(self):
+        self.client.api_client.get.return_value = []
+        self.client.api_client.post.return_value = {"tasks": ["task-2"]}
+        self.client.wait_for_tasks = MagicMock(return_value=[{"id": "task-2", "state": "FINISHED"}])
+
+        self.client.attach_many("attach", ["vol-2", "vol-2"], "vm-1")
+
+        self.assertEqual(self.client.api_client.post.call_count, 1)
+
+    def test_other_commands_are_rejected(self):
+        with self.assertRaises(SystemExit):
+            self.client.attach_many("delete", ["vol-1"], "vm-1")
+
+        self.assertIn("attach or detach", self.client.module.fail_json.call_args.kwargs["msg"])
+        self.client.api_client.get.assert_not_called()
+        self.client.api_client.delete.assert_not_called()